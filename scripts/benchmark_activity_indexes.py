@@ -0,0 +1,206 @@
+"""Benchmark the activity tag filters with and without the GIN indexes.
+
+Seeds a synthetic activity catalog, runs the repository filter queries under
+EXPLAIN ANALYZE with the GIN indexes absent and then present, and prints the
+plans and timings as JSON. Index changes happen inside rolled-back
+transactions, so the schema is left as it was. The seeded rows are deleted
+afterwards unless --keep is given.
+
+Usage:
+    python -m scripts.benchmark_activity_indexes --activities 200000
+"""
+
+import argparse
+import json
+import statistics
+import sys
+from typing import Callable, Dict, List
+
+from sqlalchemy import delete, text
+from sqlalchemy.orm import Session
+
+from scripts.query_plans import capture_queries, explain, indexes_used, plan_nodes
+from svc.app.dal.activity_repository import ActivityRepository
+from svc.app.database import SessionLocal
+from svc.app.datatypes.enums import ActivityType, Cost, Season, Theme
+from svc.app.models.activity import GIN_INDEXED_ARRAY_COLUMNS, Activity
+from svc.app.models.user import User
+
+BENCH_EMAIL_DOMAIN = "gin-bench.invalid"
+
+# Chance that any one enum value is present in a seeded activity's array
+TAG_PROBABILITY = 0.15
+
+
+def tag_array_sql(column: str) -> str:
+    """SQL for a random subset of a column's enum values, drawn per row."""
+    enum_name = Activity.__table__.c[column].type.item_type.name
+    # Referencing g keeps the subquery correlated so it is re-evaluated per row
+    return (
+        f"ARRAY(SELECT e FROM unnest(enum_range(NULL::{enum_name})) AS e "
+        f"WHERE random() < {TAG_PROBABILITY} + 0 * g)"
+    )
+
+
+SEED_SQL = text(
+    f"""
+    INSERT INTO activities (title, done, user_id, {", ".join(GIN_INDEXED_ARRAY_COLUMNS)})
+    SELECT
+        'Benchmark activity ' || g,
+        false,
+        (CAST(:user_ids AS integer[]))[1 + g % cardinality(CAST(:user_ids AS integer[]))],
+        {", ".join(tag_array_sql(column) for column in GIN_INDEXED_ARRAY_COLUMNS)}
+    FROM generate_series(1, :activities) AS g
+    """
+)
+
+
+def remove_seeded_data(db: Session) -> None:
+    # Activities cascade from their owning user
+    db.execute(delete(User).where(User.email.like(f"%@{BENCH_EMAIL_DOMAIN}")))
+    db.commit()
+
+
+def seed_catalog(db: Session, activities: int, families: int, seed: float) -> List[int]:
+    """Insert benchmark families and a synthetic catalog spread across them."""
+    users = [
+        User(email=f"family-{i}@{BENCH_EMAIL_DOMAIN}", is_active=True)
+        for i in range(families)
+    ]
+    db.add_all(users)
+    db.flush()
+    user_ids = [user.id for user in users]
+
+    db.execute(text("SELECT setseed(:seed)"), {"seed": seed})
+    db.execute(SEED_SQL, {"user_ids": user_ids, "activities": activities})
+    db.commit()
+
+    db.execute(text("ANALYZE activities"))
+    db.commit()
+    return user_ids
+
+
+def set_gin_indexes(db: Session, present: bool) -> None:
+    """Create or drop the GIN indexes inside the session's open transaction."""
+    connection = db.connection()
+    existing = set(
+        connection.execute(
+            text("SELECT indexname FROM pg_indexes WHERE tablename = 'activities'")
+        ).scalars()
+    )
+    for index in Activity.__table__.indexes:
+        if not index.name.endswith("_gin"):
+            continue
+        if present and index.name not in existing:
+            index.create(bind=connection)
+        elif not present and index.name in existing:
+            index.drop(bind=connection)
+
+
+def explain_runs(db: Session, statement: str, parameters, repeat: int) -> Dict:
+    runs = [explain(db, statement, parameters, analyze=True) for _ in range(repeat)]
+    last = runs[-1]
+    return {
+        "execution_ms": statistics.median(run["Execution Time"] for run in runs),
+        "planning_ms": statistics.median(run["Planning Time"] for run in runs),
+        "rows": last["Plan"].get("Actual Rows"),
+        "node_types": sorted({node["Node Type"] for node in plan_nodes(last["Plan"])}),
+        "indexes_used": indexes_used(last["Plan"]),
+        "plan": last["Plan"],
+    }
+
+
+def benchmark_cases(repo: ActivityRepository, parent_id: int) -> Dict[str, Callable]:
+    return {
+        "catalog_by_theme": lambda: repo.get_filtered_activities(
+            themes=[list(Theme)[0]]
+        ),
+        "catalog_by_theme_type_cost": lambda: repo.get_filtered_activities(
+            themes=[list(Theme)[0]],
+            activity_types=[list(ActivityType)[0]],
+            cost_ranges=[Cost.FREE],
+        ),
+        "family_by_cost_and_season": lambda: repo.filter_activities(
+            parent_id=parent_id, cost=[Cost.FREE], seasons=[list(Season)[0]]
+        ),
+    }
+
+
+def run(args: argparse.Namespace) -> Dict:
+    db = SessionLocal()
+    # Everything, including the repository reads, must hit the primary
+    db.info["pin_primary"] = True
+    try:
+        remove_seeded_data(db)
+        user_ids = seed_catalog(db, args.activities, args.families, args.seed)
+        repo = ActivityRepository(db)
+
+        results = []
+        for name, call in benchmark_cases(repo, user_ids[0]).items():
+            statement, parameters = capture_queries(db, call)[-1]
+            db.rollback()
+
+            scenarios = {}
+            for label, present in (("without_gin", False), ("with_gin", True)):
+                set_gin_indexes(db, present)
+                scenarios[label] = explain_runs(db, statement, parameters, args.repeat)
+                db.rollback()
+
+            results.append(
+                {
+                    "name": name,
+                    "sql": statement,
+                    **scenarios,
+                    "speedup": round(
+                        scenarios["without_gin"]["execution_ms"]
+                        / max(scenarios["with_gin"]["execution_ms"], 0.001),
+                        2,
+                    ),
+                }
+            )
+
+        return {
+            "activities": args.activities,
+            "families": args.families,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "cases": results,
+        }
+    finally:
+        db.rollback()
+        if not args.keep:
+            remove_seeded_data(db)
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--activities", type=int, default=200_000)
+    parser.add_argument("--families", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=float, default=0.42)
+    parser.add_argument("--output", help="Write JSON here instead of stdout")
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the seeded catalog afterwards"
+    )
+    args = parser.parse_args()
+
+    report = run(args)
+    for case in report["cases"]:
+        print(
+            f"{case['name']}: {case['without_gin']['execution_ms']:.1f}ms -> "
+            f"{case['with_gin']['execution_ms']:.1f}ms "
+            f"({case['speedup']}x, {', '.join(case['with_gin']['indexes_used']) or 'no index'})",
+            file=sys.stderr,
+        )
+
+    output = json.dumps(report, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
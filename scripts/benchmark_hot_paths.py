@@ -0,0 +1,396 @@
+"""Micro-benchmarks for the planner and analytics pure-Python hot paths.
+
+Times each case on synthetic inputs at several sizes and prints the results
+as JSON. Pass a previous run as --baseline to compare: any case whose median
+time per call grew by more than --threshold is reported, and the script exits
+non-zero, so it can gate a deploy. Nothing touches the database.
+
+Usage:
+    python -m scripts.benchmark_hot_paths --output bench.json
+    python -m scripts.benchmark_hot_paths --baseline bench.json --threshold 0.2
+"""
+
+import argparse
+import json
+import logging
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import timeit
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Sequence
+
+from svc.app.datatypes.enums import (
+    ActivityScale,
+    ActivityType,
+    AgeGroup,
+    CompletionStatus,
+    Cost,
+    DaysOfWeek,
+    Duration,
+    FilterEnum,
+    Frequency,
+    GroupActivityComfort,
+    Location,
+    NewExperienceOpenness,
+    Participants,
+    Season,
+    Theme,
+)
+from svc.app.datatypes.family_preference import FamilyProfile
+from svc.app.datatypes.user_behavior_analytic import (
+    PastActivityContext,
+    WeatherDay,
+    WeeklyContext,
+)
+from svc.app.helpers.activity_helpers import build_min_based_batches
+from svc.app.llm.schemas.tagging_schemas import TaggedActivity
+from svc.app.llm.utils.parsers import parse_response_to_json
+from svc.app.models.activity import Activity
+from svc.app.models.activity_suggestion import ActivitySuggestion
+from svc.app.services.activity_suggestion_service import HistoricalActivityAnalyzer
+from svc.app.services.behavior_analytics_service import BehaviorAnalyticsService
+from svc.app.services.enhanced_activity_planner_service import (
+    EnhancedActivityPlannerService,
+)
+from svc.app.utils.parsing import parse_content
+
+SEED = 1234
+TITLES = ["Park picnic", "Museum visit", "Zoo trip", "Library hour", "Bike ride"]
+STATUSES = [status.value for status in CompletionStatus]
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Callable[[int], Callable[[], object]]
+    sizes: Sequence[int]
+
+
+CASES: List[Case] = []
+
+
+def case(name: str, sizes: Sequence[int]):
+    """Register a benchmark: setup(size) builds the inputs and returns the call."""
+
+    def register(setup: Callable[[int], Callable[[], object]]):
+        CASES.append(Case(name, setup, sizes))
+        return setup
+
+    return register
+
+
+# ---------------------------
+# Synthetic inputs
+# ---------------------------
+def make_activities(rng: random.Random, count: int) -> List[Activity]:
+    return [
+        Activity(
+            id=i,
+            title=f"{rng.choice(TITLES)} {i}",
+            description="A synthetic activity for benchmarking",
+            costs=rng.sample(list(Cost), rng.randint(1, 2)),
+            durations=rng.sample(list(Duration), 1),
+            participants=rng.sample(list(Participants), rng.randint(1, 2)),
+            locations=rng.sample(list(Location), rng.randint(1, 2)),
+            seasons=rng.sample(list(Season), rng.randint(1, 2)),
+            age_groups=rng.sample(list(AgeGroup), rng.randint(1, 3)),
+            frequency=rng.sample(list(Frequency), 1),
+            themes=rng.sample(list(Theme), rng.randint(1, 3)),
+            activity_types=rng.sample(list(ActivityType), rng.randint(1, 2)),
+            activity_scale=rng.choice(list(ActivityScale)),
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def make_suggestions(rng: random.Random, count: int) -> List[ActivitySuggestion]:
+    # Roughly four suggestions per activity, spread over the last 16 weeks
+    activities = make_activities(rng, max(1, count // 4))
+    today = date.today()
+    return [
+        ActivitySuggestion(
+            activity_id=activity.id,
+            activity=activity,
+            suggested_date=today - timedelta(days=rng.randint(0, 16 * 7)),
+            completion_status=rng.choice(STATUSES),
+            weather_conditions={"suitable_for_outdoor": rng.random() < 0.8},
+        )
+        for activity in (rng.choice(activities) for _ in range(count))
+    ]
+
+
+def make_activity_dicts(rng: random.Random, count: int) -> List[dict]:
+    planner = EnhancedActivityPlannerService(None, None, None, None, None, None)
+    return [planner._activity_to_dict(a) for a in make_activities(rng, count)]
+
+
+def make_forecast(rng: random.Random, days: int) -> List[WeatherDay]:
+    start = date.today()
+    return [
+        WeatherDay(
+            date=start + timedelta(days=i),
+            condition=rng.choice(["Clear", "Rain", "Snow", "Cloudy", "Thunderstorm"]),
+            temperature_range=(rng.uniform(-5, 15), rng.uniform(15, 35)),
+            precipitation_mm=rng.choice([0.0, 0.5, 3.0, 12.0, 25.0]),
+        )
+        for i in range(days)
+    ]
+
+
+def make_ai_tagged(rng: random.Random) -> dict:
+    def ai_values(enum, low, high):
+        return [
+            member.ai_value for member in rng.sample(list(enum), rng.randint(low, high))
+        ]
+
+    themes = ai_values(Theme, 1, 3)
+    activity_types = ai_values(ActivityType, 1, 2)
+    return {
+        "title": f"{rng.choice(TITLES)} {rng.randint(1, 10_000)}",
+        "description": "Tagged by the model",
+        "price": rng.choice([None, 0.0, 12.5]),
+        "themes": themes,
+        "activity_types": activity_types,
+        "costs": ai_values(Cost, 1, 2),
+        "durations": ai_values(Duration, 1, 1),
+        "participants": ai_values(Participants, 1, 2),
+        "locations": ai_values(Location, 1, 2),
+        "seasons": ai_values(Season, 1, 2),
+        "age_groups": ai_values(AgeGroup, 1, 3),
+        "frequency": ai_values(Frequency, 1, 1),
+        "primary_type": activity_types[0],
+        "primary_theme": themes[0],
+        "activity_scale": rng.choice(list(ActivityScale)).ai_value,
+    }
+
+
+# ---------------------------
+# Cases
+# ---------------------------
+@case("build_min_based_batches", sizes=(100, 1_000, 5_000))
+def bench_min_based_batches(size: int):
+    activities = make_activities(random.Random(SEED), size)
+    return lambda: build_min_based_batches(activities, min_batch_size=50)
+
+
+@case("historical_analyzer.classify_with_inference", sizes=(50, 200, 1_000))
+def bench_classify_with_inference(size: int):
+    analyzer = HistoricalActivityAnalyzer(None, BehaviorAnalyticsService(None, None))
+    suggestions = make_suggestions(random.Random(SEED), size)
+    patterns = {"marks_big_only": True, "marking_rate": 0.1}
+    return lambda: analyzer._classify_recent_activities_with_smart_inference(
+        suggestions, patterns
+    )
+
+
+@case("historical_analyzer.infer_completion_status", sizes=(100, 1_000))
+def bench_infer_completion_status(size: int):
+    analyzer = HistoricalActivityAnalyzer(None, BehaviorAnalyticsService(None, None))
+    suggestions = make_suggestions(random.Random(SEED), size)
+    patterns = {"marks_big_only": True, "marking_rate": 0.1}
+    return lambda: [
+        analyzer._infer_completion_status(suggestion, patterns)
+        for suggestion in suggestions
+    ]
+
+
+@case("behavior_analytics.success_rates", sizes=(100, 1_000, 10_000))
+def bench_success_rates(size: int):
+    service = BehaviorAnalyticsService(None, None)
+    suggestions = make_suggestions(random.Random(SEED), size)
+
+    def run():
+        service._calculate_theme_success_rates(suggestions)
+        service._calculate_activity_type_success_rates(suggestions)
+        service._calculate_cost_success_rates(suggestions)
+
+    return run
+
+
+@case("planner._build_user_prompt", sizes=(10, 50, 200))
+def bench_build_user_prompt(size: int):
+    rng = random.Random(SEED)
+    planner = EnhancedActivityPlannerService(None, None, None, None, None, None)
+    profile = FamilyProfile(
+        family_size=4,
+        adults_count=2,
+        kids=[{"age": 6}, {"age": 9}],
+        address="Austin, TX",
+        max_activities_per_week=5,
+        preferred_cost_ranges=["free", "low"],
+        available_days=[DaysOfWeek.SATURDAY, DaysOfWeek.SUNDAY],
+        preferred_themes=[Theme.NATURE, Theme.CREATIVE],
+        preferred_activity_types=[ActivityType.PARK],
+        group_activity_comfort=list(GroupActivityComfort)[0],
+        new_experience_openness=list(NewExperienceOpenness)[0],
+    )
+    context = WeeklyContext(
+        target_week_start=date.today(),
+        weather_forecast=make_forecast(rng, 7),
+        season="Fall",
+    )
+    activities = make_activity_dicts(rng, size)
+    past = PastActivityContext(favorite_themes=[("nature", 4), ("creative", 2)])
+    return lambda: planner._build_user_prompt(profile, context, activities, past)
+
+
+@case("planner._summarize_weather_forecast", sizes=(7, 14, 28))
+def bench_summarize_weather(size: int):
+    planner = EnhancedActivityPlannerService(None, None, None, None, None, None)
+    forecast = make_forecast(random.Random(SEED), size)
+    return lambda: planner._summarize_weather_forecast(forecast)
+
+
+@case("FilterEnum.bulk_convert_from_ai", sizes=(1, 50))
+def bench_bulk_convert_from_ai(size: int):
+    rng = random.Random(SEED)
+    tagged = [make_ai_tagged(rng) for _ in range(size)]
+    return lambda: [FilterEnum.bulk_convert_from_ai(item) for item in tagged]
+
+
+@case("TaggedActivity.convert_ai_to_db", sizes=(1, 50))
+def bench_convert_ai_to_db(size: int):
+    rng = random.Random(SEED)
+    tagged = [make_ai_tagged(rng) for _ in range(size)]
+    # convert_ai_to_db mutates the activity, so each call starts from raw output
+    return lambda: [TaggedActivity(**item).convert_ai_to_db() for item in tagged]
+
+
+@case("parse_content", sizes=(10, 100, 1_000))
+def bench_parse_content(size: int):
+    rng = random.Random(SEED)
+    payload = json.dumps(make_activity_dicts(rng, size), default=str)
+    content = f"Here are the activities you asked for:\n{payload}"
+    return lambda: parse_content(content)
+
+
+@case("parse_response_to_json", sizes=(10, 100, 1_000))
+def bench_parse_response_to_json(size: int):
+    rng = random.Random(SEED)
+    payload = json.dumps(make_activity_dicts(rng, size), default=str, indent=2)
+    content = f"```json\n{payload}\n```"
+    return lambda: parse_response_to_json(content)
+
+
+# ---------------------------
+# Running and comparing
+# ---------------------------
+def measure(call: Callable[[], object], repeat: int, min_time: float) -> Dict:
+    timer = timeit.Timer(call)
+    loops = 1
+    # Like Timer.autorange, but with a configurable floor per sample
+    while timer.timeit(loops) < min_time:
+        loops *= 2
+    samples = [total / loops for total in timer.repeat(repeat, loops)]
+    return {
+        "loops": loops,
+        "median_us": round(statistics.median(samples) * 1e6, 3),
+        "min_us": round(min(samples) * 1e6, 3),
+        "stdev_us": round(statistics.pstdev(samples) * 1e6, 3),
+    }
+
+
+def run(selected: Optional[str], repeat: int, min_time: float) -> List[Dict]:
+    results = []
+    for bench in CASES:
+        if selected and selected not in bench.name:
+            continue
+        for size in bench.sizes:
+            random.seed(SEED)
+            call = bench.setup(size)
+            result = {"name": bench.name, "size": size}
+            result.update(measure(call, repeat, min_time))
+            results.append(result)
+            print(
+                f"{bench.name}[{size}]: {result['median_us']:.1f}us",
+                file=sys.stderr,
+            )
+    return results
+
+
+def compare(results: List[Dict], baseline: Dict, threshold: float) -> List[str]:
+    """Return a line per case whose median regressed beyond the threshold."""
+    previous = {(r["name"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        before = previous.get((result["name"], result["size"]))
+        if not before:
+            continue
+        ratio = result["median_us"] / max(before["median_us"], 1e-9)
+        result["baseline_median_us"] = before["median_us"]
+        result["ratio"] = round(ratio, 3)
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{result['name']}[{result['size']}]: "
+                f"{before['median_us']:.1f}us -> {result['median_us']:.1f}us "
+                f"({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", help="Only run cases whose name contains this")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument(
+        "--min-time", type=float, default=0.05, help="Seconds per timing sample"
+    )
+    parser.add_argument("--baseline", help="Earlier JSON output to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown of the median before failing (0.2 = 20%%)",
+    )
+    parser.add_argument("--output", help="Write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    # Enum conversion logs unmatched values; keep the timings free of I/O
+    logging.disable(logging.WARNING)
+
+    results = run(args.filter, args.repeat, args.min_time)
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "repeat": args.repeat,
+        "threshold": args.threshold,
+        "results": results,
+        "regressions": regressions,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
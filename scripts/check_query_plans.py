@@ -0,0 +1,212 @@
+"""Query-plan regression check for the week-activity and suggestion indexes.
+
+Seeds a synthetic data set inside a transaction, captures the SQL that the
+repository methods send, and asserts that Postgres plans each statement with
+the expected index rather than a sequential scan. Everything is rolled back
+afterwards. Exits non-zero when a plan regresses, so it can run in CI against
+a migrated database.
+
+Usage:
+    python -m scripts.check_query_plans [--families 200] [--weeks 40]
+"""
+
+import argparse
+import sys
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from scripts.query_plans import capture_queries, explain, indexes_used, plan_nodes
+from svc.app.dal.activity_suggestion_repository import ActivitySuggestionRepository
+from svc.app.dal.week_activity_repository import WeekActivityRepository
+from svc.app.database import SessionLocal
+from svc.app.models.activity import Activity
+from svc.app.models.user import User
+
+YEAR = 2025
+FIRST_MONDAY = date.fromisocalendar(YEAR, 1, 1)
+ACTIVITIES_PER_FAMILY = 5
+
+SEED_STATEMENTS = [
+    text(
+        """
+        INSERT INTO activities (title, done, user_id)
+        SELECT 'Plan check activity ' || n, false, u
+        FROM unnest(CAST(:user_ids AS integer[])) AS u,
+             generate_series(1, :per_family) AS n
+        """
+    ),
+    text(
+        """
+        INSERT INTO week_activities (user_id, activity_id, year, week, completed, rating)
+        SELECT a.user_id, a.id, :year, w, random() < 0.5, 1 + floor(random() * 5)::int
+        FROM activities a, generate_series(1, :weeks) AS w
+        WHERE a.user_id = ANY(CAST(:user_ids AS integer[]))
+        """
+    ),
+    text(
+        """
+        INSERT INTO activity_suggestions (
+            user_id, activity_id, suggested_date, target_week_start,
+            completion_status, created_at, updated_at
+        )
+        SELECT a.user_id, a.id, d::date, d::date, 'pending', now(), now()
+        FROM activities a,
+             generate_series(
+                 CAST(:first_monday AS date),
+                 CAST(:first_monday AS date) + 7 * (:weeks - 1),
+                 interval '7 days'
+             ) AS d
+        WHERE a.user_id = ANY(CAST(:user_ids AS integer[]))
+        """
+    ),
+    text("ANALYZE activities"),
+    text("ANALYZE week_activities"),
+    text("ANALYZE activity_suggestions"),
+]
+
+# case name -> (table the index must serve, expected index name)
+EXPECTED_INDEXES: Dict[str, Tuple[str, str]] = {
+    "get_week_activities": ("week_activities", "ix_week_activities_user_year_week"),
+    "get_current_week_activities": (
+        "week_activities",
+        "ix_week_activities_user_year_week",
+    ),
+    "get_week_summary": ("week_activities", "ix_week_activities_user_year_week"),
+    "get_week_activity_rows": (
+        "week_activities",
+        "ix_week_activities_user_year_week",
+    ),
+    "get_weekly_stats": ("week_activities", "ix_week_activities_user_year_week"),
+    "get_weeks_with_activities": (
+        "week_activities",
+        "ix_week_activities_user_year_week",
+    ),
+    "get_activities_suggested_for_week": (
+        "activity_suggestions",
+        "idx_activity_suggestions_user_week",
+    ),
+    "get_suggestion_by_params": (
+        "activity_suggestions",
+        "idx_activity_suggestions_user_week",
+    ),
+}
+
+
+def seed(db: Session, families: int, weeks: int) -> List[int]:
+    users = [
+        User(email=f"family-{i}@plan-check.invalid", is_active=True)
+        for i in range(families)
+    ]
+    db.add_all(users)
+    db.flush()
+    user_ids = [user.id for user in users]
+
+    params = {
+        "user_ids": user_ids,
+        "per_family": ACTIVITIES_PER_FAMILY,
+        "year": YEAR,
+        "weeks": weeks,
+        "first_monday": FIRST_MONDAY,
+    }
+    for statement in SEED_STATEMENTS:
+        db.execute(statement, params)
+    return user_ids
+
+
+def build_cases(db: Session, user_id: int, weeks: int) -> Dict[str, Callable]:
+    week_repo = WeekActivityRepository(db)
+    suggestion_repo = ActivitySuggestionRepository(db)
+    activity_id = db.execute(
+        select(Activity.id).where(Activity.user_id == user_id).limit(1)
+    ).scalar_one()
+    week = min(10, weeks)
+    week_start = FIRST_MONDAY + timedelta(weeks=week - 1)
+
+    return {
+        "get_week_activities": lambda: week_repo.get_week_activities(
+            year=YEAR, week=week, user_id=user_id
+        ),
+        "get_current_week_activities": lambda: week_repo.get_current_week_activities(
+            user_id=user_id
+        ),
+        "get_week_summary": lambda: week_repo.get_week_summary(
+            year=YEAR, week=week, user_id=user_id
+        ),
+        "get_week_activity_rows": lambda: week_repo.get_week_activity_rows(
+            year=YEAR, week=week, user_id=user_id
+        ),
+        "get_weekly_stats": lambda: week_repo.get_weekly_stats(
+            user_id=user_id,
+            start_date=FIRST_MONDAY,
+            end_date=FIRST_MONDAY + timedelta(weeks=11),
+        ),
+        "get_weeks_with_activities": lambda: week_repo.get_weeks_with_activities(
+            user_id=user_id
+        ),
+        "get_activities_suggested_for_week": lambda: (
+            suggestion_repo.get_activities_suggested_for_week(user_id, week_start)
+        ),
+        "get_suggestion_by_params": lambda: suggestion_repo.get_suggestion_by_params(
+            user_id, activity_id, week_start
+        ),
+    }
+
+
+def check_case(db: Session, name: str, call: Callable) -> List[str]:
+    """Return a list of failures for one repository call."""
+    table, expected_index = EXPECTED_INDEXES[name]
+    statements = [
+        (statement, parameters)
+        for statement, parameters in capture_queries(db, call)
+        if table in statement
+    ]
+    if not statements:
+        return [f"{name}: no statement touched {table}"]
+
+    failures = []
+    for statement, parameters in statements:
+        plan = explain(db, statement, parameters)["Plan"]
+        seq_scans = [
+            node
+            for node in plan_nodes(plan)
+            if node["Node Type"] == "Seq Scan" and node.get("Relation Name") == table
+        ]
+        used = indexes_used(plan)
+        if seq_scans or expected_index not in used:
+            failures.append(
+                f"{name}: expected {expected_index} on {table}, "
+                f"plan used {used or 'no index'}"
+                f"{' with a sequential scan' if seq_scans else ''}"
+            )
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--families", type=int, default=200)
+    parser.add_argument("--weeks", type=int, default=40)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    db.info["pin_primary"] = True
+    failures = []
+    try:
+        user_ids = seed(db, args.families, args.weeks)
+        for name, call in build_cases(db, user_ids[0], args.weeks).items():
+            case_failures = check_case(db, name, call)
+            failures.extend(case_failures)
+            print(f"{'FAIL' if case_failures else 'ok'}  {name}")
+    finally:
+        db.rollback()
+        db.close()
+
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
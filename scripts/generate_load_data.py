@@ -0,0 +1,658 @@
+"""Generate a large, realistic synthetic data set for benchmarks and load tests.
+
+Creates N families, each with kids of varied ages, family preferences, a
+catalog of its own activities with skewed tag distributions drawn from
+datatypes/enums.py, months of week_activities with completions and ratings,
+and activity_suggestions with mixed completion statuses.
+
+Families are generated in fixed-size chunks. Each chunk draws from its own
+random stream derived from --seed and the chunk's first family number, so
+for a given seed and chunk size the generated content is the same however
+many workers load it. Every chunk is bulk-loaded with COPY in a single
+transaction by one of --workers processes. Generated families share the
+load-data.example.com email domain and can log in with --password.
+
+Usage:
+    python -m scripts.generate_load_data --families 100000 --workers 8
+    python -m scripts.generate_load_data --families 1000 --replace
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import date, datetime
+from datetime import time as dt_time
+from datetime import timedelta, timezone
+from enum import Enum
+from itertools import accumulate
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple, Type
+
+from sqlalchemy import delete, text
+
+from svc.app.database import SessionLocal, engine
+from svc.app.datatypes.enums import (
+    ActivityScale,
+    ActivityType,
+    AgeGroup,
+    CompletionStatus,
+    Cost,
+    DaysOfWeek,
+    Duration,
+    Frequency,
+    GroupActivityComfort,
+    LearningPriority,
+    Location,
+    NewExperienceOpenness,
+    Participants,
+    PreferredTimeSlot,
+    Season,
+    Theme,
+)
+from svc.app.models.user import User
+from svc.app.utils.security import hash_password
+
+EMAIL_DOMAIN = "load-data.example.com"
+TABLES = ["users", "kids", "family_preferences", "activities"]
+HISTORY_TABLES = ["week_activities", "activity_suggestions"]
+
+# (city, state, latitude, longitude)
+CITIES = [
+    ("Austin", "TX", 30.27, -97.74),
+    ("Denver", "CO", 39.74, -104.99),
+    ("Portland", "OR", 45.52, -122.68),
+    ("Raleigh", "NC", 35.78, -78.64),
+    ("Columbus", "OH", 39.96, -83.00),
+    ("Phoenix", "AZ", 33.45, -112.07),
+    ("Nashville", "TN", 36.16, -86.78),
+    ("Minneapolis", "MN", 44.98, -93.27),
+    ("Tampa", "FL", 27.95, -82.46),
+    ("Sacramento", "CA", 38.58, -121.49),
+]
+KID_NAMES = ["Ava", "Ben", "Cora", "Dev", "Eli", "Fay", "Gus", "Ivy", "Jude", "Lia"]
+KID_COLORS = ["#a7f3d0", "#bfdbfe", "#fde68a", "#fbcfe8", "#ddd6fe", "#fed7aa"]
+INTERESTS = [
+    "dinosaurs",
+    "space",
+    "drawing",
+    "lego",
+    "soccer",
+    "reading",
+    "music",
+    "animals",
+    "cooking",
+    "coding",
+]
+SPECIAL_NEEDS = ["ADHD", "autism", "dyslexia", "sensory processing"]
+EQUIPMENT = ["bikes", "telescope", "art supplies", "board games", "camping gear"]
+ACTIVITY_WORDS = ["Backyard", "Library", "Museum", "Kitchen", "Garden", "Park"]
+ACTIVITY_NOUNS = ["quest", "project", "challenge", "outing", "workshop", "session"]
+
+# Past suggestions resolve to these statuses; the current week stays pending
+PAST_SUGGESTION_STATUSES = [
+    (CompletionStatus.COMPLETED, 35),
+    (CompletionStatus.LIKELY_COMPLETED, 10),
+    (CompletionStatus.POSSIBLY_COMPLETED, 5),
+    (CompletionStatus.UNKNOWN, 5),
+    (CompletionStatus.LIKELY_SKIPPED, 10),
+    (CompletionStatus.ASSUMED_SKIPPED, 20),
+    (CompletionStatus.WEATHER_PREVENTED, 5),
+    (CompletionStatus.EXPLICITLY_SKIPPED, 10),
+]
+COMPLETED_STATUSES = {
+    CompletionStatus.COMPLETED.value,
+    CompletionStatus.LIKELY_COMPLETED.value,
+}
+
+
+@dataclass(frozen=True)
+class Options:
+    seed: int
+    activities_per_family: int
+    weeks: int
+    suggestions_per_week: int
+    password_hash: str
+    first_monday: date
+
+
+class Popularity:
+    """Skewed (Zipf-like) weights over an enum, in declaration order.
+
+    Real catalogs are dominated by a few tags (free, year-round, family...),
+    which the enums mostly declare first; picking tags uniformly would make
+    index selectivity unrealistically even.
+    """
+
+    def __init__(self, enum: Type[Enum], skew: float = 1.1):
+        self.members = list(enum)
+        self.cum_weights = list(
+            accumulate(1 / (rank + 1) ** skew for rank in range(len(self.members)))
+        )
+
+    def sample(self, rng: random.Random, low: int, high: int) -> List[Enum]:
+        """Draw between low and high distinct members, favouring popular ones."""
+        count = min(rng.randint(low, high), len(self.members))
+        chosen: List[Enum] = []
+        while len(chosen) < count:
+            member = rng.choices(self.members, cum_weights=self.cum_weights)[0]
+            if member not in chosen:
+                chosen.append(member)
+        return chosen
+
+
+POPULARITY: Dict[Type[Enum], Popularity] = {
+    enum: Popularity(enum)
+    for enum in (
+        ActivityScale,
+        ActivityType,
+        AgeGroup,
+        Cost,
+        Duration,
+        Frequency,
+        Location,
+        Participants,
+        Season,
+        Theme,
+    )
+}
+
+
+# ---------------------------
+# COPY helpers
+# ---------------------------
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _array_element(value: Any) -> str:
+    if isinstance(value, Enum):
+        value = value.name
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _copy_array(values: Sequence[Any]) -> str:
+    return ("{" + ",".join(_array_element(v) for v in values) + "}").translate(
+        _COPY_ESCAPES
+    )
+
+
+# Formatters by exact type; the generator produces millions of values, so this
+# avoids a chain of isinstance checks per value
+_COPY_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    type(None): lambda value: "\\N",
+    bool: lambda value: "t" if value else "f",
+    int: str,
+    float: repr,
+    str: lambda value: value.translate(_COPY_ESCAPES),
+    list: _copy_array,
+    tuple: _copy_array,
+    date: date.isoformat,
+    datetime: datetime.isoformat,
+    dict: lambda value: json.dumps(value).translate(_COPY_ESCAPES),
+}
+
+
+def copy_value(value: Any) -> str:
+    """Render a Python value in COPY text format (enums by name, as SQLAlchemy)."""
+    formatter = _COPY_FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    if isinstance(value, Enum):
+        return value.name
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def copy_rows(
+    cursor, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]
+) -> int:
+    buffer = io.StringIO()
+    count = 0
+    for row in rows:
+        buffer.write("\t".join(copy_value(value) for value in row))
+        buffer.write("\n")
+        count += 1
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+    return count
+
+
+def reserve_ids(cursor, table: str, count: int) -> List[int]:
+    """Take count ids from the table's sequence so child rows can reference them."""
+    cursor.execute(
+        "SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+        (table, count),
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+# ---------------------------
+# Row generators
+# ---------------------------
+def family_rows(
+    rng: random.Random, index: int, user_id: int, options: Options
+) -> Tuple[tuple, List[tuple], tuple]:
+    city, state, latitude, longitude = rng.choice(CITIES)
+    adults = rng.choices([1, 2], [25, 75])[0]
+    kid_count = rng.choices([1, 2, 3, 4, 5], [30, 38, 20, 9, 3])[0]
+    joined = datetime.now(timezone.utc) - timedelta(
+        days=options.weeks * 7 + rng.randint(0, 365)
+    )
+    user = (
+        user_id,
+        f"family-{index}@{EMAIL_DOMAIN}",
+        options.password_hash,
+        True,
+        city,
+        state,
+        "US",
+        round(latitude + rng.uniform(-0.2, 0.2), 5),
+        round(longitude + rng.uniform(-0.2, 0.2), 5),
+        adults + kid_count,
+        adults,
+        rng.random() < 0.9,
+        rng.choice([10, 25, 50, 100]),
+        rng.choice([None, 25.0, 50.0, 100.0, 200.0]),
+        rng.randint(3, 10),
+        joined,
+        joined,
+    )
+
+    today = date.today()
+    kids = [
+        (
+            rng.choice(KID_NAMES),
+            today - timedelta(days=rng.randint(2 * 365, 17 * 365)),
+            rng.sample(INTERESTS, rng.randint(0, 3)),
+            [rng.choice(SPECIAL_NEEDS)] if rng.random() < 0.15 else [],
+            rng.choice(KID_COLORS),
+            user_id,
+        )
+        for _ in range(kid_count)
+    ]
+
+    preferences = (
+        user_id,
+        rng.sample(list(Theme), rng.randint(1, 4)),
+        rng.sample(list(ActivityType), rng.randint(1, 5)),
+        rng.sample(list(Cost), rng.randint(1, 3)),
+        rng.sample(list(Location), rng.randint(1, 3)),
+        rng.sample(list(DaysOfWeek), rng.randint(2, 7)),
+        rng.sample(list(PreferredTimeSlot), rng.randint(1, 3)),
+        # Plain string columns: these hold the enum value, not its name
+        rng.choice(list(GroupActivityComfort)).value,
+        rng.choice(list(NewExperienceOpenness)).value,
+        [priority.value for priority in rng.sample(list(LearningPriority), 2)],
+        rng.sample(EQUIPMENT, rng.randint(0, 3)),
+        joined,
+        joined,
+    )
+    return user, kids, preferences
+
+
+def activity_row(
+    rng: random.Random, activity_id: int, user_id: int, number: int
+) -> tuple:
+    themes = POPULARITY[Theme].sample(rng, 1, 3)
+    activity_types = POPULARITY[ActivityType].sample(rng, 1, 2)
+    return (
+        activity_id,
+        f"{rng.choice(ACTIVITY_WORDS)} {rng.choice(ACTIVITY_NOUNS)} {number}",
+        f"Synthetic {themes[0].db_value} activity",
+        False,
+        rng.random() < 0.3,
+        user_id,
+        POPULARITY[Cost].sample(rng, 1, 2),
+        POPULARITY[Duration].sample(rng, 1, 2),
+        POPULARITY[Participants].sample(rng, 1, 2),
+        POPULARITY[Location].sample(rng, 1, 2),
+        POPULARITY[Season].sample(rng, 1, 3),
+        POPULARITY[AgeGroup].sample(rng, 1, 3),
+        POPULARITY[Frequency].sample(rng, 1, 1),
+        themes,
+        activity_types,
+        activity_types[0],
+        themes[0],
+        POPULARITY[ActivityScale].sample(rng, 1, 1)[0],
+    )
+
+
+def history_rows(
+    rng: random.Random, user_id: int, activity_ids: List[int], options: Options
+) -> Tuple[List[tuple], List[tuple]]:
+    """Weekly schedules and suggestions for one family, oldest week first."""
+    engagement = rng.betavariate(2, 2)
+    per_week = rng.randint(2, 6)
+    week_activities = []
+    suggestions = []
+
+    for offset in range(options.weeks):
+        monday = options.first_monday + timedelta(weeks=offset)
+        is_current = offset == options.weeks - 1
+        year, week, _ = monday.isocalendar()
+        monday_at = datetime.combine(monday, dt_time(8), tzinfo=timezone.utc)
+
+        for activity_id in rng.sample(activity_ids, min(per_week, len(activity_ids))):
+            completed = not is_current and rng.random() < engagement
+            completed_at = (
+                monday_at + timedelta(days=rng.randint(0, 6), hours=rng.randint(1, 12))
+                if completed
+                else None
+            )
+            rating = (
+                rng.choices([1, 2, 3, 4, 5], [3, 7, 20, 35, 35])[0]
+                if completed and rng.random() < 0.6
+                else None
+            )
+            week_activities.append(
+                (
+                    user_id,
+                    activity_id,
+                    year,
+                    week,
+                    completed,
+                    completed_at.replace(tzinfo=None) if completed_at else None,
+                    rating,
+                    monday_at,
+                    completed_at or monday_at,
+                )
+            )
+
+        statuses, weights = zip(*PAST_SUGGESTION_STATUSES)
+        suggested_ids = rng.sample(
+            activity_ids, min(options.suggestions_per_week, len(activity_ids))
+        )
+        for activity_id in suggested_ids:
+            status = (
+                CompletionStatus.PENDING.value
+                if is_current
+                else rng.choices(statuses, weights)[0].value
+            )
+            suggested_date = monday + timedelta(days=rng.randint(0, 6))
+            done = status in COMPLETED_STATUSES
+            suggestions.append(
+                (
+                    user_id,
+                    activity_id,
+                    suggested_date,
+                    monday,
+                    "Matches your family's interests",
+                    status,
+                    suggested_date if done else None,
+                    rng.randint(3, 5) if done and rng.random() < 0.3 else None,
+                    round(rng.random(), 3),
+                    monday_at,
+                    monday_at,
+                )
+            )
+
+    return week_activities, suggestions
+
+
+# ---------------------------
+# Loading
+# ---------------------------
+def load_chunk(start: int, families: int, options: Options) -> Dict:
+    """Generate and COPY one chunk of families in a single transaction."""
+    rng = random.Random(f"{options.seed}:{start}")
+    counts: Dict[str, int] = {}
+
+    connection = engine.raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            user_ids = reserve_ids(cursor, "users", families)
+            activity_ids = reserve_ids(
+                cursor, "activities", families * options.activities_per_family
+            )
+
+            users, kids, preferences, activities = [], [], [], []
+            week_activities, suggestions = [], []
+            for number, user_id in enumerate(user_ids):
+                user, family_kids, family_preferences = family_rows(
+                    rng, start + number, user_id, options
+                )
+                users.append(user)
+                kids.extend(family_kids)
+                preferences.append(family_preferences)
+
+                family_activity_ids = activity_ids[
+                    number
+                    * options.activities_per_family : (number + 1)
+                    * options.activities_per_family
+                ]
+                activities.extend(
+                    activity_row(rng, activity_id, user_id, position)
+                    for position, activity_id in enumerate(family_activity_ids)
+                )
+                family_weeks, family_suggestions = history_rows(
+                    rng, user_id, family_activity_ids, options
+                )
+                week_activities.extend(family_weeks)
+                suggestions.extend(family_suggestions)
+
+            counts["users"] = copy_rows(
+                cursor,
+                "users",
+                [
+                    "id",
+                    "email",
+                    "password_hash",
+                    "is_active",
+                    "city",
+                    "state",
+                    "country",
+                    "latitude",
+                    "longitude",
+                    "family_size",
+                    "adults_count",
+                    "has_car",
+                    "max_travel_distance",
+                    "weekly_activity_budget",
+                    "max_activities_per_week",
+                    "created_at",
+                    "updated_at",
+                ],
+                users,
+            )
+            counts["kids"] = copy_rows(
+                cursor,
+                "kids",
+                ["name", "dob", "interests", "special_needs", "color", "parent_id"],
+                kids,
+            )
+            counts["family_preferences"] = copy_rows(
+                cursor,
+                "family_preferences",
+                [
+                    "user_id",
+                    "preferred_themes",
+                    "preferred_activity_types",
+                    "preferred_cost_ranges",
+                    "preferred_locations",
+                    "available_days",
+                    "preferred_time_slots",
+                    "group_activity_comfort",
+                    "new_experience_openness",
+                    "educational_priorities",
+                    "equipment_owned",
+                    "created_at",
+                    "updated_at",
+                ],
+                preferences,
+            )
+            counts["activities"] = copy_rows(
+                cursor,
+                "activities",
+                [
+                    "id",
+                    "title",
+                    "description",
+                    "done",
+                    "llm_generated",
+                    "user_id",
+                    "costs",
+                    "durations",
+                    "participants",
+                    "locations",
+                    "seasons",
+                    "age_groups",
+                    "frequency",
+                    "themes",
+                    "activity_types",
+                    "primary_type",
+                    "primary_theme",
+                    "activity_scale",
+                ],
+                activities,
+            )
+            counts["week_activities"] = copy_rows(
+                cursor,
+                "week_activities",
+                [
+                    "user_id",
+                    "activity_id",
+                    "year",
+                    "week",
+                    "completed",
+                    "completed_at",
+                    "rating",
+                    "created_at",
+                    "updated_at",
+                ],
+                week_activities,
+            )
+            counts["activity_suggestions"] = copy_rows(
+                cursor,
+                "activity_suggestions",
+                [
+                    "user_id",
+                    "activity_id",
+                    "suggested_date",
+                    "target_week_start",
+                    "suggested_reason",
+                    "completion_status",
+                    "completion_date",
+                    "user_rating",
+                    "inferred_completion_likelihood",
+                    "created_at",
+                    "updated_at",
+                ],
+                suggestions,
+            )
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+    return counts
+
+
+def init_worker() -> None:
+    # Connections inherited from the parent process must not be reused
+    engine.dispose(close=False)
+
+
+def remove_generated_data() -> None:
+    # Kids, preferences, activities and their history cascade from the user
+    with SessionLocal() as db:
+        db.execute(delete(User).where(User.email.like(f"%@{EMAIL_DOMAIN}")))
+        db.commit()
+
+
+def analyze() -> None:
+    with SessionLocal() as db:
+        for table in TABLES + HISTORY_TABLES:
+            db.execute(text(f"ANALYZE {table}"))
+        db.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--families", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--chunk-size", type=int, default=500, help="Families per COPY transaction"
+    )
+    parser.add_argument("--activities-per-family", type=int, default=20)
+    parser.add_argument("--weeks", type=int, default=26, help="Weeks of history")
+    parser.add_argument("--suggestions-per-week", type=int, default=4)
+    parser.add_argument(
+        "--start-index",
+        type=int,
+        default=0,
+        help="Number of the first family, to append to an earlier run",
+    )
+    parser.add_argument("--password", default="load-test-password")
+    parser.add_argument(
+        "--replace",
+        action="store_true",
+        help="Delete previously generated families first",
+    )
+    args = parser.parse_args()
+
+    if args.replace:
+        print("Removing previously generated families...", file=sys.stderr)
+        remove_generated_data()
+
+    this_monday = date.today() - timedelta(days=date.today().weekday())
+    options = Options(
+        seed=args.seed,
+        activities_per_family=args.activities_per_family,
+        weeks=args.weeks,
+        suggestions_per_week=args.suggestions_per_week,
+        # Hashed once: every generated family shares the password
+        password_hash=hash_password(args.password),
+        first_monday=this_monday - timedelta(weeks=args.weeks - 1),
+    )
+
+    chunks = [
+        (args.start_index + offset, min(args.chunk_size, args.families - offset))
+        for offset in range(0, args.families, args.chunk_size)
+    ]
+
+    started = time.perf_counter()
+    totals: Dict[str, int] = {}
+    with ProcessPoolExecutor(
+        max_workers=args.workers, initializer=init_worker
+    ) as executor:
+        futures = [
+            executor.submit(load_chunk, start, families, options)
+            for start, families in chunks
+        ]
+        for done, future in enumerate(as_completed(futures), start=1):
+            for table, count in future.result().items():
+                totals[table] = totals.get(table, 0) + count
+            print(
+                f"\r{done}/{len(chunks)} chunks, "
+                f"{totals.get('users', 0)} families "
+                f"({time.perf_counter() - started:.0f}s)",
+                end="",
+                file=sys.stderr,
+            )
+    print(file=sys.stderr)
+
+    analyze()
+    elapsed = time.perf_counter() - started
+    print(
+        json.dumps(
+            {
+                "seed": args.seed,
+                "families": args.families,
+                "workers": args.workers,
+                "seconds": round(elapsed, 1),
+                "rows": totals,
+                "rows_per_second": round(sum(totals.values()) / elapsed),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,376 @@
+"""Local OpenAI-compatible stand-in for load and latency testing.
+
+Serves POST /v1/chat/completions. When the request carries a json_schema
+response_format, the reply is generated to satisfy that schema; array items
+with an integer "id" are filled with real activity ids (and their titles)
+found in the prompt, so the planner gets back activities it can record.
+Latency is drawn from a configurable distribution, a share of requests can
+fail with 500, 429 or unparseable content, every reply reports token usage,
+and "stream": true is answered with server-sent events.
+
+Point the API at it with:
+    OPENAI_BASE_URL=http://127.0.0.1:8001/v1 OPENAI_API_KEY=stub
+
+Usage:
+    python -m scripts.llm_stub_server --port 8001 --latency-ms 800 \\
+        --latency-distribution lognormal --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+CANDIDATES_MARKER = "Activities to choose from:"
+# "id": 12, "title": "Park outing" as the planner serializes its candidates
+CANDIDATE_PATTERN = re.compile(r'"id":\s*(\d+),\s*"title":\s*"((?:[^"\\]|\\.)*)"')
+WORDS = ["family", "park", "craft", "library", "nature", "music", "garden", "game"]
+LATENCY_DISTRIBUTIONS = ["fixed", "uniform", "normal", "lognormal", "exponential"]
+
+
+@dataclass
+class StubConfig:
+    latency_ms: float = 0.0
+    latency_distribution: str = "fixed"
+    latency_spread: float = 0.5
+    stream_chunk_ms: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    malformed_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+@dataclass
+class StubStats:
+    requests: int = 0
+    streamed: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+
+config = StubConfig()
+stats = StubStats()
+rng = random.Random()
+app = FastAPI(title="LLM stub server")
+
+
+# ---------------------------
+# Schema-driven generation
+# ---------------------------
+class SchemaFaker:
+    """Generate a value satisfying the subset of JSON Schema our prompts use."""
+
+    def __init__(self, candidates: List[Tuple[int, str]]):
+        self.candidates = candidates[:]
+        rng.shuffle(self.candidates)
+
+    def generate(self, schema: Dict[str, Any], name: str = "value") -> Any:
+        if "enum" in schema:
+            return rng.choice(schema["enum"])
+
+        schema_type = schema.get("type", "object")
+        if isinstance(schema_type, list):
+            # Prefer a real value over null for ["string", "null"] style types
+            non_null = [t for t in schema_type if t != "null"] or ["null"]
+            schema_type = rng.choice(non_null)
+
+        if schema_type == "object":
+            return self._object(schema)
+        if schema_type == "array":
+            return self._array(schema, name)
+        if schema_type == "string":
+            return self._string(schema, name)
+        if schema_type == "integer":
+            return rng.randint(schema.get("minimum", 0), schema.get("maximum", 100))
+        if schema_type == "number":
+            return round(rng.uniform(schema.get("minimum", 0), 50), 2)
+        if schema_type == "boolean":
+            return rng.random() < 0.5
+        return None
+
+    def _object(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        properties = schema.get("properties", {})
+        required = set(schema.get("required", properties))
+        value = {
+            key: self.generate(subschema, key)
+            for key, subschema in properties.items()
+            if key in required or rng.random() < 0.7
+        }
+
+        # Planner replies must reference activities that were offered
+        if "id" in value and self.candidates:
+            activity_id, title = self.candidates.pop()
+            value["id"] = activity_id
+            if "title" in properties:
+                value["title"] = json.loads(f'"{title}"')
+        return value
+
+    def _array(self, schema: Dict[str, Any], name: str) -> List[Any]:
+        items = schema.get("items", {"type": "string"})
+        low = schema.get("minItems", 1)
+        high = max(low, schema.get("maxItems", low + 4))
+        if items.get("type") == "object" and "id" in items.get("properties", {}):
+            high = max(low, min(high, len(self.candidates) or high))
+        count = rng.randint(low, high)
+
+        values: List[Any] = []
+        for _ in range(count * 3):
+            if len(values) >= count:
+                break
+            value = self.generate(items, name.rstrip("s"))
+            if schema.get("uniqueItems") and value in values:
+                continue
+            values.append(value)
+        return values
+
+    def _string(self, schema: Dict[str, Any], name: str) -> str:
+        words = " ".join(rng.sample(WORDS, 3))
+        value = f"Stub {name.replace('_', ' ')}: {words}"
+        return value[: schema.get("maxLength", len(value))]
+
+
+def response_content(body: Dict[str, Any]) -> str:
+    prompt = "\n".join(
+        str(message.get("content", "")) for message in body.get("messages", [])
+    )
+    response_format = body.get("response_format") or {}
+    if response_format.get("type") == "json_schema":
+        schema = response_format.get("json_schema", {}).get("schema", {})
+        # Skip worked examples earlier in the prompt; only offered ids are valid
+        offered = prompt.rpartition(CANDIDATES_MARKER)[2]
+        candidates = list(
+            {
+                int(activity_id): title
+                for activity_id, title in CANDIDATE_PATTERN.findall(offered)
+            }.items()
+        )
+        return json.dumps(SchemaFaker(candidates).generate(schema))
+    if response_format.get("type") == "json_object":
+        return json.dumps({"result": "stub"})
+    return "This is a stub completion."
+
+
+def count_tokens(text: str) -> int:
+    # Close enough to BPE for English prose: about four characters per token
+    return max(1, len(text) // 4)
+
+
+# ---------------------------
+# Latency and fault injection
+# ---------------------------
+def draw_latency() -> float:
+    """Seconds to wait before answering, from the configured distribution."""
+    mean = config.latency_ms / 1000
+    if mean <= 0:
+        return 0.0
+
+    spread = config.latency_spread
+    distribution = config.latency_distribution
+    if distribution == "uniform":
+        value = rng.uniform(mean * (1 - spread), mean * (1 + spread))
+    elif distribution == "normal":
+        value = rng.gauss(mean, mean * spread)
+    elif distribution == "lognormal":
+        # latency_ms is the median; spread is sigma, giving a long right tail
+        value = mean * rng.lognormvariate(0, spread)
+    elif distribution == "exponential":
+        value = rng.expovariate(1 / mean)
+    else:
+        value = mean
+    return max(0.0, value)
+
+
+def injected_failure() -> Optional[JSONResponse]:
+    roll = rng.random()
+    if roll < config.error_rate:
+        stats.errors["server_error"] = stats.errors.get("server_error", 0) + 1
+        return JSONResponse(
+            status_code=500,
+            content={
+                "error": {"message": "Injected stub failure", "type": "server_error"}
+            },
+        )
+    if roll < config.error_rate + config.rate_limit_rate:
+        stats.errors["rate_limited"] = stats.errors.get("rate_limited", 0) + 1
+        return JSONResponse(
+            status_code=429,
+            headers={"retry-after": "1"},
+            content={
+                "error": {
+                    "message": "Injected rate limit",
+                    "type": "rate_limit_exceeded",
+                }
+            },
+        )
+    return None
+
+
+# ---------------------------
+# Endpoints
+# ---------------------------
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    stats.requests += 1
+
+    await asyncio.sleep(draw_latency())
+    failure = injected_failure()
+    if failure is not None:
+        return failure
+
+    if rng.random() < config.malformed_rate:
+        stats.errors["malformed"] = stats.errors.get("malformed", 0) + 1
+        content = "Sorry, I can't produce JSON right now {"
+    else:
+        content = response_content(body)
+
+    model = body.get("model", "stub")
+    prompt_tokens = count_tokens(
+        "".join(str(m.get("content", "")) for m in body.get("messages", []))
+    )
+    completion_tokens = count_tokens(content)
+    stats.prompt_tokens += prompt_tokens
+    stats.completion_tokens += completion_tokens
+    usage = {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+    completion_id = f"chatcmpl-stub-{uuid.uuid4().hex[:24]}"
+    created = int(time.time())
+
+    if body.get("stream"):
+        stats.streamed += 1
+        include_usage = (body.get("stream_options") or {}).get("include_usage", False)
+        return StreamingResponse(
+            stream_chunks(
+                completion_id, created, model, content, usage if include_usage else None
+            ),
+            media_type="text/event-stream",
+        )
+
+    return {
+        "id": completion_id,
+        "object": "chat.completion",
+        "created": created,
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": usage,
+    }
+
+
+async def stream_chunks(
+    completion_id: str,
+    created: int,
+    model: str,
+    content: str,
+    usage: Optional[Dict[str, int]],
+) -> AsyncIterator[str]:
+    def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> str:
+        payload = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+        return f"data: {json.dumps(payload)}\n\n"
+
+    yield chunk({"role": "assistant", "content": ""})
+    # Roughly one token per chunk
+    for start in range(0, len(content), 16):
+        await asyncio.sleep(config.stream_chunk_ms / 1000)
+        yield chunk({"content": content[start : start + 16]})
+    yield chunk({}, "stop")
+    if usage is not None:
+        payload = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [],
+            "usage": usage,
+        }
+        yield f"data: {json.dumps(payload)}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+@app.get("/v1/models")
+async def list_models():
+    return {"object": "list", "data": [{"id": "stub", "object": "model"}]}
+
+
+@app.get("/stats")
+async def get_stats():
+    return {
+        "requests": stats.requests,
+        "streamed": stats.streamed,
+        "errors": stats.errors,
+        "prompt_tokens": stats.prompt_tokens,
+        "completion_tokens": stats.completion_tokens,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Mean (median for lognormal)"
+    )
+    parser.add_argument(
+        "--latency-distribution", choices=LATENCY_DISTRIBUTIONS, default="fixed"
+    )
+    parser.add_argument(
+        "--latency-spread",
+        type=float,
+        default=0.5,
+        help="Relative spread: half-width (uniform), stdev (normal), sigma (lognormal)",
+    )
+    parser.add_argument(
+        "--stream-chunk-ms", type=float, default=0.0, help="Delay between chunks"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of 500s")
+    parser.add_argument(
+        "--rate-limit-rate", type=float, default=0.0, help="Share of 429s"
+    )
+    parser.add_argument(
+        "--malformed-rate",
+        type=float,
+        default=0.0,
+        help="Share of replies whose content is not valid JSON",
+    )
+    parser.add_argument("--seed", type=int, help="Make generated replies repeatable")
+    args = parser.parse_args()
+
+    config.latency_ms = args.latency_ms
+    config.latency_distribution = args.latency_distribution
+    config.latency_spread = args.latency_spread
+    config.stream_chunk_ms = args.stream_chunk_ms
+    config.error_rate = args.error_rate
+    config.rate_limit_rate = args.rate_limit_rate
+    config.malformed_rate = args.malformed_rate
+    config.seed = args.seed
+    rng.seed(args.seed)
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+"""Concurrent end-to-end load test for a running API instance.
+
+Each virtual user logs in as one of the families created by
+scripts/generate_load_data.py and then repeats a weighted journey: list
+activities, view the week summary, toggle a week's activity, plan the week
+and generate a checklist. While the journeys run, /health is sampled to
+track connection pool saturation, and its latency is kept as a measure of
+event-loop stalls: the endpoint does no work, so any delay there is time the
+loop spent blocked.
+
+Reports throughput, p50/p95/p99 latency and error rate per endpoint, plus
+pool and event-loop figures.
+
+Usage:
+    python -m scripts.generate_load_data --families 1000
+    python -m scripts.llm_stub_server --port 8001 --latency-ms 800 \\
+        --latency-distribution lognormal &
+    OPENAI_BASE_URL=http://127.0.0.1:8001/v1 OPENAI_API_KEY=stub \\
+        uvicorn svc.app.main:app --port 8000 &
+    python -m scripts.load_test --users 50 --duration 60
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import statistics
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from scripts.generate_load_data import EMAIL_DOMAIN
+
+# Relative frequency of each step after login; planning and checklists call
+# the LLM so they are rarer, as they are for real families
+JOURNEY = {
+    "list_activities": 10,
+    "week_summary": 8,
+    "toggle_week_activity": 5,
+    "plan_week": 1,
+    "create_checklist": 1,
+}
+
+
+@dataclass
+class EndpointStats:
+    latencies: List[float] = field(default_factory=list)
+    statuses: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    @property
+    def requests(self) -> int:
+        return sum(self.statuses.values())
+
+    @property
+    def errors(self) -> int:
+        return sum(
+            count
+            for status, count in self.statuses.items()
+            if not status.startswith(("2", "3"))
+        )
+
+
+@dataclass
+class PoolSample:
+    checked_out: int
+    capacity: int
+    health_latency: float
+
+
+class LoadTest:
+    def __init__(self, client: httpx.AsyncClient, args: argparse.Namespace):
+        self.client = client
+        self.args = args
+        self.stats: Dict[str, EndpointStats] = defaultdict(EndpointStats)
+        self.pool_samples: List[PoolSample] = []
+        self.deadline = 0.0
+
+    async def request(
+        self, name: str, method: str, url: str, **kwargs: Any
+    ) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self.stats[name].statuses[type(e).__name__] += 1
+            return None
+
+        self.stats[name].latencies.append(time.perf_counter() - started)
+        self.stats[name].statuses[str(response.status_code)] += 1
+        return response if response.is_success else None
+
+    async def virtual_user(self, index: int) -> None:
+        rng = random.Random(f"{self.args.seed}:{index}")
+        # Stagger arrivals over the ramp-up period
+        await asyncio.sleep(self.args.ramp_up * index / self.args.users)
+
+        family = self.args.first_family + index % self.args.families
+        response = await self.request(
+            "login",
+            "POST",
+            "/api/v1/auth/login",
+            json={
+                "email": f"family-{family}@{EMAIL_DOMAIN}",
+                "password": self.args.password,
+            },
+        )
+        if response is None:
+            return
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        steps = list(JOURNEY)
+        weights = list(JOURNEY.values())
+        activity_ids: List[int] = []
+        week_activity_ids: List[int] = []
+
+        while time.monotonic() < self.deadline:
+            step = rng.choices(steps, weights)[0]
+            if step == "list_activities":
+                response = await self.request(
+                    step, "GET", "/api/v1/activities", headers=headers
+                )
+                if response is not None:
+                    activity_ids = [activity["id"] for activity in response.json()]
+            elif step == "week_summary":
+                response = await self.request(
+                    step, "GET", "/api/v1/week-activities/summary", headers=headers
+                )
+                if response is not None:
+                    week_activity_ids = [
+                        item["id"] for item in response.json()["activities"]
+                    ]
+            elif step == "toggle_week_activity" and week_activity_ids:
+                await self.request(
+                    step,
+                    "POST",
+                    f"/api/v1/week-activities/{rng.choice(week_activity_ids)}/toggle",
+                    headers=headers,
+                )
+            elif step == "plan_week":
+                await self.request(
+                    step,
+                    "POST",
+                    "/api/v1/week-activities/plan-week",
+                    headers=headers,
+                    json={"location": "home"},
+                )
+            elif step == "create_checklist" and activity_ids:
+                await self.request(
+                    step,
+                    "POST",
+                    f"/api/v1/activities/{rng.choice(activity_ids)}/checklist",
+                    headers=headers,
+                )
+
+            await asyncio.sleep(rng.expovariate(1 / self.args.think_time))
+
+    async def sample_pool(self) -> None:
+        while time.monotonic() < self.deadline:
+            started = time.perf_counter()
+            try:
+                response = await self.client.get("/health")
+                pool = response.json()["database_pool"]
+            except (httpx.HTTPError, KeyError, ValueError):
+                pool = None
+            if pool is not None:
+                self.pool_samples.append(
+                    PoolSample(
+                        checked_out=pool["checked_out"],
+                        capacity=pool["capacity"],
+                        health_latency=time.perf_counter() - started,
+                    )
+                )
+            await asyncio.sleep(self.args.sample_interval)
+
+    async def run(self) -> float:
+        started = time.monotonic()
+        self.deadline = started + self.args.duration
+        await asyncio.gather(
+            self.sample_pool(),
+            *(self.virtual_user(index) for index in range(self.args.users)),
+        )
+        return time.monotonic() - started
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not values:
+        return 0.0
+    rank = math.ceil(fraction * len(values)) - 1
+    return values[max(0, min(len(values) - 1, rank))]
+
+
+def summarize(test: LoadTest, elapsed: float) -> Dict[str, Any]:
+    endpoints = {}
+    for name, stats in sorted(test.stats.items()):
+        latencies = sorted(stats.latencies)
+        endpoints[name] = {
+            "requests": stats.requests,
+            "throughput_rps": round(stats.requests / elapsed, 2),
+            "error_rate": round(stats.errors / stats.requests, 4),
+            "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+            "p95_ms": round(percentile(latencies, 0.95) * 1000, 1),
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+            "statuses": dict(stats.statuses),
+        }
+
+    samples = test.pool_samples
+    health = sorted(sample.health_latency for sample in samples)
+    pool = {
+        "samples": len(samples),
+        "capacity": samples[-1].capacity if samples else 0,
+        "max_checked_out": max((s.checked_out for s in samples), default=0),
+        "mean_checked_out": round(
+            statistics.fmean(s.checked_out for s in samples) if samples else 0, 2
+        ),
+        "saturated_share": round(
+            (
+                sum(s.checked_out >= s.capacity for s in samples) / len(samples)
+                if samples
+                else 0
+            ),
+            4,
+        ),
+    }
+    event_loop = {
+        "health_p50_ms": round(percentile(health, 0.50) * 1000, 1),
+        "health_p99_ms": round(percentile(health, 0.99) * 1000, 1),
+        "health_max_ms": round(health[-1] * 1000, 1) if health else 0.0,
+    }
+
+    total = sum(stats.requests for stats in test.stats.values())
+    errors = sum(stats.errors for stats in test.stats.values())
+    return {
+        "users": test.args.users,
+        "duration_s": round(elapsed, 1),
+        "requests": total,
+        "throughput_rps": round(total / elapsed, 2),
+        "error_rate": round(errors / total, 4) if total else 0.0,
+        "endpoints": endpoints,
+        "pool": pool,
+        "event_loop": event_loop,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"{report['users']} users, {report['duration_s']}s: "
+        f"{report['requests']} requests, {report['throughput_rps']} req/s, "
+        f"{report['error_rate']:.2%} errors"
+    )
+    print(
+        f"{'endpoint':<22}{'reqs':>7}{'req/s':>9}{'err':>8}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    )
+    for name, row in report["endpoints"].items():
+        print(
+            f"{name:<22}{row['requests']:>7}{row['throughput_rps']:>9}"
+            f"{row['error_rate']:>8.1%}{row['p50_ms']:>10}{row['p95_ms']:>10}"
+            f"{row['p99_ms']:>10}"
+        )
+
+    pool = report["pool"]
+    print(
+        f"pool: max {pool['max_checked_out']}/{pool['capacity']} checked out, "
+        f"mean {pool['mean_checked_out']}, saturated in "
+        f"{pool['saturated_share']:.1%} of {pool['samples']} samples"
+    )
+    loop = report["event_loop"]
+    print(
+        f"event loop (/health latency): p50 {loop['health_p50_ms']} ms, "
+        f"p99 {loop['health_p99_ms']} ms, max {loop['health_max_ms']} ms"
+    )
+
+
+async def run_load_test(args: argparse.Namespace) -> Dict[str, Any]:
+    limits = httpx.Limits(max_connections=args.users + 1)
+    async with httpx.AsyncClient(
+        base_url=args.base_url, timeout=args.timeout, limits=limits
+    ) as client:
+        test = LoadTest(client, args)
+        elapsed = await test.run()
+    return summarize(test, elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--users", type=int, default=20, help="Concurrent families")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds")
+    parser.add_argument(
+        "--ramp-up", type=float, default=5.0, help="Seconds to start every user"
+    )
+    parser.add_argument(
+        "--think-time", type=float, default=1.0, help="Mean pause between steps"
+    )
+    parser.add_argument(
+        "--families",
+        type=int,
+        default=1_000,
+        help="Generated families to spread users over",
+    )
+    parser.add_argument("--first-family", type=int, default=0)
+    parser.add_argument("--password", default="load-test-password")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--sample-interval", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Also write the report as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load_test(args))
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Helpers for capturing repository SQL and reading EXPLAIN plans."""
+
+import json
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from svc.app.database import engine
+
+
+@contextmanager
+def captured_statements():
+    """Collect the SQL the repository sends to the driver."""
+    statements = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+
+def capture_queries(db: Session, call: Callable[[], object]) -> List[Tuple[str, Any]]:
+    """Run a repository call and return every statement it executed."""
+    with captured_statements() as statements:
+        call()
+    db.expunge_all()
+    return statements
+
+
+def explain(db: Session, statement: str, parameters, analyze: bool = False) -> Dict:
+    """Return the top-level JSON plan for a captured statement."""
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+    result = (
+        db.connection()
+        .exec_driver_sql(f"EXPLAIN ({options}) {statement}", parameters)
+        .scalar()
+    )
+    plan = json.loads(result) if isinstance(result, str) else result
+    return plan[0]
+
+
+def plan_nodes(plan: Dict) -> List[Dict]:
+    """Flatten a plan tree into a list of nodes."""
+    nodes = [plan]
+    for child in plan.get("Plans", []):
+        nodes.extend(plan_nodes(child))
+    return nodes
+
+
+def indexes_used(plan: Dict) -> List[str]:
+    return sorted(
+        {node["Index Name"] for node in plan_nodes(plan) if "Index Name" in node}
+    )
@@ -1,12 +1,12 @@
-from sqlalchemy.orm import Session
 from sqlalchemy import select
+from sqlalchemy.orm import Session
 
+from svc.app.dal.activity_repository import ActivityRepository
 from svc.app.database import SessionLocal
-from svc.app.models.user import User
 from svc.app.models.kid import Kid
-from svc.app.models.activity import Activity
+from svc.app.models.user import User
+from svc.app.services.user_seeding_service import UserSeedingService
 from svc.app.utils.security import hash_password
-from svc.app.data.generic_activities import GENERIC_FAMILY_ACTIVITIES
 
 
 async def seed_demo_data():
@@ -30,42 +30,16 @@ async def seed_demo_data():
         db.add(demo_user)
         db.flush()  # Get the user ID
 
-        # Create demo activities with flexible assignment
-        activities = [
-            Activity(
-                title=a.title,
-                description=a.description,
-                done=a.done,
-                assigned_to_kid_id=a.assigned_to_kid_id,
-                costs=a.costs,
-                durations=a.durations,
-                participants=a.participants,
-                locations=a.locations,
-                seasons=a.seasons,
-                age_groups=a.age_groups,
-                frequency=a.frequency,
-                themes=a.themes,
-                activity_types=a.activity_types,
-                user_id=demo_user.id  # override here
-            )
-            for a in GENERIC_FAMILY_ACTIVITIES
-        ]
-
-        db.add_all(activities)
         db.commit()
 
+        # Demo activities come from the shared catalog every family sees
+        activity_count = UserSeedingService(
+            ActivityRepository(db)
+        ).sync_activity_catalog()
+
         print("✅ Demo data seeded successfully!")
         print("Demo login: demo@homeschool.app / demo123")
-        print(f"Created {len(activities)} activities:")
-
-        # Print summary of created activities
-        family_activities = [a for a in activities if a.assigned_to_kid_id is None]
-        # ava_activities = [a for a in activities if a.assigned_to_kid_id == ava.id]
-        # ben_activities = [a for a in activities if a.assigned_to_kid_id == ben.id]
-
-        print(f"  - {len(family_activities)} family activities")
-        # print(f"  - {len(ava_activities)} activities for Ava")
-        # print(f"  - {len(ben_activities)} activities for Ben")
+        print(f"Synced {activity_count} catalog activities")
 
     except Exception as e:
         db.rollback()
@@ -1,9 +1,36 @@
 from functools import lru_cache
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+ALLOWED_LLM_MODELS = [
+    "gpt-4.1",
+    "gpt-4.1-mini",
+    "gpt-4.1-nano",
+    "gpt-4o",
+    "gpt-4o-mini",
+    "gpt-4-turbo",
+    "gpt-4",
+    "gpt-3.5-turbo",
+    "openai/gpt-4.1",
+    "openai/gpt-4.1-mini",
+    "openai/gpt-4.1-nano",
+    "openai/gpt-4o",
+    "openai/gpt-4o-mini",
+    "deepseek/deepseek-chat-v3.1:free",
+    "tngtech/deepseek-r1t-chimera:free",
+    "qwen/qwen3-coder:free",
+]
+
+
+class LLMLimits(BaseModel):
+    """Provider limits for one model, enforced per process."""
+
+    max_concurrency: int = Field(default=8, ge=1)
+    requests_per_minute: int = Field(default=500, ge=1)
+    tokens_per_minute: int = Field(default=200_000, ge=1)
+
 
 class Settings(BaseSettings):
     """Application settings."""
@@ -13,6 +40,20 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = Field(
         default=60 * 24 * 30, description="Access token expiration in minutes"
     )
+    bcrypt_rounds: int = Field(
+        default=12,
+        description="bcrypt work factor; hashes at another cost are upgraded on login",
+        ge=4,
+        le=31,
+    )
+    password_hash_workers: int = Field(
+        default=2, description="Threads dedicated to password hashing", ge=1
+    )
+    password_hash_max_queue: int = Field(
+        default=32,
+        description="Password hashes allowed to wait for a thread before returning 503",
+        ge=0,
+    )
 
     # Google Auth
     google_client_id: str = Field(default="unused")
@@ -27,6 +68,50 @@ class Settings(BaseSettings):
         description="Database connection URL",
     )
 
+    # Caching
+    family_profile_cache_ttl_seconds: float = Field(
+        default=300.0,
+        description="How long an assembled family profile is cached (0 disables)",
+        ge=0,
+    )
+    family_profile_cache_max_entries: int = Field(
+        default=10_000, description="Maximum number of cached family profiles", ge=0
+    )
+    principal_cache_ttl_seconds: float = Field(
+        default=60.0,
+        description="How long an authenticated user is cached per token (0 disables)",
+        ge=0,
+    )
+    principal_cache_max_entries: int = Field(
+        default=10_000, description="Maximum number of cached principals", ge=0
+    )
+
+    # Tracing
+    tracing_exporter: str = Field(
+        default="none",
+        description="Where spans go: none, console, file or otlp "
+        "(OTLP endpoint from OTEL_EXPORTER_OTLP_ENDPOINT)",
+    )
+    tracing_file_path: str = Field(
+        default="traces.jsonl", description="File spans are appended to (file exporter)"
+    )
+    tracing_service_name: str = Field(
+        default="homeschool-api", description="service.name reported on spans"
+    )
+
+    # Query monitoring
+    repeated_query_threshold: int = Field(
+        default=10,
+        description="Warn when a request runs one statement shape this often "
+        "(likely an N+1; 0 disables)",
+        ge=0,
+    )
+    query_count_threshold: int = Field(
+        default=100,
+        description="Warn when a request runs more statements than this (0 disables)",
+        ge=0,
+    )
+
     # CORS
     cors_origins: str = Field(
         default="http://localhost:5173,http://localhost:3000",
@@ -59,17 +144,63 @@ class Settings(BaseSettings):
         le=2.0,
     )
     llm_max_retries: int = Field(
-        default=1,
+        default=2,
         description="Maximum number of retries for failed LLM requests",
         ge=0,
         le=5,
     )
+    llm_retry_base_delay_seconds: float = Field(
+        default=0.5,
+        description="Backoff before the first LLM retry; doubles per retry, jittered",
+        gt=0,
+    )
+    llm_retry_max_delay_seconds: float = Field(
+        default=10.0, description="Longest backoff between LLM retries", gt=0
+    )
+    llm_retry_budget: int = Field(
+        default=4,
+        description="Retries shared by all LLM calls made for one request",
+        ge=0,
+    )
+    llm_hedging_enabled: bool = Field(
+        default=True,
+        description="Send a duplicate of latency-critical LLM calls that run "
+        "past the service's p95 latency",
+    )
+    llm_hedge_min_samples: int = Field(
+        default=20,
+        description="Completed calls needed before a service's p95 is trusted",
+        ge=1,
+    )
     llm_timeout: float = Field(
         default=30.0, description="Timeout in seconds for LLM requests", gt=0
     )
     llm_enabled: bool = Field(
         default=True, description="Whether LLM features are enabled"
     )
+    llm_limits: LLMLimits = Field(
+        default_factory=LLMLimits,
+        description="Default LLM limits per model, as JSON in LLM_LIMITS",
+    )
+    llm_model_limits: Dict[str, LLMLimits] = Field(
+        default_factory=dict,
+        description="Limits for specific models, e.g. "
+        '{"gpt-4o": {"requests_per_minute": 100, "tokens_per_minute": 30000}}',
+    )
+    llm_routes: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description="Models to try in order for each LLM call type, e.g. "
+        '{"planner_batch": ["gpt-4o-mini", "gpt-4o"], "planner_final": ["gpt-4o"]}; '
+        "call types not listed use llm_model",
+    )
+    llm_usage_batch_size: int = Field(
+        default=100, description="LLM usage rows written per INSERT batch", ge=1
+    )
+    llm_usage_flush_interval_seconds: float = Field(
+        default=5.0,
+        description="Longest time LLM usage waits in memory before being written",
+        gt=0,
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -80,26 +211,38 @@ class Settings(BaseSettings):
     @field_validator("environment")
     def validate_environment(cls, v: str) -> str:
         """Validate environment setting."""
-        allowed_environments = ["development", "staging", "production"]
+        allowed_environments = ["development", "test", "staging", "production"]
         if v not in allowed_environments:
             raise ValueError(f"Environment must be one of: {allowed_environments}")
         return v
 
+    @field_validator("tracing_exporter")
+    def validate_tracing_exporter(cls, v: str) -> str:
+        """Validate tracing exporter setting."""
+        allowed_exporters = ["none", "console", "file", "otlp"]
+        if v not in allowed_exporters:
+            raise ValueError(f"Tracing exporter must be one of: {allowed_exporters}")
+        return v
+
     @field_validator("llm_model")
     def validate_llm_model(cls, v: str) -> str:
         """Validate LLM model setting."""
-        allowed_models = [
-            "gpt-4o",
-            "gpt-4o-mini",
-            "gpt-4-turbo",
-            "gpt-4",
-            "gpt-3.5-turbo",
-            "deepseek/deepseek-chat-v3.1:free",
-            "tngtech/deepseek-r1t-chimera:free",
-            "qwen/qwen3-coder:free",
-        ]
-        if v not in allowed_models:
-            raise ValueError(f"LLM model must be one of: {allowed_models}")
+        if v not in ALLOWED_LLM_MODELS:
+            raise ValueError(f"LLM model must be one of: {ALLOWED_LLM_MODELS}")
+        return v
+
+    @field_validator("llm_routes")
+    def validate_llm_routes(cls, v: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Validate that every routed model is allowed."""
+        for call_type, models in v.items():
+            if not models:
+                raise ValueError(f"LLM route for {call_type} has no models")
+            for model in models:
+                if model not in ALLOWED_LLM_MODELS:
+                    raise ValueError(
+                        f"LLM model {model} for {call_type} must be one of: "
+                        f"{ALLOWED_LLM_MODELS}"
+                    )
         return v
 
     @model_validator(mode="after")
@@ -114,6 +257,11 @@ class Settings(BaseSettings):
         """Check if running in development mode."""
         return self.environment == "development"
 
+    @property
+    def is_test(self) -> bool:
+        """Check if running under tests."""
+        return self.environment == "test"
+
     @property
     def is_production(self) -> bool:
         """Check if running in production mode."""
@@ -124,6 +272,14 @@ class Settings(BaseSettings):
         """Check if LLM features are available."""
         return self.llm_enabled and bool(self.openai_api_key)
 
+    def llm_limits_for(self, model: str) -> LLMLimits:
+        """Get the limits that apply to a model."""
+        return self.llm_model_limits.get(model, self.llm_limits)
+
+    def llm_models_for(self, call_type: str) -> List[str]:
+        """Get the models to try for a call type, cheapest first."""
+        return self.llm_routes.get(call_type) or [self.llm_model]
+
     @property
     def cors_origins_list(self) -> List[str]:
         """Get CORS origins as a list."""
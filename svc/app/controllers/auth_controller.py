@@ -21,7 +21,7 @@ async def login(
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
 ):
     """Authenticate user and return access token."""
-    return auth_service.login(login_data)
+    return await auth_service.login(login_data)
 
 
 @router.post(
@@ -32,7 +32,7 @@ async def register(
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
 ):
     """Register new user and return access token."""
-    return auth_service.register(register_data)
+    return await auth_service.register(register_data)
 
 
 @router.get("/me", response_model=UserResponse, status_code=status.HTTP_200_OK)
@@ -2,12 +2,12 @@ from typing import Any, Dict
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
+from svc.app.datatypes.auth import AuthenticatedUser
 from svc.app.datatypes.family_preference import (
     FamilyPreferenceResponse,
     FamilyPreferenceUpdateRequest,
 )
 from svc.app.dependencies import get_current_user, get_family_preference_service
-from svc.app.models.user import User
 from svc.app.services.family_preference_service import FamilyPreferenceService
 
 router = APIRouter(prefix="/api/v1/family", tags=["Family Preferences"])
@@ -15,7 +15,7 @@ router = APIRouter(prefix="/api/v1/family", tags=["Family Preferences"])
 
 @router.get("/preferences", response_model=FamilyPreferenceResponse)
 def get_family_preferences(
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     service: FamilyPreferenceService = Depends(get_family_preference_service),
 ) -> FamilyPreferenceResponse:
     """
@@ -37,7 +37,7 @@ def get_family_preferences(
 @router.put("/preferences", response_model=FamilyPreferenceResponse)
 def update_family_preferences(
     request: FamilyPreferenceUpdateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     service: FamilyPreferenceService = Depends(get_family_preference_service),
 ) -> FamilyPreferenceResponse:
     """
@@ -63,7 +63,7 @@ def update_family_preferences(
 @router.patch("/preferences", response_model=FamilyPreferenceResponse)
 def partial_update_family_preferences(
     request: Dict[str, Any],
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     service: FamilyPreferenceService = Depends(get_family_preference_service),
 ) -> FamilyPreferenceResponse:
     """
@@ -87,7 +87,7 @@ def partial_update_family_preferences(
 
 @router.delete("/preferences")
 def reset_family_preferences(
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     service: FamilyPreferenceService = Depends(get_family_preference_service),
 ) -> Dict[str, str]:
     """
@@ -1,9 +1,16 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
+from svc.app.datatypes.llm_usage import LLMUsageResponse
 from svc.app.datatypes.user import UserResponse, UserUpdate
-from svc.app.dependencies import CurrentUser, get_current_user, get_user_service
+from svc.app.dependencies import (
+    CurrentUser,
+    get_current_user,
+    get_llm_usage_service,
+    get_user_service,
+)
+from svc.app.services.llm_usage_service import LLMUsageService
 from svc.app.services.user_service import UserService
 
 router = APIRouter(tags=["users"])
@@ -18,6 +25,18 @@ async def get_user_profile(
     return user_service.get_user_profile(current_user.id)
 
 
+@router.get(
+    "/llm-usage", response_model=LLMUsageResponse, status_code=status.HTTP_200_OK
+)
+async def get_llm_usage(
+    current_user: CurrentUser,
+    llm_usage_service: Annotated[LLMUsageService, Depends(get_llm_usage_service)],
+    days: int = Query(30, ge=1, le=366, description="Days to report, incl. today"),
+):
+    """Get current user's LLM token usage per day and call type."""
+    return llm_usage_service.get_usage(current_user.id, days)
+
+
 @router.get("/{user_id}", response_model=UserResponse, status_code=status.HTTP_200_OK)
 async def get_user(
     user_id: int,
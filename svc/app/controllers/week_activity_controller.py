@@ -9,6 +9,7 @@ from svc.app.datatypes.week_activity import (
     WeekActivityCreate,
     WeekActivityResponse,
     WeekActivityUpdate,
+    WeekStats,
     WeekSummary,
 )
 from svc.app.dependencies import (
@@ -72,28 +73,13 @@ async def plan_week_activities(
         )
         week_activity_assignments.append(assignment)
 
-    # Bulk create the week activities
+    # Upsert in one statement; activities already planned for the week keep
+    # their progress and just get the new LLM notes
     bulk_data = BulkWeekActivityCreate(assignments=week_activity_assignments)
-
-    try:
-        created_activities = week_service.bulk_create_week_activities(
-            current_user.id, bulk_data
-        )
-
-        return created_activities
-
-    except Exception as e:
-        # If bulk creation fails, try individual creation to handle conflicts gracefully
-        successfully_created = []
-        for assignment in week_activity_assignments:
-            try:
-                created = week_service.create_week_activity(current_user.id, assignment)
-                successfully_created.append(created)
-            except Exception:
-                # Skip activities that couldn't be created (e.g., already exist)
-                continue
-
-        return successfully_created
+    result = week_service.upsert_week_activities(
+        current_user.id, bulk_data, skip_missing=True
+    )
+    return result.created + result.updated
 
 
 @router.post("/", response_model=WeekActivityResponse, status_code=201)
@@ -119,19 +105,21 @@ def update_week_activity(
 @router.post("/{week_activity_id}/toggle", response_model=WeekActivityResponse)
 def toggle_week_activity(
     week_activity_id: int,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     service: WeekActivityService = Depends(get_week_activity_service),
 ):
     """Toggle the completion status of a week activity."""
-    return service.toggle_week_activity(week_activity_id)
+    return service.toggle_week_activity(week_activity_id, user_id=current_user.id)
 
 
 @router.post("/bulk", response_model=List[WeekActivityResponse], status_code=201)
 def bulk_create_week_activities(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     bulk_data: BulkWeekActivityCreate,
     service: WeekActivityService = Depends(get_week_activity_service),
 ):
     """Create multiple week activity assignments at once."""
-    return service.bulk_create_week_activities(bulk_data)
+    return service.bulk_create_week_activities(current_user.id, bulk_data)
 
 
 @router.get("/current", response_model=List[WeekActivityResponse])
@@ -166,10 +154,35 @@ def get_week_summary(
     week: Optional[int] = Query(
         None, description="Week number (defaults to current week)"
     ),
+    include_activities: bool = Query(
+        True, description="Include the week's activities alongside the stats"
+    ),
     service: WeekActivityService = Depends(get_week_activity_service),
 ):
     """Get a summary of activities for a specific week with completion stats."""
-    return service.get_week_summary(year=year, week=week, user_id=current_user.id)
+    return service.get_week_summary(
+        year=year,
+        week=week,
+        user_id=current_user.id,
+        include_activities=include_activities,
+    )
+
+
+@router.get("/trends", response_model=List[WeekStats])
+def get_week_trends(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    start_date: Optional[date] = Query(
+        None, description="First day of the range (defaults to 11 weeks before end)"
+    ),
+    end_date: Optional[date] = Query(
+        None, description="Last day of the range (defaults to today)"
+    ),
+    service: WeekActivityService = Depends(get_week_activity_service),
+):
+    """Get per-week completion stats for a date range."""
+    return service.get_week_trends(
+        user_id=current_user.id, start_date=start_date, end_date=end_date
+    )
 
 
 @router.get("/weeks", response_model=List[dict])
@@ -1,8 +1,10 @@
 from typing import List, Optional
 
 from svc.app.models.activity import Activity
+from svc.app.utils.tracing import trace_methods
 
 
+@trace_methods
 class ActivityManager:
     """Helper class for activity-related database operations."""
 
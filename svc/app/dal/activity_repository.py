@@ -1,9 +1,10 @@
-from typing import List, Optional, Sequence, cast
+from typing import Dict, List, Optional, Sequence, cast
 
-from sqlalchemy import and_, select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, case, delete, exists, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, aliased, joinedload
 
-from svc.app.dal.base_repository import BaseRepository
+from svc.app.dal.base_repository import BaseRepository, read_only
 from svc.app.datatypes.enums import (
     AgeGroup,
     Cost,
@@ -12,7 +13,7 @@ from svc.app.datatypes.enums import (
     Participants,
     Season,
 )
-from svc.app.models.activity import Activity
+from svc.app.models.activity import CATALOG_CONTENT_COLUMNS, Activity
 
 
 class ActivityRepository(BaseRepository[Activity]):
@@ -21,15 +22,161 @@ class ActivityRepository(BaseRepository[Activity]):
     def __init__(self, db: Session):
         super().__init__(db, Activity)
 
+    # ---------------------------
+    # Shared catalog / family overlays
+    # ---------------------------
+    @staticmethod
+    def visible_to(user_id: int):
+        """Criterion for a family's merged view of activities.
+
+        A family sees its own (non-hidden) rows plus every catalog row it has
+        not overlaid with a row of its own.
+        """
+        overlay = aliased(Activity)
+        return or_(
+            and_(Activity.user_id == user_id, Activity.hidden.is_(False)),
+            and_(
+                Activity.user_id.is_(None),
+                ~exists().where(
+                    overlay.user_id == user_id,
+                    overlay.catalog_activity_id == Activity.id,
+                ),
+            ),
+        )
+
+    def sync_catalog(self, activities_data: List[dict]) -> int:
+        """Insert or refresh the shared catalog, matching entries by title."""
+        if not activities_data:
+            return 0
+
+        statement = pg_insert(Activity).values(
+            [
+                {column: data.get(column) for column in CATALOG_CONTENT_COLUMNS}
+                for data in activities_data
+            ]
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[Activity.title],
+            index_where=Activity.user_id.is_(None),
+            set_={
+                column: statement.excluded[column]
+                for column in CATALOG_CONTENT_COLUMNS
+                if column != "title"
+            },
+        )
+        result = self.db.execute(statement)
+        self.db.commit()
+        return result.rowcount
+
+    def materialize_for_user(
+        self, activity_ids: List[int], user_id: int
+    ) -> Dict[int, Activity]:
+        """Map activity ids to rows the family owns, creating catalog overlays.
+
+        The family's own rows are returned as they are. For catalog ids a
+        single INSERT ... SELECT ... ON CONFLICT creates (or returns) the
+        family's overlay; a hidden placeholder left by hide_for_user is un-hidden
+        and refilled from the catalog. Ids that are neither are left out.
+        """
+        if not activity_ids:
+            return {}
+
+        requested_ids = set(activity_ids)
+        activities_by_id = {
+            activity.id: activity
+            for activity in self.db.execute(
+                select(Activity).where(
+                    Activity.id.in_(requested_ids),
+                    Activity.user_id == user_id,
+                    Activity.hidden.is_(False),
+                )
+            ).scalars()
+        }
+
+        catalog_ids = requested_ids - activities_by_id.keys()
+        if catalog_ids:
+            catalog = aliased(Activity)
+            statement = pg_insert(Activity).from_select(
+                ["user_id", "catalog_activity_id", "done", *CATALOG_CONTENT_COLUMNS],
+                select(
+                    literal(user_id),
+                    catalog.id,
+                    literal(False),
+                    *(getattr(catalog, column) for column in CATALOG_CONTENT_COLUMNS),
+                ).where(catalog.id.in_(catalog_ids), catalog.user_id.is_(None)),
+            )
+            # Visible overlays keep the family's edits; placeholders hold only a title
+            restored = {
+                column: case(
+                    (Activity.hidden.is_(True), statement.excluded[column]),
+                    else_=getattr(Activity, column),
+                )
+                for column in CATALOG_CONTENT_COLUMNS
+            }
+            statement = statement.on_conflict_do_update(
+                index_elements=[Activity.user_id, Activity.catalog_activity_id],
+                set_={**restored, "hidden": False, "updated_at": func.now()},
+            ).returning(Activity)
+            overlays = self.db.scalars(
+                statement, execution_options={"populate_existing": True}
+            ).all()
+            self._commit_without_expiring()
+            activities_by_id.update(
+                (overlay.catalog_activity_id, overlay) for overlay in overlays
+            )
+
+        return activities_by_id
+
+    def hide_for_user(self, catalog_activity_id: int, user_id: int) -> bool:
+        """Remove a catalog activity from a family's view.
+
+        Any overlay (and, through it, the family's schedule entries for it) is
+        replaced by a hidden placeholder overlay.
+        """
+        self.db.execute(
+            delete(Activity).where(
+                Activity.user_id == user_id,
+                Activity.catalog_activity_id == catalog_activity_id,
+            )
+        )
+        catalog = aliased(Activity)
+        result = self.db.execute(
+            pg_insert(Activity).from_select(
+                ["user_id", "catalog_activity_id", "done", "hidden", "title"],
+                select(
+                    literal(user_id),
+                    catalog.id,
+                    literal(False),
+                    literal(True),
+                    catalog.title,
+                ).where(catalog.id == catalog_activity_id, catalog.user_id.is_(None)),
+            )
+        )
+        self.db.commit()
+        return result.rowcount > 0
+
+    def reset_overlays(self, user_id: int, keep_completed: bool = True) -> int:
+        """Drop a family's catalog overlays so the catalog versions show again."""
+        criteria = [
+            Activity.user_id == user_id,
+            Activity.catalog_activity_id.is_not(None),
+        ]
+        if keep_completed:
+            criteria.append(or_(Activity.hidden.is_(True), Activity.done.is_(False)))
+        result = self.db.execute(delete(Activity).where(*criteria))
+        self.db.commit()
+        return result.rowcount
+
     # ---------------------------
     # Standard CRUD / helper methods
     # ---------------------------
+    @read_only
     def get_by_parent_id(self, parent_id: int) -> Sequence[Activity]:
-        """Get all activities for a parent."""
+        """Get all activities a parent sees: their own plus the shared catalog."""
         return (
             self.db.execute(
                 select(Activity)
-                .where(Activity.user_id == parent_id)
+                .where(self.visible_to(parent_id))
                 .options(joinedload(Activity.user))
             )
             .scalars()
@@ -77,12 +224,12 @@ class ActivityRepository(BaseRepository[Activity]):
 
         return activities
 
-    def toggle_done_status(self, activity_id: int) -> Optional[Activity]:
-        """Toggle the done status of an activity."""
-        activity = self.get(activity_id)
-        if activity:
-            return self.update(activity_id, {"done": not activity.done})
-        return None
+    def toggle_done_status(
+        self, activity_id: int, parent_id: Optional[int] = None
+    ) -> Optional[Activity]:
+        """Flip the done status of an activity in a single UPDATE ... RETURNING."""
+        criteria = [Activity.user_id == parent_id] if parent_id is not None else []
+        return self.update_returning(activity_id, {"done": ~Activity.done}, *criteria)
 
     def get_completed_count_by_parent(self, parent_id: int) -> int:
         """Get count of completed activities for a parent/family."""
@@ -91,16 +238,17 @@ class ActivityRepository(BaseRepository[Activity]):
     def get_activity_by_parent(
         self, activity_id: int, parent_id: int
     ) -> Optional[Activity]:
-        """Get activity by ID and parent ID for security."""
+        """Get an activity from the parent's merged view, for security."""
         return self.db.execute(
             select(Activity)
-            .where(Activity.id == activity_id, Activity.user_id == parent_id)
+            .where(Activity.id == activity_id, self.visible_to(parent_id))
             .options(joinedload(Activity.user))
         ).scalar_one_or_none()
 
     # ---------------------------
     # Flexible filter method
     # ---------------------------
+    @read_only
     def filter_activities(
         self,
         parent_id: int,
@@ -135,15 +283,17 @@ class ActivityRepository(BaseRepository[Activity]):
         if activity_types:
             filters.append(Activity.activity_types.overlap(activity_types))
 
-        query = self.db.query(Activity).filter(Activity.user_id == parent_id).distinct()
+        query = self.db.query(Activity).filter(self.visible_to(parent_id)).distinct()
 
         if filters:
             query = query.filter(and_(*filters))
 
         return cast(List[Activity], query.all())
 
+    @read_only
     def get_filtered_activities(
         self,
+        user_id: Optional[int] = None,
         user_location: Optional[tuple[float, float]] = None,
         max_distance: Optional[int] = None,
         age_ranges: Optional[List[tuple[int, int]]] = None,
@@ -152,8 +302,14 @@ class ActivityRepository(BaseRepository[Activity]):
         cost_ranges: Optional[List[str]] = None,
         exclude_ids: Optional[List[int]] = None,
     ) -> List[Activity]:
-        """Get activities filtered by family profile criteria."""
+        """Get activities filtered by family profile criteria.
+
+        With a user_id only that family's merged view is searched; without
+        one every activity is.
+        """
         query = self.db.query(Activity)
+        if user_id is not None:
+            query = query.filter(self.visible_to(user_id))
 
         # Location filtering (if activity has location)
         if user_location:
@@ -4,7 +4,7 @@ from typing import List, Optional
 from sqlalchemy import and_, desc
 from sqlalchemy.orm import Session, joinedload
 
-from svc.app.dal.base_repository import BaseRepository
+from svc.app.dal.base_repository import BaseRepository, read_only
 from svc.app.models.activity_suggestion import ActivitySuggestion
 
 
@@ -12,6 +12,7 @@ class ActivitySuggestionRepository(BaseRepository):
     def __init__(self, db: Session):
         super().__init__(db, ActivitySuggestion)
 
+    @read_only
     def get_user_suggestions(
         self, user_id: int, lookback_weeks: int = 8, include_activity_data: bool = True
     ) -> List[ActivitySuggestion]:
@@ -53,6 +54,7 @@ class ActivitySuggestionRepository(BaseRepository):
         self.db.commit()
         return suggestion
 
+    @read_only
     def get_activity_suggestion_stats(
         self, activity_id: int, user_id: Optional[int] = None
     ) -> dict:
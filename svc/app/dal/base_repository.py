@@ -1,15 +1,37 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from functools import wraps
+from typing import Any, Callable, Dict, Generic, List, Optional, Type, TypeVar
 
 from sqlalchemy import delete, func, select, update
 from sqlalchemy.orm import Session
 
-from svc.app.database import Base
+from svc.app.database import Base, replica_reads
+from svc.app.utils.tracing import trace_methods
 
 ModelType = TypeVar("ModelType", bound=Base)
+F = TypeVar("F", bound=Callable[..., Any])
 
 
+def read_only(method: F) -> F:
+    """Mark a repository method as safe to serve from a read replica."""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with replica_reads(self.db):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+@trace_methods
 class BaseRepository(Generic[ModelType]):
-    """Base repository with common CRUD operations."""
+    """Base repository with common CRUD operations.
+
+    Every public method, here and on subclasses, runs in its own tracing span.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        trace_methods(cls)
 
     def __init__(self, db: Session, model: Type[ModelType]):
         self.db = db
@@ -57,6 +79,15 @@ class BaseRepository(Generic[ModelType]):
         self.db.refresh(db_obj)
         return db_obj
 
+    def _commit_without_expiring(self) -> None:
+        """Commit but keep loaded attributes, so returned objects need no reload."""
+        expire_on_commit = self.db.expire_on_commit
+        self.db.expire_on_commit = False
+        try:
+            self.db.commit()
+        finally:
+            self.db.expire_on_commit = expire_on_commit
+
     def update(self, id: Any, obj_in: Dict[str, Any]) -> Optional[ModelType]:
         """Update an existing record."""
         # Remove None values to avoid updating fields to None
@@ -65,11 +96,30 @@ class BaseRepository(Generic[ModelType]):
         if not update_data:
             return self.get(id)
 
-        self.db.execute(
-            update(self.model).where(self.model.id == id).values(**update_data)
-        )
-        self.db.commit()
-        return self.get(id)
+        return self.update_returning(id, update_data)
+
+    def update_returning(
+        self, id: Any, values: Dict[str, Any], *criteria: Any
+    ) -> Optional[ModelType]:
+        """Update a record and return it in one UPDATE ... RETURNING round trip.
+
+        ``values`` may hold SQL expressions (e.g. ``~Model.done``), which are
+        evaluated against the current row, so concurrent updates cannot race.
+        Extra ``criteria`` (such as an owner check) are ANDed into the WHERE
+        clause; None is returned when no row matches.
+        """
+        db_obj = self.db.execute(
+            update(self.model)
+            .where(self.model.id == id, *criteria)
+            .values(**values)
+            .returning(self.model),
+            execution_options={
+                "synchronize_session": False,
+                "populate_existing": True,
+            },
+        ).scalar_one_or_none()
+        self._commit_without_expiring()
+        return db_obj
 
     def delete(self, id: Any) -> bool:
         """Delete a record by ID."""
@@ -1,17 +1,28 @@
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+from sqlalchemy import ColumnElement, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from svc.app.dal.base_repository import BaseRepository
 from svc.app.models.family_preference import FamilyPreference
+from svc.app.utils import events
 
+# Columns a caller may set; keys and timestamps are managed by the repository
+PREFERENCE_COLUMNS = frozenset(
+    column.key
+    for column in FamilyPreference.__table__.columns
+    if column.key not in {"id", "user_id", "created_at", "updated_at"}
+)
 
-class FamilyPreferenceRepository:
+
+class FamilyPreferenceRepository(BaseRepository[FamilyPreference]):
     """Repository for family preference data access operations."""
 
     def __init__(self, db: Session):
-        self.db = db
+        super().__init__(db, FamilyPreference)
 
     def get_by_user_id(self, user_id: int) -> Optional[FamilyPreference]:
         """
@@ -29,7 +40,9 @@ class FamilyPreferenceRepository:
             .first()
         )
 
-    def create(self, user_id: int, preference_data: Dict[str, Any]) -> FamilyPreference:
+    def create_for_user(
+        self, user_id: int, preference_data: Dict[str, Any]
+    ) -> FamilyPreference:
         """
         Create new family preferences.
 
@@ -46,6 +59,7 @@ class FamilyPreferenceRepository:
             )
             self.db.add(preference)
             self.db.commit()
+            events.publish(events.FAMILY_PROFILE_CHANGED, user_id=user_id)
             self.db.refresh(preference)
 
             return preference
@@ -68,26 +82,10 @@ class FamilyPreferenceRepository:
             Updated FamilyPreference instance or None if not found
         """
         try:
-            preference = (
-                self.db.query(FamilyPreference)
-                .filter(FamilyPreference.id == preference_id)
-                .first()
+            return self._update_where(
+                FamilyPreference.id == preference_id, preference_data
             )
 
-            if not preference:
-                return None
-
-            # Update fields
-            for field, value in preference_data.items():
-                if hasattr(preference, field):
-                    setattr(preference, field, value)
-
-            preference.updated_at = datetime.utcnow()
-            self.db.commit()
-            self.db.refresh(preference)
-
-            return preference
-
         except SQLAlchemyError as e:
             self.db.rollback()
             raise Exception(f"Failed to update family preferences: {str(e)}")
@@ -106,12 +104,9 @@ class FamilyPreferenceRepository:
             Updated FamilyPreference instance or None if not found
         """
         try:
-            preference = self.get_by_user_id(user_id)
-
-            if not preference:
-                return None
-
-            return self.update(preference.id, preference_data)
+            return self._update_where(
+                FamilyPreference.user_id == user_id, preference_data
+            )
 
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -125,6 +120,10 @@ class FamilyPreferenceRepository:
         """
         Create new preferences or update existing ones for a user.
 
+        Runs as a single INSERT ... ON CONFLICT (user_id) DO UPDATE, so
+        concurrent first saves cannot create duplicate rows. Only the
+        columns in preference_data are changed on an existing row.
+
         Args:
             user_id: The user's ID
             preference_data: Dictionary containing preference data
@@ -132,16 +131,7 @@ class FamilyPreferenceRepository:
         Returns:
             FamilyPreference instance (created or updated)
         """
-        existing_preference = self.get_by_user_id(user_id)
-
-        if existing_preference:
-            updated_preference = self.update_by_user_id(user_id, preference_data)
-            if updated_preference:
-                return updated_preference
-            else:
-                raise Exception(f"Failed to update preferences for user {user_id}")
-        else:
-            return self.create(user_id, preference_data)
+        return self._upsert(user_id, preference_data)
 
     def delete_by_user_id(self, user_id: int) -> bool:
         """
@@ -161,6 +151,7 @@ class FamilyPreferenceRepository:
 
             self.db.delete(preference)
             self.db.commit()
+            events.publish(events.FAMILY_PROFILE_CHANGED, user_id=user_id)
 
             return True
 
@@ -190,8 +181,10 @@ class FamilyPreferenceRepository:
             if not preference:
                 return False
 
+            user_id = preference.user_id
             self.db.delete(preference)
             self.db.commit()
+            events.publish(events.FAMILY_PROFILE_CHANGED, user_id=user_id)
 
             return True
 
@@ -233,3 +226,63 @@ class FamilyPreferenceRepository:
             .first()
             is not None
         )
+
+    def _upsert(
+        self, user_id: int, preference_data: Dict[str, Any]
+    ) -> FamilyPreference:
+        values = self._preference_values(preference_data)
+        insert = pg_insert(FamilyPreference).values(
+            user_id=user_id, updated_at=datetime.utcnow(), **values
+        )
+        statement = insert.on_conflict_do_update(
+            index_elements=[FamilyPreference.user_id],
+            set_={
+                column: insert.excluded[column] for column in [*values, "updated_at"]
+            },
+        ).returning(FamilyPreference)
+
+        try:
+            preference: FamilyPreference = self.db.scalars(
+                statement, execution_options={"populate_existing": True}
+            ).one()
+            self._commit_without_expiring()
+            events.publish(events.FAMILY_PROFILE_CHANGED, user_id=user_id)
+            return preference
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(
+                f"Failed to save family preferences for user {user_id}: {str(e)}"
+            )
+
+    def _update_where(
+        self, criterion: ColumnElement[bool], preference_data: Dict[str, Any]
+    ) -> Optional[FamilyPreference]:
+        statement = (
+            update(FamilyPreference)
+            .where(criterion)
+            .values(
+                updated_at=datetime.utcnow(),
+                **self._preference_values(preference_data),
+            )
+            .returning(FamilyPreference)
+        )
+        preference = self.db.scalars(
+            statement,
+            execution_options={
+                "synchronize_session": False,
+                "populate_existing": True,
+            },
+        ).one_or_none()
+        self._commit_without_expiring()
+        if preference is not None:
+            events.publish(events.FAMILY_PROFILE_CHANGED, user_id=preference.user_id)
+        return preference
+
+    @staticmethod
+    def _preference_values(preference_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            field: value
+            for field, value in preference_data.items()
+            if field in PREFERENCE_COLUMNS
+        }
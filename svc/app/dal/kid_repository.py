@@ -1,10 +1,12 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import and_, delete, func, select
 from sqlalchemy.orm import Session
 
-from svc.app.dal.base_repository import BaseRepository
+from svc.app.dal.base_repository import BaseRepository, read_only
+from svc.app.models.activity import Activity
 from svc.app.models.kid import Kid
+from svc.app.utils import events
 
 
 class KidRepository(BaseRepository[Kid]):
@@ -13,6 +15,7 @@ class KidRepository(BaseRepository[Kid]):
     def __init__(self, db: Session):
         super().__init__(db, Kid)
 
+    @read_only
     def get_by_parent_id(self, parent_id: int) -> List[Kid]:
         """Get all kids for a parent."""
         return (
@@ -27,8 +30,56 @@ class KidRepository(BaseRepository[Kid]):
             {"name": name, "color": color, "dob": dob, "parent_id": parent_id}
         )
 
+    def create(self, obj_in: Dict[str, Any]) -> Kid:
+        """Create a kid and invalidate the parent's cached family profile."""
+        kid = super().create(obj_in)
+        events.publish(events.FAMILY_PROFILE_CHANGED, user_id=kid.parent_id)
+        return kid
+
+    def update_returning(
+        self, id: Any, values: Dict[str, Any], *criteria: Any
+    ) -> Optional[Kid]:
+        """Update a kid and invalidate the parent's cached family profile."""
+        kid = super().update_returning(id, values, *criteria)
+        if kid is not None:
+            events.publish(events.FAMILY_PROFILE_CHANGED, user_id=kid.parent_id)
+        return kid
+
+    def delete(self, id: Any) -> bool:
+        """Delete a kid and invalidate the parent's cached family profile."""
+        parent_id = self.db.execute(
+            delete(Kid).where(Kid.id == id).returning(Kid.parent_id)
+        ).scalar_one_or_none()
+        self.db.commit()
+        if parent_id is None:
+            return False
+
+        events.publish(events.FAMILY_PROFILE_CHANGED, user_id=parent_id)
+        return True
+
     def get_kid_by_parent(self, kid_id: int, parent_id: int) -> Kid:
         """Get kid by ID and parent ID for security."""
         return self.db.execute(
             select(Kid).where(Kid.id == kid_id, Kid.parent_id == parent_id)
         ).scalar_one_or_none()
+
+    @read_only
+    def get_completed_counts_by_parent(
+        self, parent_id: int
+    ) -> List[tuple[int, str, int]]:
+        """Get (kid_id, kid_name, completed activity count) for all of a parent's kids."""
+        return [
+            tuple(row)
+            for row in self.db.execute(
+                select(Kid.id, Kid.name, func.count(Activity.id))
+                .outerjoin(
+                    Activity,
+                    and_(
+                        Activity.assigned_to_kid_id == Kid.id, Activity.done.is_(True)
+                    ),
+                )
+                .where(Kid.parent_id == parent_id)
+                .group_by(Kid.id, Kid.name)
+                .order_by(Kid.id)
+            ).all()
+        ]
@@ -0,0 +1,82 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, DefaultDict, Dict, List, Optional
+
+from sqlalchemy import Date, bindparam, cast, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from svc.app.dal.base_repository import BaseRepository, read_only
+from svc.app.models.llm_usage import LLMUsage
+from svc.app.models.user import User
+
+users = User.__table__
+
+# One executemany round trip debits every user in a batch; the arithmetic
+# happens in the UPDATE so concurrent workers cannot lose each other's debits
+DEBIT_TOKENS = (
+    update(users)
+    .where(
+        users.c.id == bindparam("debit_user_id"),
+        users.c.premium_subscription_tokens.is_not(None),
+    )
+    .values(
+        premium_subscription_tokens=func.greatest(
+            users.c.premium_subscription_tokens - bindparam("tokens"), 0
+        )
+    )
+)
+
+
+class LLMUsageRepository(BaseRepository):
+    def __init__(self, db: Session):
+        super().__init__(db, LLMUsage)
+
+    def record_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert usage rows and debit each user's token allowance in one transaction."""
+        if not rows:
+            return
+
+        self.db.execute(insert(LLMUsage), rows)
+
+        debits: DefaultDict[int, int] = defaultdict(int)
+        for row in rows:
+            if row["user_id"] is not None:
+                debits[row["user_id"]] += (
+                    row["prompt_tokens"] + row["completion_tokens"]
+                )
+        if debits:
+            self.db.execute(
+                DEBIT_TOKENS,
+                [
+                    {"debit_user_id": user_id, "tokens": tokens}
+                    for user_id, tokens in debits.items()
+                ],
+            )
+        self.db.commit()
+
+    @read_only
+    def get_daily_usage(self, user_id: int, since: datetime) -> List[Dict[str, Any]]:
+        """Calls, tokens and latency per UTC day and call type, oldest day first."""
+        day = cast(func.timezone("UTC", LLMUsage.created_at), Date).label("day")
+        rows = self.db.execute(
+            select(
+                day,
+                LLMUsage.call_type,
+                func.count().label("calls"),
+                func.sum(LLMUsage.prompt_tokens).label("prompt_tokens"),
+                func.sum(LLMUsage.completion_tokens).label("completion_tokens"),
+                func.sum(LLMUsage.cached_tokens).label("cached_tokens"),
+                func.count().filter(LLMUsage.cache_hit).label("cache_hits"),
+                func.avg(LLMUsage.latency_ms).label("avg_latency_ms"),
+            )
+            .where(LLMUsage.user_id == user_id, LLMUsage.created_at >= since)
+            .group_by(day, LLMUsage.call_type)
+            .order_by(day, LLMUsage.call_type)
+        ).all()
+        return [row._asdict() for row in rows]
+
+    @read_only
+    def get_remaining_tokens(self, user_id: int) -> Optional[int]:
+        return self.db.execute(
+            select(User.premium_subscription_tokens).where(User.id == user_id)
+        ).scalar_one_or_none()
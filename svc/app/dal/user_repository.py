@@ -1,10 +1,13 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
 
 from svc.app.dal.base_repository import BaseRepository
+from svc.app.database import primary_reads
 from svc.app.models.user import User
+from svc.app.utils import events
 
 
 class UserRepository(BaseRepository[User]):
@@ -46,8 +49,51 @@ class UserRepository(BaseRepository[User]):
 
         user.family_profile_updated_at = datetime.utcnow()
         self.db.commit()
+        events.publish(events.USER_CHANGED, user_id=user_id)
+        events.publish(events.FAMILY_PROFILE_CHANGED, user_id=user_id)
         return user
 
+    def update_returning(
+        self, id: Any, values: Dict[str, Any], *criteria: Any
+    ) -> Optional[User]:
+        """Update a user and invalidate their cached principal and family profile."""
+        user = super().update_returning(id, values, *criteria)
+        if user is not None:
+            events.publish(events.USER_CHANGED, user_id=user.id)
+            events.publish(events.FAMILY_PROFILE_CHANGED, user_id=user.id)
+        return user
+
+    def delete(self, id: Any) -> bool:
+        """Delete a user and invalidate their cached principal."""
+        deleted = super().delete(id)
+        if deleted:
+            events.publish(events.USER_CHANGED, user_id=id)
+        return deleted
+
+    def get_from_primary(self, user_id: int) -> Optional[User]:
+        """Get a user by ID, bypassing replica routing."""
+        with primary_reads(self.db):
+            return self.get(user_id)
+
+    def get_with_family(self, user_id: int) -> Optional[User]:
+        """Get a user with their kids and family preferences in one query.
+
+        Always read from the primary: the result feeds the family profile
+        cache, which must not be filled from a lagging replica.
+        """
+        with primary_reads(self.db):
+            return (
+                self.db.execute(
+                    select(User)
+                    .where(User.id == user_id)
+                    .options(joinedload(User.kids), joinedload(User.family_preferences))
+                    # Objects already in the session may hold stale relationships
+                    .execution_options(populate_existing=True)
+                )
+                .unique()
+                .scalar_one_or_none()
+            )
+
     def get_by_google_id(self, google_id: str) -> Optional[User]:
         """Get user by Google ID."""
         return self.get_by_field("google_id", google_id)
@@ -1,14 +1,18 @@
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from typing import List, Optional, Sequence
 
-from sqlalchemy import and_, func, select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Boolean, and_, case, func, literal_column, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, aliased, contains_eager, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from svc.app.dal.base_repository import BaseRepository
+from svc.app.dal.base_repository import BaseRepository, read_only
 from svc.app.datatypes.week_activity import (
     WeekActivityCreate,
     WeekActivityResponse,
     WeekActivityUpdate,
+    WeekStats,
     WeekSummary,
 )
 from svc.app.models.activity import Activity
@@ -22,26 +26,27 @@ class WeekActivityRepository(BaseRepository[WeekActivity]):
     def __init__(self, db: Session):
         super().__init__(db, WeekActivity)
 
-    def create_week_activity(
-        self, user_id: int, week_activity_data: WeekActivityCreate
-    ) -> WeekActivity:
-        """Create a new week activity assignment."""
+    @staticmethod
+    def _target_date(week_activity_data: WeekActivityCreate) -> date:
+        """Resolve the date an assignment falls in (defaults to today)."""
         if week_activity_data.activity_date:
-            target_date = week_activity_data.date
+            return week_activity_data.activity_date
 
-        elif week_activity_data.activity_year and week_activity_data.activity_week:
+        if week_activity_data.activity_year and week_activity_data.activity_week:
             # ISO weeks start on Monday; this gets the Monday of the given ISO week
-            target_date = datetime.strptime(
-                f"{week_activity_data.activity_year}-W{week_activity_data.activity_week:02d}-1",
-                "%G-W%V-%u",
-            ).date()
+            return date.fromisocalendar(
+                week_activity_data.activity_year, week_activity_data.activity_week, 1
+            )
 
-        else:
-            target_date = date.today()
+        return date.today()
 
+    def create_week_activity(
+        self, user_id: int, week_activity_data: WeekActivityCreate
+    ) -> WeekActivity:
+        """Create a new week activity assignment."""
         week_activity = WeekActivity.assign(
             user_id=user_id,
-            date_obj=target_date,
+            date_obj=self._target_date(week_activity_data),
             week_activity_data=week_activity_data,
         )
 
@@ -98,6 +103,46 @@ class WeekActivityRepository(BaseRepository[WeekActivity]):
         self.db.refresh(week_activity)
         return week_activity
 
+    def toggle_completed(
+        self, week_activity_id: int, user_id: Optional[int] = None
+    ) -> Optional[WeekActivity]:
+        """Flip completion in one round trip, returning the row with its activity.
+
+        The UPDATE ... RETURNING runs in a CTE joined to the activity, so the
+        response needs no follow-up query, and NOT completed is evaluated
+        against the current row, so concurrent double clicks cannot race.
+        """
+        criteria = [WeekActivity.id == week_activity_id]
+        if user_id is not None:
+            criteria.append(WeekActivity.user_id == user_id)
+
+        updated = (
+            update(WeekActivity)
+            .where(*criteria)
+            .values(
+                completed=~WeekActivity.completed,
+                completed_at=case(
+                    (WeekActivity.completed, None),
+                    else_=func.timezone("utc", func.now()),
+                ),
+            )
+            .returning(*WeekActivity.__table__.c)
+            .cte("updated")
+        )
+        updated_row = aliased(WeekActivity, updated)
+
+        # The outer statement is a SELECT, so routing would not see the write
+        self.db.mark_write()
+        week_activity = self.db.execute(
+            select(updated_row)
+            .outerjoin(Activity, updated_row.activity_id == Activity.id)
+            .options(contains_eager(updated_row.activity))
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
+        self._commit_without_expiring()
+        return week_activity
+
+    @read_only
     def get_week_activities(
         self,
         year: Optional[int] = None,
@@ -146,64 +191,137 @@ class WeekActivityRepository(BaseRepository[WeekActivity]):
         year, week, _ = today.isocalendar()
         return self.get_week_activities(year=year, week=week, user_id=user_id)
 
-    def get_week_summary(
-        self, year: int, week: int, user_id: Optional[int] = None
-    ) -> WeekSummary:
-        """Get a summary of activities for a specific week."""
-        activities = self.get_week_activities(year=year, week=week, user_id=user_id)
-
-        # Calculate week start and end dates
-        jan_4th = date(year, 1, 4)  # January 4th is always in week 1
-        week_start = (
-            jan_4th - timedelta(days=jan_4th.weekday()) + timedelta(weeks=week - 1)
-        )
-        week_end = week_start + timedelta(days=6)
-
-        activity_responses = [
-            WeekActivityResponse(
-                id=wa.id,
-                user_id=wa.user_id,
-                activity_id=wa.activity_id,
-                year=wa.year,
-                week=wa.week,
-                completed=wa.completed,
-                completed_at=wa.completed_at,
-                rating=wa.rating,
-                notes=wa.notes,
-                activity_title=wa.activity.title if wa.activity else None,
-                activity_description=wa.activity.description if wa.activity else None,
-            )
-            for wa in activities
-        ]
-
-        # Calculate summary stats
-        total_activities = len(activities)
-        completed_activities = sum(1 for wa in activities if wa.completed)
-        completion_rate = (
-            (completed_activities / total_activities) if total_activities > 0 else 0.0
-        )
+    @staticmethod
+    def _week_bounds(year: int, week: int) -> tuple[date, date]:
+        """Monday and Sunday of an ISO week."""
+        week_start = date.fromisocalendar(year, week, 1)
+        return week_start, week_start + timedelta(days=6)
 
-        # Calculate average rating (only for completed activities with ratings)
-        rated_activities = [
-            wa for wa in activities if wa.completed and wa.rating is not None
-        ]
-        average_rating = (
-            sum(wa.rating for wa in rated_activities) / len(rated_activities)
-            if rated_activities
-            else None
+    @staticmethod
+    def _stats_columns():
+        """Aggregate columns shared by the single- and multi-week stats queries."""
+        return (
+            func.count().label("total_activities"),
+            func.count().filter(WeekActivity.completed).label("completed_activities"),
+            func.avg(WeekActivity.rating)
+            .filter(WeekActivity.completed, WeekActivity.rating.is_not(None))
+            .label("average_rating"),
         )
 
-        return WeekSummary(
+    def _build_week_stats(
+        self, year: int, week: int, total: int, completed: int, average_rating
+    ) -> WeekStats:
+        week_start, week_end = self._week_bounds(year, week)
+        return WeekStats(
             year=year,
             week=week,
             start_date=week_start,
             end_date=week_end,
-            activities=activity_responses,
-            total_activities=total_activities,
-            completed_activities=completed_activities,
-            completion_rate=completion_rate,
-            average_rating=average_rating,
+            total_activities=total,
+            completed_activities=completed,
+            completion_rate=(completed / total) if total > 0 else 0.0,
+            average_rating=(
+                float(average_rating) if average_rating is not None else None
+            ),
+        )
+
+    @read_only
+    def get_week_stats(
+        self, year: int, week: int, user_id: Optional[int] = None
+    ) -> WeekStats:
+        """Get completion stats for a week as a single aggregate row."""
+        query = select(*self._stats_columns()).where(
+            WeekActivity.year == year, WeekActivity.week == week
+        )
+        if user_id is not None:
+            query = query.where(WeekActivity.user_id == user_id)
+
+        total, completed, average_rating = self.db.execute(query).one()
+        return self._build_week_stats(year, week, total, completed, average_rating)
+
+    @read_only
+    def get_week_activity_rows(
+        self, year: int, week: int, user_id: Optional[int] = None
+    ) -> List[WeekActivityResponse]:
+        """Get a week's activities with only the columns the summary shows."""
+        query = (
+            select(
+                WeekActivity.id,
+                WeekActivity.user_id,
+                WeekActivity.activity_id,
+                WeekActivity.year,
+                WeekActivity.week,
+                WeekActivity.completed,
+                WeekActivity.completed_at,
+                WeekActivity.rating,
+                WeekActivity.notes,
+                Activity.title.label("activity_title"),
+                Activity.description.label("activity_description"),
+            )
+            .outerjoin(Activity, WeekActivity.activity_id == Activity.id)
+            .where(WeekActivity.year == year, WeekActivity.week == week)
         )
+        if user_id is not None:
+            query = query.where(WeekActivity.user_id == user_id)
+
+        return [
+            WeekActivityResponse.model_validate(row) for row in self.db.execute(query)
+        ]
+
+    @read_only
+    def get_week_summary(
+        self,
+        year: int,
+        week: int,
+        user_id: Optional[int] = None,
+        include_activities: bool = True,
+    ) -> WeekSummary:
+        """Get a summary of activities for a specific week."""
+        stats = self.get_week_stats(year=year, week=week, user_id=user_id)
+        activities = (
+            self.get_week_activity_rows(year=year, week=week, user_id=user_id)
+            if include_activities
+            else []
+        )
+        return WeekSummary(**stats.model_dump(), activities=activities)
+
+    @read_only
+    def get_weekly_stats(
+        self, user_id: int, start_date: date, end_date: date
+    ) -> List[WeekStats]:
+        """Get per-week stats for every ISO week in a date range, in one query."""
+        start_year, start_week, _ = start_date.isocalendar()
+        end_year, end_week, _ = end_date.isocalendar()
+
+        rows = self.db.execute(
+            select(WeekActivity.year, WeekActivity.week, *self._stats_columns())
+            .where(
+                WeekActivity.user_id == user_id,
+                tuple_(WeekActivity.year, WeekActivity.week).between(
+                    tuple_(start_year, start_week), tuple_(end_year, end_week)
+                ),
+            )
+            .group_by(WeekActivity.year, WeekActivity.week)
+        ).all()
+        stats_by_week = {(row.year, row.week): row for row in rows}
+
+        # Weeks without any activities still appear in a trend, with zero counts
+        weekly_stats = []
+        week_start = date.fromisocalendar(start_year, start_week, 1)
+        while week_start <= end_date:
+            year, week, _ = week_start.isocalendar()
+            row = stats_by_week.get((year, week))
+            weekly_stats.append(
+                self._build_week_stats(
+                    year,
+                    week,
+                    row.total_activities if row else 0,
+                    row.completed_activities if row else 0,
+                    row.average_rating if row else None,
+                )
+            )
+            week_start += timedelta(weeks=1)
+        return weekly_stats
 
     def delete_week_activity(self, week_activity_id: int) -> bool:
         """Delete a week activity assignment."""
@@ -247,56 +365,134 @@ class WeekActivityRepository(BaseRepository[WeekActivity]):
             return True
         return False
 
+    @read_only
     def get_weeks_with_activities(
         self, user_id: Optional[int] = None
-    ) -> List[tuple[int, int]]:
-        """Get all year/week combinations that have activities."""
-        query = select(WeekActivity.year, WeekActivity.week).distinct()
+    ) -> List[tuple[int, int, int, int]]:
+        """Get all year/week combinations that have activities, with their counts."""
+        query = select(
+            WeekActivity.year,
+            WeekActivity.week,
+            func.count().label("total_activities"),
+            func.count().filter(WeekActivity.completed).label("completed_activities"),
+        )
 
         if user_id is not None:
             query = query.where(WeekActivity.user_id == user_id)
 
-        query = query.order_by(WeekActivity.year.desc(), WeekActivity.week.desc())
+        query = query.group_by(WeekActivity.year, WeekActivity.week).order_by(
+            WeekActivity.year.desc(), WeekActivity.week.desc()
+        )
 
         result = self.db.execute(query).all()
-        return [(year, week) for year, week in result]
+        return [tuple(row) for row in result]
 
     def bulk_create_week_activities(
-        self, user_id: int, week_activities_data: List[WeekActivityCreate]
+        self,
+        user_id: int,
+        week_activities_data: List[WeekActivityCreate],
+        activities_by_id: Optional[dict[int, Activity]] = None,
     ) -> List[WeekActivity]:
-        """Create multiple week activities at once."""
-        week_activities = []
+        """Create multiple week activities in one INSERT.
 
-        for wa_data in week_activities_data:
-            if wa_data.activity_date:
-                target_date = wa_data.date
+        Activities passed in ``activities_by_id`` are attached to the created
+        rows, so callers can read ``week_activity.activity`` without a query.
+        """
+        week_activities = [
+            WeekActivity.assign(
+                user_id=user_id,
+                date_obj=self._target_date(wa_data),
+                week_activity_data=wa_data,
+            )
+            for wa_data in week_activities_data
+        ]
 
-            elif wa_data.activity_year and wa_data.activity_week:
-                # ISO weeks start on Monday; this gets the Monday of the given ISO week
-                target_date = datetime.strptime(
-                    f"{wa_data.activity_year}-W{wa_data.activity_week:02d}-1",
-                    "%G-W%V-%u",
-                ).date()
+        self.db.add_all(week_activities)
+        try:
+            self._commit_without_expiring()
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
+
+        if activities_by_id:
+            for wa in week_activities:
+                set_committed_value(
+                    wa, "activity", activities_by_id.get(wa.activity_id)
+                )
 
-            else:
-                target_date = date.today()
+        return week_activities
 
+    def upsert_week_activities(
+        self,
+        user_id: int,
+        week_activities_data: List[WeekActivityCreate],
+        activities_by_id: Optional[dict[int, Activity]] = None,
+    ) -> List[tuple[WeekActivity, bool]]:
+        """Insert assignments, refreshing the LLM fields of ones that already exist.
+
+        A single INSERT ... ON CONFLICT (user_id, activity_id, year, week)
+        DO UPDATE ... RETURNING reports every row along with whether it was
+        newly inserted (``xmax = 0``). Existing completion state and checklist
+        progress are left untouched.
+        """
+        # ON CONFLICT cannot touch the same row twice, so the last duplicate wins
+        rows_by_key = {}
+        for wa_data in week_activities_data:
             week_activity = WeekActivity.assign(
                 user_id=user_id,
-                activity_id=wa_data.activity_id,
-                date_obj=target_date,
-                llm_suggestion=wa_data.llm_suggestion,
-                llm_notes=wa_data.llm_notes,
+                date_obj=self._target_date(wa_data),
+                week_activity_data=wa_data,
             )
-            week_activities.append(week_activity)
-
-        self.db.add_all(week_activities)
-        self.db.commit()
-
-        for wa in week_activities:
-            self.db.refresh(wa)
+            rows_by_key[
+                (week_activity.activity_id, week_activity.year, week_activity.week)
+            ] = {
+                "user_id": user_id,
+                "activity_id": week_activity.activity_id,
+                "year": week_activity.year,
+                "week": week_activity.week,
+                "completed": False,
+                "llm_suggestion": week_activity.llm_suggestion,
+                "llm_notes": week_activity.llm_notes,
+                "equipment": week_activity.equipment or [],
+                "instructions": week_activity.instructions or [],
+                "adhd_tips": week_activity.adhd_tips or [],
+            }
+        if not rows_by_key:
+            return []
+
+        statement = pg_insert(WeekActivity)
+        statement = statement.on_conflict_do_update(
+            constraint="uq_user_activity_week",
+            set_={
+                "llm_suggestion": statement.excluded.llm_suggestion,
+                "llm_notes": statement.excluded.llm_notes,
+                "updated_at": func.now(),
+            },
+        ).returning(WeekActivity, literal_column("xmax = 0", Boolean).label("inserted"))
+
+        try:
+            results = [
+                (row[0], row[1])
+                for row in self.db.execute(
+                    statement,
+                    list(rows_by_key.values()),
+                    execution_options={"populate_existing": True},
+                )
+            ]
+            self._commit_without_expiring()
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
+
+        if activities_by_id:
+            for week_activity, _ in results:
+                set_committed_value(
+                    week_activity,
+                    "activity",
+                    activities_by_id.get(week_activity.activity_id),
+                )
 
-        return week_activities
+        return results
 
     def get_by_user_id(self, user_id: int) -> Sequence[WeekActivity]:
         """Get all week activities for a specific user."""
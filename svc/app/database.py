@@ -1,17 +1,165 @@
+import itertools
+import logging
 import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import Select, create_engine, event, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is not set")
 
+# Comma-separated list of read replica URLs; empty means every query uses the primary
+DATABASE_REPLICA_URLS = [
+    url.strip()
+    for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",")
+    if url.strip()
+]
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "10"))
+REPLICA_HEALTH_CHECK_SECONDS = float(os.getenv("REPLICA_HEALTH_CHECK_SECONDS", "15"))
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+
 engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT COALESCE(
+        CASE
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+        END,
+        0
+    )
+    """
+)
+
+
+class ReplicaSet:
+    """Read replica engines with health tracking and round-robin selection."""
+
+    def __init__(self, urls: List[str]):
+        self.engines = [create_engine(url, pool_pre_ping=True) for url in urls]
+        self._down_until = [0.0] * len(self.engines)
+        self._checked_at = [0.0] * len(self.engines)
+        self._probe_lock = threading.Lock()
+        self._cycle = itertools.count()
+
+        for replica_engine in self.engines:
+            event.listen(replica_engine, "handle_error", self._on_error)
+
+    def choose(self) -> Optional[Engine]:
+        """Return the next healthy replica engine, or None to use the primary."""
+        if not self.engines:
+            return None
+
+        start = next(self._cycle)
+        for offset in range(len(self.engines)):
+            index = (start + offset) % len(self.engines)
+            if self._is_usable(index):
+                return self.engines[index]
+        return None
+
+    def mark_unhealthy(self, replica_engine: Engine) -> None:
+        """Take a replica out of rotation until the next health check interval."""
+        index = self.engines.index(replica_engine)
+        now = time.monotonic()
+        self._down_until[index] = now + REPLICA_HEALTH_CHECK_SECONDS
+        self._checked_at[index] = now
+        logger.warning(f"Read replica {replica_engine.url.host} marked unhealthy")
+
+    def _is_usable(self, index: int) -> bool:
+        now = time.monotonic()
+        if now < self._down_until[index]:
+            return False
+
+        # Only one request pays for a probe; others use the last known state
+        if now - self._checked_at[index] >= REPLICA_HEALTH_CHECK_SECONDS:
+            if self._probe_lock.acquire(blocking=False):
+                try:
+                    self._probe(index)
+                finally:
+                    self._probe_lock.release()
+
+        return time.monotonic() >= self._down_until[index]
+
+    def _probe(self, index: int) -> None:
+        replica_engine = self.engines[index]
+        try:
+            with replica_engine.connect() as connection:
+                lag = float(connection.execute(REPLICA_LAG_QUERY).scalar() or 0)
+        except Exception as e:
+            logger.warning(f"Read replica health check failed: {e}")
+            self.mark_unhealthy(replica_engine)
+            return
+
+        self._checked_at[index] = time.monotonic()
+        if lag > REPLICA_MAX_LAG_SECONDS:
+            logger.warning(
+                f"Read replica {replica_engine.url.host} is {lag:.1f}s behind"
+            )
+            self.mark_unhealthy(replica_engine)
+
+    def _on_error(self, context) -> None:
+        if context.is_disconnect and context.engine is not None:
+            self.mark_unhealthy(context.engine)
+
+
+replicas = ReplicaSet(DATABASE_REPLICA_URLS)
+
+
+class RoutingSession(Session):
+    """Session that sends eligible reads to a replica and everything else to the primary.
+
+    Reads only go to a replica inside ``replica_reads`` (or when the request
+    dependency enables it for GET requests), and never after the session has
+    written, so a unit of work always sees its own changes.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or getattr(clause, "is_dml", False):
+            self.mark_write()
+        elif (
+            self.info.get("use_replica")
+            and not self.info.get("wrote")
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+        ):
+            replica_engine = self._pinned_replica()
+            if replica_engine is not None:
+                return replica_engine
+
+        return super().get_bind(mapper, clause=clause, **kw)
+
+    def _pinned_replica(self) -> Optional[Engine]:
+        # Stick to one replica per session so reads see a consistent snapshot
+        if "replica" not in self.info:
+            self.info["replica"] = replicas.choose()
+        return self.info["replica"]
+
+    def mark_write(self) -> None:
+        """Treat the session as having written, for statements get_bind cannot tell.
+
+        Keeps the rest of the session on the primary and opens the user's
+        read-your-writes window, e.g. for an UPDATE run inside a SELECT's CTE.
+        """
+        if not self.info.get("wrote"):
+            self.info["wrote"] = True
+            note_write(self.info.get("user_id"))
+
+
+SessionLocal = sessionmaker(
+    class_=RoutingSession, autocommit=False, autoflush=False, bind=engine
+)
 
 
 class Base(DeclarativeBase):
@@ -20,11 +168,69 @@ class Base(DeclarativeBase):
     pass
 
 
+_last_writes: Dict[int, float] = {}
+
+
+def note_write(user_id: Optional[int]) -> None:
+    """Record that a user just wrote to the primary."""
+    if user_id is not None:
+        _last_writes[user_id] = time.monotonic()
+
+
+def wrote_recently(user_id: Optional[int]) -> bool:
+    """Check whether a user is still inside their read-your-writes window."""
+    if user_id is None:
+        return False
+    last_write = _last_writes.get(user_id)
+    if last_write is None:
+        return False
+    if time.monotonic() - last_write < READ_YOUR_WRITES_SECONDS:
+        return True
+    _last_writes.pop(user_id, None)
+    return False
+
+
+@contextmanager
+def replica_reads(session: Session):
+    """Allow the session's plain SELECTs to use a replica inside the block."""
+    previous = session.info.get("use_replica", False)
+    session.info["use_replica"] = not session.info.get("pin_primary", False)
+    try:
+        yield session
+    finally:
+        session.info["use_replica"] = previous
+
+
+@contextmanager
+def primary_reads(session: Session):
+    """Send the session's reads to the primary inside the block."""
+    previous = session.info.get("use_replica", False)
+    session.info["use_replica"] = False
+    try:
+        yield session
+    finally:
+        session.info["use_replica"] = previous
+
+
 def create_tables():
     """Create all database tables."""
     Base.metadata.create_all(bind=engine)
 
 
+def pool_stats() -> Dict[str, int]:
+    """Connection usage of the primary engine's pool."""
+    pool = engine.pool
+    size = pool.size()
+    max_overflow = getattr(pool, "_max_overflow", 0)
+    return {
+        "size": size,
+        "capacity": size + max(max_overflow, 0),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+    }
+
+
 def get_db_session():
     """Get database session dependency."""
     db = SessionLocal()
@@ -1,6 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+from .user import UserResponse
 
 
 class LoginRequest(BaseModel):
@@ -46,3 +48,15 @@ class GoogleUserInfo(BaseModel):
     email: str
     name: str
     picture: Optional[str] = None
+
+
+class AuthenticatedUser(UserResponse):
+    """Detached, immutable snapshot of the user behind a verified token.
+
+    Safe to cache across requests and to read without a database session.
+    """
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    # Already stored; re-validating it must never lock a user out
+    email: str = Field(..., description="User email address")
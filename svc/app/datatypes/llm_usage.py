@@ -0,0 +1,27 @@
+from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class LLMUsageDay(BaseModel):
+    """LLM usage for one day and call type."""
+
+    day: date = Field(..., description="UTC day")
+    call_type: str = Field(..., description="planner, checklist, ...")
+    calls: int = Field(..., description="Completions made")
+    prompt_tokens: int = Field(..., description="Prompt tokens used")
+    completion_tokens: int = Field(..., description="Completion tokens used")
+    cached_tokens: int = Field(..., description="Prompt tokens served from cache")
+    cache_hits: int = Field(..., description="Completions with a prompt cache hit")
+    avg_latency_ms: float = Field(..., description="Mean completion latency")
+
+
+class LLMUsageResponse(BaseModel):
+    """A user's LLM usage per day and their remaining token allowance."""
+
+    remaining_tokens: Optional[int] = Field(
+        None, description="Premium token allowance left (null if none is tracked)"
+    )
+    total_tokens: int = Field(..., description="Tokens used over the period")
+    days: List[LLMUsageDay] = Field(default_factory=list)
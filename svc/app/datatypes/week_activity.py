@@ -106,14 +106,13 @@ class WeekActivityResponse(BaseModel):
         from_attributes = True
 
 
-class WeekSummary(BaseModel):
-    """Summary of activities for a specific week."""
+class WeekStats(BaseModel):
+    """Completion stats for a single week."""
 
     year: int
     week: int
     start_date: date
     end_date: date
-    activities: list[WeekActivityResponse]
 
     # Summary stats
     total_activities: int
@@ -122,6 +121,12 @@ class WeekSummary(BaseModel):
     average_rating: Optional[float]
 
 
+class WeekSummary(WeekStats):
+    """Summary of activities for a specific week."""
+
+    activities: list[WeekActivityResponse] = Field(default_factory=list)
+
+
 class WeekRange(BaseModel):
     """Query parameters for week range."""
 
@@ -137,3 +142,10 @@ class BulkWeekActivityCreate(BaseModel):
     """Create multiple week activities at once."""
 
     assignments: list[WeekActivityCreate]
+
+
+class BulkWeekActivityResult(BaseModel):
+    """Outcome of a bulk upsert: rows newly created and rows that already existed."""
+
+    created: list[WeekActivityResponse] = Field(default_factory=list)
+    updated: list[WeekActivityResponse] = Field(default_factory=list)
@@ -1,21 +1,24 @@
-from typing import Annotated
+import time
+from typing import Annotated, Optional
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 
 from svc.app.dal.activity_repository import ActivityRepository
 from svc.app.dal.activity_suggestion_repository import ActivitySuggestionRepository
 from svc.app.dal.family_preference_repository import FamilyPreferenceRepository
 from svc.app.dal.kid_repository import KidRepository
+from svc.app.dal.llm_usage_repository import LLMUsageRepository
 from svc.app.dal.user_behavior_analytic_repository import (
     UserBehaviorAnalyticsRepository,
 )
 from svc.app.dal.user_repository import UserRepository
 from svc.app.dal.week_activity_repository import WeekActivityRepository
-from svc.app.database import get_db_session
+from svc.app.database import READ_YOUR_WRITES_SECONDS, SessionLocal, wrote_recently
+from svc.app.datatypes.auth import AuthenticatedUser
 from svc.app.llm.services.checklist_creation_service import ChecklistCreationService
-from svc.app.models.user import User
 from svc.app.services.activity_service import ActivityService
 from svc.app.services.activity_suggestion_service import HistoricalActivityAnalyzer
 from svc.app.services.auth_service import AuthService
@@ -26,6 +29,7 @@ from svc.app.services.enhanced_activity_planner_service import (
 from svc.app.services.family_preference_service import FamilyPreferenceService
 from svc.app.services.family_profile_service import FamilyProfileService
 from svc.app.services.kid_service import KidService
+from svc.app.services.llm_usage_service import LLMUsageService
 from svc.app.services.settings_service import SettingsService
 from svc.app.services.user_seeding_service import UserSeedingService
 from svc.app.services.user_service import UserService
@@ -34,8 +38,46 @@ from svc.app.services.week_activity_service import WeekActivityService
 
 security = HTTPBearer(auto_error=True)
 
+READ_METHODS = {"GET", "HEAD"}
+
+
+def _token_claims(request: Request) -> dict:
+    """Read the bearer token claims without verifying them (routing only)."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return {}
+    try:
+        return jwt.get_unverified_claims(token)
+    except JWTError:
+        return {}
+
+
+def _needs_primary(user_id: Optional[int], issued_at: Optional[float]) -> bool:
+    """Keep a user on the primary right after they wrote or logged in."""
+    if wrote_recently(user_id):
+        return True
+    return issued_at is not None and time.time() - issued_at < READ_YOUR_WRITES_SECONDS
+
+
 # Database dependency
-DatabaseSession = Annotated[Session, Depends(get_db_session)]
+def get_routed_db_session(request: Request):
+    """Get a database session that reads from a replica for GET requests."""
+    claims = _token_claims(request)
+    user_id = claims.get("user_id")
+
+    db = SessionLocal()
+    db.info["user_id"] = user_id
+    db.info["pin_primary"] = _needs_primary(user_id, claims.get("iat"))
+    db.info["use_replica"] = (
+        request.method in READ_METHODS and not db.info["pin_primary"]
+    )
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+DatabaseSession = Annotated[Session, Depends(get_routed_db_session)]
 
 
 # Repository dependencies
@@ -51,6 +93,10 @@ def get_activity_repository(db: DatabaseSession) -> ActivityRepository:
     return ActivityRepository(db)
 
 
+def get_llm_usage_repository(db: DatabaseSession) -> LLMUsageRepository:
+    return LLMUsageRepository(db)
+
+
 def get_week_activity_repository(db: DatabaseSession) -> WeekActivityRepository:
     return WeekActivityRepository(db)
 
@@ -93,6 +139,12 @@ def get_user_service(
     return UserService(user_repo)
 
 
+def get_llm_usage_service(
+    llm_usage_repo: Annotated[LLMUsageRepository, Depends(get_llm_usage_repository)]
+) -> LLMUsageService:
+    return LLMUsageService(llm_usage_repo)
+
+
 def get_kid_service(
     kid_repo: Annotated[KidRepository, Depends(get_kid_repository)]
 ) -> KidService:
@@ -214,8 +266,8 @@ def get_enhanced_activity_planner_service(
 def get_current_user(
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-) -> User:
+) -> AuthenticatedUser:
     return auth_service.get_current_user_from_token(credentials)
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[AuthenticatedUser, Depends(get_current_user)]
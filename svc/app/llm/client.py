@@ -1,26 +1,262 @@
+import asyncio
 import logging
+import time
+from collections import defaultdict
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Tuple, TypeVar
 
-from openai import OpenAI
+from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletion
+from opentelemetry.trace import SpanKind
 
 from svc.app.config import settings
+from svc.app.llm.limiter import LLMLimiter
+from svc.app.llm.retry import (
+    LatencyWindow,
+    LLMResponseError,
+    RetryPolicy,
+    current_retry_budget,
+    fallback_reason,
+)
+from svc.app.llm.usage import llm_usage_recorder
+from svc.app.utils.exceptions import LLMProcessingError
+from svc.app.utils.metrics import (
+    LLM_ERRORS,
+    LLM_HEDGES,
+    LLM_OUTCOMES,
+    LLM_REQUEST_DURATION,
+    LLM_RETRIES,
+    LLM_TOKENS,
+    child,
+    track_call,
+)
+from svc.app.utils.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Reserved against the token rate limit when a call does not set max_tokens;
+# the bucket is corrected with the real usage once the response arrives
+DEFAULT_COMPLETION_TOKENS = 1000
+
+
+def estimate_tokens(messages: List[Dict[str, Any]], max_tokens: Optional[int]) -> int:
+    """Rough upper bound of a call's tokens: prompt at ~4 characters a token."""
+    prompt_chars = sum(len(str(message.get("content", ""))) for message in messages)
+    return prompt_chars // 4 + (max_tokens or DEFAULT_COMPLETION_TOKENS)
+
 
 class LLMClient:
     def __init__(self):
         self._client = None
+        self.limiter = LLMLimiter(settings)
+        self.retry_policy = RetryPolicy(
+            max_retries=settings.llm_max_retries,
+            base_delay=settings.llm_retry_base_delay_seconds,
+            max_delay=settings.llm_retry_max_delay_seconds,
+        )
+        # Keyed by (service, model): a route's models can differ widely in speed
+        self._latencies: DefaultDict[Tuple[str, str], LatencyWindow] = defaultdict(
+            lambda: LatencyWindow(min_samples=settings.llm_hedge_min_samples)
+        )
 
     @property
-    def client(self) -> OpenAI:
+    def client(self) -> AsyncOpenAI:
         if self._client is None:
-            self._client = OpenAI(
+            self._client = AsyncOpenAI(
                 base_url=settings.openai_base_url,
                 api_key=settings.openai_api_key,
-                timeout=30.0,
+                timeout=settings.llm_timeout,
+                # Retries are ours (see complete), so they share one policy
+                max_retries=0,
             )
         return self._client
 
+    async def complete(
+        self,
+        service: str,
+        parse: Callable[[str], T],
+        user_id: Optional[int] = None,
+        hedge: bool = False,
+        **kwargs: Any,
+    ) -> T:
+        """Create a chat completion and parse its content, retrying transient failures.
+
+        Unless kwargs name a model, the call goes to the first model routed
+        for service (see Settings.llm_models_for). Rate limits, server errors,
+        timeouts, rejected requests and content that parse rejects (by
+        raising ValueError, KeyError or IndexError) move the call straight on
+        to the next model in the route; once on the last model, transient
+        failures are retried with jittered exponential backoff. Either way a
+        call makes at most llm_max_retries further attempts, within the
+        request's retry budget, if one is set. With hedge, a duplicate call
+        is sent once the first runs past the model's p95 latency, and
+        whichever answers first is used.
+
+        Raises:
+            LLMProcessingError: If the call fails in a way that cannot be
+                retried, or still fails after its retries
+        """
+        if "model" in kwargs:
+            models = [kwargs.pop("model")]
+        else:
+            models = settings.llm_models_for(service)
+
+        budget = current_retry_budget()
+        retry = 0
+        position = 0
+        while True:
+            model = models[position]
+            try:
+                if hedge and settings.llm_hedging_enabled:
+                    result = await self._hedged(service, parse, user_id, model, kwargs)
+                else:
+                    result = await self._parsed(service, parse, user_id, model, kwargs)
+            except Exception as e:
+                reason = fallback_reason(e)
+                child(LLM_OUTCOMES, service, model, reason or "error").inc()
+                falls_back = position + 1 < len(models)
+                if reason is None or (reason == "rejected" and not falls_back):
+                    raise LLMProcessingError(
+                        f"LLM {service} call failed on {model}: {e}"
+                    ) from e
+                if retry >= self.retry_policy.max_retries or (
+                    budget is not None and not budget.spend()
+                ):
+                    raise LLMProcessingError(
+                        f"LLM {service} call failed after {retry + 1} attempts: {e}"
+                    ) from e
+
+                child(LLM_RETRIES, service, reason).inc()
+                retry += 1
+                if falls_back:
+                    position += 1
+                    logger.warning(
+                        f"LLM {service} failed on {model} ({reason}), "
+                        f"falling back to {models[position]}: {e}"
+                    )
+                    continue
+
+                delay = self.retry_policy.delay(retry - 1, e)
+                logger.warning(
+                    f"LLM {service} attempt {retry} failed ({reason}), "
+                    f"retrying in {delay:.2f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+            else:
+                child(LLM_OUTCOMES, service, model, "ok").inc()
+                return result
+
+    async def _parsed(
+        self,
+        service: str,
+        parse: Callable[[str], T],
+        user_id: Optional[int],
+        model: str,
+        kwargs: Dict[str, Any],
+    ) -> T:
+        response = await self.chat_completion(
+            service, user_id=user_id, model=model, **kwargs
+        )
+        content = response.choices[0].message.content
+        if not content:
+            raise LLMResponseError(f"Empty {service} response")
+        try:
+            return parse(content)
+        except (ValueError, KeyError, IndexError) as e:
+            raise LLMResponseError(f"Unusable {service} response: {e}") from e
+
+    async def _hedged(
+        self,
+        service: str,
+        parse: Callable[[str], T],
+        user_id: Optional[int],
+        model: str,
+        kwargs: Dict[str, Any],
+    ) -> T:
+        hedge_after = self._latencies[service, model].percentile(0.95)
+        if hedge_after is None:
+            return await self._parsed(service, parse, user_id, model, kwargs)
+
+        primary = asyncio.ensure_future(
+            self._parsed(service, parse, user_id, model, kwargs)
+        )
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge_after)
+            # A duplicate would only queue behind other calls and add to the load
+            if done or self.limiter.gate(model).saturated:
+                return await primary
+
+            duplicate = asyncio.ensure_future(
+                self._parsed(service, parse, user_id, model, kwargs)
+            )
+            pending = {primary, duplicate}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        winner = "duplicate" if task is duplicate else "primary"
+                        child(LLM_HEDGES, service, winner).inc()
+                        return task.result()
+            # Both copies failed; retry or fall back on the primary's error
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def chat_completion(
+        self, service: str, user_id: Optional[int] = None, **kwargs: Any
+    ) -> ChatCompletion:
+        """Create a chat completion, recording latency, tokens and errors for service.
+
+        The call first waits for its model's concurrency and rate limits,
+        taking turns with other users' calls. Token usage is persisted per
+        call, and charged to user_id when the call is made on a user's behalf.
+        """
+        model = kwargs.get("model", "")
+        gate = self.limiter.gate(model)
+        estimated_tokens = estimate_tokens(
+            kwargs.get("messages", []), kwargs.get("max_tokens")
+        )
+        with tracer.start_as_current_span(
+            f"llm {service}", kind=SpanKind.CLIENT
+        ) as span:
+            span.set_attribute("llm.service", service)
+            span.set_attribute("gen_ai.request.model", model)
+            queued = time.perf_counter()
+            async with gate.slot(user_id, estimated_tokens, service):
+                started = time.perf_counter()
+                span.set_attribute("llm.queue_wait_ms", (started - queued) * 1000)
+                with track_call(LLM_REQUEST_DURATION, LLM_ERRORS, service, model):
+                    response = await self.client.chat.completions.create(**kwargs)
+                latency_ms = (time.perf_counter() - started) * 1000
+                self._latencies[service, model].record(latency_ms / 1000)
+
+            span.set_attribute("gen_ai.response.model", response.model)
+            usage = response.usage
+            if usage is not None:
+                child(LLM_TOKENS, service, "prompt").inc(usage.prompt_tokens)
+                child(LLM_TOKENS, service, "completion").inc(usage.completion_tokens)
+                span.set_attribute("gen_ai.usage.input_tokens", usage.prompt_tokens)
+                span.set_attribute(
+                    "gen_ai.usage.output_tokens", usage.completion_tokens
+                )
+                gate.settle(estimated_tokens, usage.total_tokens)
+                details = usage.prompt_tokens_details
+                llm_usage_recorder.record(
+                    call_type=service,
+                    model=response.model or model,
+                    prompt_tokens=usage.prompt_tokens,
+                    completion_tokens=usage.completion_tokens,
+                    cached_tokens=(details.cached_tokens or 0) if details else 0,
+                    latency_ms=latency_ms,
+                    user_id=user_id,
+                )
+        return response
+
 
 # Singleton instance
 llm_client = LLMClient()
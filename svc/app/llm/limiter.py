@@ -0,0 +1,175 @@
+"""Process-wide admission control for LLM requests.
+
+Each model gets a gate that caps requests in flight and keeps request and
+token throughput under the provider's per-minute limits with token buckets.
+Waiting requests are queued per user and admitted round-robin, so a family
+whose plan fans out into many batches takes turns with everyone else rather
+than holding every slot until its batches are done.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Deque, Dict, Hashable, Optional
+
+from svc.app.config import Settings
+from svc.app.utils.metrics import LLM_IN_FLIGHT, LLM_QUEUE_WAIT, LLM_QUEUED, child
+
+
+class TokenBucket:
+    """Allows up to per_minute units a minute, refilled continuously."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60
+        self.available = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(
+            self.capacity, self.available + (now - self.updated) * self.rate
+        )
+        self.updated = now
+
+    def delay(self, amount: float) -> float:
+        """Seconds until amount can be taken; 0 when it can be taken now."""
+        self._refill()
+        # A single request larger than the bucket waits for a full bucket
+        missing = min(amount, self.capacity) - self.available
+        return max(0.0, missing / self.rate)
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self.available -= min(amount, self.capacity)
+
+    def give_back(self, amount: float) -> None:
+        """Return (or, when negative, charge) units after the real cost is known."""
+        self._refill()
+        self.available = min(self.capacity, self.available + amount)
+
+
+@dataclass
+class _Waiter:
+    tokens: int
+    future: "asyncio.Future[None]"
+    queued_at: float = field(default_factory=time.monotonic)
+
+
+class ModelGate:
+    """Admission for one model: concurrency, request rate and token rate."""
+
+    def __init__(
+        self,
+        model: str,
+        max_concurrency: int,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+    ):
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.in_flight = 0
+        # user -> their waiting requests, in the order users take turns
+        self._queues: "OrderedDict[Hashable, Deque[_Waiter]]" = OrderedDict()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @asynccontextmanager
+    async def slot(
+        self, user: Hashable, tokens: int, service: str
+    ) -> AsyncIterator[None]:
+        """Wait for a turn, then hold a slot for the duration of the block."""
+        waiter = _Waiter(tokens, asyncio.get_running_loop().create_future())
+        self._queues.setdefault(user, deque()).append(waiter)
+        child(LLM_QUEUED, self.model).inc()
+        self._dispatch()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self._release()
+            else:
+                child(LLM_QUEUED, self.model).dec()
+            raise
+        child(LLM_QUEUE_WAIT, self.model, service).observe(
+            time.monotonic() - waiter.queued_at
+        )
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    @property
+    def saturated(self) -> bool:
+        """Whether a new call would have to queue for a concurrency slot."""
+        return bool(self._queues) or self.in_flight >= self.max_concurrency
+
+    def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once a response reports real usage."""
+        self.tokens.give_back(estimated_tokens - actual_tokens)
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+        child(LLM_IN_FLIGHT, self.model).dec()
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Admit waiters, one per user in turn, while capacity allows."""
+        while self._queues and self.in_flight < self.max_concurrency:
+            user, queue = next(iter(self._queues.items()))
+            waiter = queue[0]
+            if waiter.future.done():
+                # Cancelled while queued; already taken off the gauge
+                self._advance(user, queue)
+                continue
+
+            delay = max(self.requests.delay(1), self.tokens.delay(waiter.tokens))
+            if delay > 0:
+                self._wake_after(delay)
+                return
+
+            self.requests.take(1)
+            self.tokens.take(waiter.tokens)
+            self.in_flight += 1
+            child(LLM_QUEUED, self.model).dec()
+            child(LLM_IN_FLIGHT, self.model).inc()
+            waiter.future.set_result(None)
+            self._advance(user, queue)
+
+    def _advance(self, user: Hashable, queue: Deque[_Waiter]) -> None:
+        queue.popleft()
+        if queue:
+            self._queues.move_to_end(user)
+        else:
+            del self._queues[user]
+
+    def _wake_after(self, delay: float) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        loop = asyncio.get_running_loop()
+        self._timer = loop.call_later(delay, self._dispatch)
+
+
+class LLMLimiter:
+    """One gate per model, created on first use from the configured limits."""
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self._gates: Dict[str, ModelGate] = {}
+
+    def gate(self, model: str) -> ModelGate:
+        gate = self._gates.get(model)
+        if gate is None:
+            limits = self.settings.llm_limits_for(model)
+            gate = self._gates[model] = ModelGate(
+                model,
+                max_concurrency=limits.max_concurrency,
+                requests_per_minute=limits.requests_per_minute,
+                tokens_per_minute=limits.tokens_per_minute,
+            )
+        return gate
@@ -0,0 +1,133 @@
+"""Retry policy for LLM calls: backoff, error classification, budgets, hedging."""
+
+import random
+from bisect import insort
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Deque, Iterator, List, Optional
+
+import openai
+
+
+class LLMResponseError(ValueError):
+    """A completion arrived but its content could not be used."""
+
+
+def retry_reason(error: BaseException) -> Optional[str]:
+    """Why a failed call is worth retrying, or None if it is not."""
+    # APITimeoutError is an APIConnectionError, so it is checked first
+    if isinstance(error, openai.APITimeoutError):
+        return "timeout"
+    if isinstance(error, openai.APIConnectionError):
+        return "connection"
+    if isinstance(error, openai.RateLimitError):
+        return "rate_limited"
+    if isinstance(error, openai.APIStatusError) and error.status_code >= 500:
+        return "server_error"
+    if isinstance(error, LLMResponseError):
+        return "unparseable"
+    return None
+
+
+def fallback_reason(error: BaseException) -> Optional[str]:
+    """Why a failed call should move on to the next model in its route.
+
+    Everything worth retrying is, and so is a request the model refused
+    outright (unknown model, context too long, unsupported parameter),
+    which another model may well accept.
+    """
+    reason = retry_reason(error)
+    if reason is None and isinstance(error, openai.APIStatusError):
+        if error.status_code in (400, 403, 404, 422):
+            return "rejected"
+    return reason
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Seconds the provider asked us to wait, from a Retry-After header."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("retry-after", ""))
+    except ValueError:
+        return None
+
+
+@dataclass
+class RetryPolicy:
+    max_retries: int
+    base_delay: float
+    max_delay: float
+
+    def delay(self, retry: int, error: BaseException) -> float:
+        """Exponential backoff with full jitter, but never sooner than Retry-After."""
+        ceiling = min(self.max_delay, self.base_delay * 2**retry)
+        delay = random.uniform(0, ceiling)
+        requested = retry_after(error)
+        if requested is not None:
+            delay = max(delay, min(requested, self.max_delay))
+        return delay
+
+
+class RetryBudget:
+    """Retries left for every LLM call made while serving one request.
+
+    Without it, a plan whose batches all fail would retry each of them and
+    multiply load on a provider that is already struggling.
+    """
+
+    def __init__(self, retries: int):
+        self.remaining = retries
+
+    def spend(self) -> bool:
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        return True
+
+
+# Shared by reference with the tasks asyncio.gather starts, so batches
+# planned concurrently draw on the same budget
+_retry_budget: ContextVar[Optional[RetryBudget]] = ContextVar(
+    "llm_retry_budget", default=None
+)
+
+
+@contextmanager
+def retry_budget(retries: int) -> Iterator[RetryBudget]:
+    """Share a retry budget between the LLM calls made inside the block."""
+    budget = RetryBudget(retries)
+    token = _retry_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _retry_budget.reset(token)
+
+
+def current_retry_budget() -> Optional[RetryBudget]:
+    return _retry_budget.get()
+
+
+class LatencyWindow:
+    """Latencies of the most recent successful calls, for hedging delays."""
+
+    def __init__(self, size: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._recent: Deque[float] = deque(maxlen=size)
+        self._sorted: List[float] = []
+
+    def record(self, seconds: float) -> None:
+        if len(self._recent) == self._recent.maxlen:
+            self._sorted.remove(self._recent[0])
+        self._recent.append(seconds)
+        insort(self._sorted, seconds)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Nearest-rank percentile, or None until there are enough samples."""
+        if len(self._sorted) < self.min_samples:
+            return None
+        index = min(len(self._sorted) - 1, int(fraction * len(self._sorted)))
+        return self._sorted[index]
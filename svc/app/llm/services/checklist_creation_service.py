@@ -6,6 +6,7 @@ from svc.app.datatypes.activity import ActivityResponse, ActivityUpdate
 from svc.app.datatypes.family_preference import FamilyProfile
 from svc.app.llm.client import llm_client
 from svc.app.llm.prompts.checklist_creation import ActivityChecklistPrompts
+from svc.app.llm.retry import retry_budget
 from svc.app.llm.utils.parsers import parse_response_to_json
 from svc.app.models.activity import Activity
 from svc.app.services.activity_service import ActivityService
@@ -20,9 +21,7 @@ class ChecklistCreationService:
         activity_service: ActivityService,
         family_profile_service: FamilyProfileService,
     ):
-        self.model = settings.llm_model
         self.temperature = settings.llm_temperature
-        self.max_retries = settings.llm_max_retries
         self.prompts = ActivityChecklistPrompts()
         self.activity_service = activity_service
         self.family_profile_service = family_profile_service
@@ -40,29 +39,27 @@ class ChecklistCreationService:
         user_prompt = self.prompts.build_user_prompt(activity, family_profile)
 
         try:
-            response = llm_client.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.prompts.system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=self.temperature,
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "checklist_array",
-                        "schema": self.prompts.schema,
+            with retry_budget(settings.llm_retry_budget):
+                activity_update = await llm_client.complete(
+                    "checklist",
+                    lambda content: ActivityUpdate(
+                        **parse_response_to_json(content)[0]
+                    ),
+                    user_id=user_id,
+                    messages=[
+                        {"role": "system", "content": self.prompts.system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    temperature=self.temperature,
+                    response_format={
+                        "type": "json_schema",
+                        "json_schema": {
+                            "name": "checklist_array",
+                            "schema": self.prompts.schema,
+                        },
                     },
-                },
-            )
-            content = response.choices[0].message.content
-            if not content:
-                logger.error("Empty response from LLM")
-                return ActivityResponse.model_validate(activity)
-
-            content_parsed: dict = parse_response_to_json(content)[0]
+                )
 
-            activity_update = ActivityUpdate(**content_parsed)
             activity = self.activity_service.update_activity(
                 activity.id, activity_update, user_id
             )
@@ -9,6 +9,7 @@ from svc.app.llm.prompts.activity_tagging import (
     ACTIVITY_TAGGING_SYSTEM_PROMPT,
     build_activity_tagging_prompt,
 )
+from svc.app.llm.retry import retry_budget
 from svc.app.llm.schemas.tagging_schemas import TaggedActivity
 from svc.app.llm.utils.parsers import parse_response_to_json
 
@@ -17,9 +18,7 @@ logger = logging.getLogger(__name__)
 
 class ActivityTaggingService:
     def __init__(self):
-        self.model = settings.llm_model
         self.temperature = settings.llm_temperature
-        self.max_retries = settings.llm_max_retries
 
     async def tag_activities(
         self, activities: str, enums: Dict[str, Any]
@@ -29,38 +28,34 @@ class ActivityTaggingService:
         schema = self.build_activity_tagging_schema(enums)
         logger.info(prompt)
 
-        try:
-            response = llm_client.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": ACTIVITY_TAGGING_SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=self.temperature,
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "activity_array",
-                        "schema": schema,
-                    },
-                },
-            )
-
-            content = response.choices[0].message.content
-            if not content:
-                logger.error("Empty response from LLM")
-                return []
-
+        def parse(content: str) -> List[TaggedActivity]:
             content_parsed: list = parse_response_to_json(content)
             # Validate structure
             self._validate_tagged_activities(content_parsed, enums)
             # Parse and validate JSON
-            tagged_activities: List[TaggedActivity] = TaggedActivity.from_json(
-                content_parsed
-            )
+            tagged_activities = TaggedActivity.from_json(content_parsed)
             if not isinstance(tagged_activities, list):
-                logger.error("LLM response is not a JSON array")
-                return []
+                raise ValueError("LLM response is not a JSON array")
+            return tagged_activities
+
+        try:
+            with retry_budget(settings.llm_retry_budget):
+                tagged_activities: List[TaggedActivity] = await llm_client.complete(
+                    "tagging",
+                    parse,
+                    messages=[
+                        {"role": "system", "content": ACTIVITY_TAGGING_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=self.temperature,
+                    response_format={
+                        "type": "json_schema",
+                        "json_schema": {
+                            "name": "activity_array",
+                            "schema": schema,
+                        },
+                    },
+                )
 
             logger.info(f"Successfully tagged {len(tagged_activities)} activities")
             return tagged_activities
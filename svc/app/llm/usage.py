@@ -0,0 +1,105 @@
+"""Per-call LLM usage, buffered in memory and written in batches.
+
+Completions are recorded on the request path but persisted by a background
+thread, so a plan or checklist never waits on an INSERT. Each batch also
+debits users' premium token allowance, which therefore lags real usage by
+at most one flush interval.
+"""
+
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from svc.app.config import settings
+from svc.app.dal.llm_usage_repository import LLMUsageRepository
+from svc.app.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class LLMUsageRecorder:
+    def __init__(
+        self,
+        batch_size: int,
+        flush_interval_seconds: float,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.session_factory = session_factory
+        self._pending: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    def record(
+        self,
+        call_type: str,
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cached_tokens: int,
+        latency_ms: float,
+        user_id: Optional[int] = None,
+    ) -> None:
+        """Queue one completion's usage for the next batch."""
+        row = {
+            "user_id": user_id,
+            "call_type": call_type,
+            "model": model,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "cached_tokens": cached_tokens,
+            "cache_hit": cached_tokens > 0,
+            "latency_ms": latency_ms,
+            "created_at": datetime.now(timezone.utc),
+        }
+        with self._lock:
+            self._pending.append(row)
+            full = len(self._pending) >= self.batch_size
+            if self._thread is None and not self._stopped:
+                self._thread = threading.Thread(
+                    target=self._run, name="llm-usage-writer", daemon=True
+                )
+                self._thread.start()
+        if full:
+            self._wake.set()
+
+    def flush(self) -> None:
+        """Write everything recorded so far."""
+        with self._lock:
+            rows, self._pending = self._pending, []
+        if not rows:
+            return
+
+        try:
+            with self.session_factory() as db:
+                LLMUsageRepository(db).record_many(rows)
+        except Exception as e:
+            # Usage is bookkeeping; losing a batch must not break LLM features
+            logger.error(f"Failed to write {len(rows)} LLM usage rows: {e}")
+
+    def shutdown(self) -> None:
+        """Stop the writer thread and write what is left."""
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self._wake.wait(self.flush_interval_seconds)
+            self._wake.clear()
+            self.flush()
+
+
+# Singleton instance
+llm_usage_recorder = LLMUsageRecorder(
+    batch_size=settings.llm_usage_batch_size,
+    flush_interval_seconds=settings.llm_usage_flush_interval_seconds,
+)
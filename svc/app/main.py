@@ -1,7 +1,8 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST
 
 from svc.app.config import get_settings
 from svc.app.controllers import (
@@ -15,8 +16,24 @@ from svc.app.controllers import (
     user_controller,
     week_activity_controller,
 )
-from svc.app.database import create_tables
+from svc.app.dal.activity_repository import ActivityRepository
+from svc.app.database import SessionLocal, create_tables, pool_stats
+from svc.app.llm.usage import llm_usage_recorder
+from svc.app.services.user_seeding_service import UserSeedingService
 from svc.app.utils.exceptions import add_exception_handlers
+from svc.app.utils.metrics import (
+    MetricsMiddleware,
+    install_query_listeners,
+    mark_process_dead,
+    render_metrics,
+)
+from svc.app.utils.security import password_hasher
+from svc.app.utils.tracing import (
+    FASTAPI_TRACES_REQUESTS,
+    TracingMiddleware,
+    configure_tracing,
+    shutdown_tracing,
+)
 
 
 @asynccontextmanager
@@ -24,9 +41,14 @@ async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
     create_tables()
+    with SessionLocal() as db:
+        UserSeedingService(ActivityRepository(db)).sync_activity_catalog()
     yield
     # Shutdown
-    pass
+    password_hasher.shutdown()
+    llm_usage_recorder.shutdown()
+    mark_process_dead()
+    shutdown_tracing()
 
 
 def create_app() -> FastAPI:
@@ -49,6 +71,18 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # Added last so they are outermost and cover the whole request
+    app.add_middleware(
+        MetricsMiddleware,
+        repeated_query_threshold=settings.repeated_query_threshold,
+        query_count_threshold=settings.query_count_threshold,
+        # Lets endpoint tests assert a maximum query count per request
+        expose_query_count=settings.is_test,
+    )
+    if not FASTAPI_TRACES_REQUESTS:
+        app.add_middleware(TracingMiddleware)
+    install_query_listeners()
+    configure_tracing(settings)
 
     # Add exception handlers
     add_exception_handlers(app)
@@ -83,7 +117,17 @@ def create_app() -> FastAPI:
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
-        return {"status": "healthy", "service": "homeschool-api"}
+        return {
+            "status": "healthy",
+            "service": "homeschool-api",
+            "password_hashing": password_hasher.stats(),
+            "database_pool": pool_stats(),
+        }
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus metrics."""
+        return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
 
     return app
 
@@ -4,6 +4,7 @@ from .activity_suggestion import ActivitySuggestion
 from .base import Base
 from .family_preference import FamilyPreference
 from .kid import Kid
+from .llm_usage import LLMUsage
 from .user import User
 from .user_behavior_analytic import UserBehaviorAnalytic
 from .week_activity import WeekActivity
@@ -18,4 +19,5 @@ __all__ = [
     "UserBehaviorAnalytic",
     "ActivitySuggestion",
     "FamilyPreference",
+    "LLMUsage",
 ]
@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import ARRAY, Boolean, Float, ForeignKey, String
-from sqlalchemy.dialects.postgresql import ENUM
+from sqlalchemy import Boolean, Float, ForeignKey, Index, String, false, text
+from sqlalchemy.dialects.postgresql import ARRAY, ENUM
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from svc.app.datatypes.enums import (
@@ -35,11 +35,49 @@ theme_enum = ENUM(Theme, name="theme_enum", create_type=True)
 activity_type_enum = ENUM(ActivityType, name="activity_type_enum", create_type=True)
 activity_scale_enum = ENUM(ActivityScale, name="activity_scale_enum", create_type=True)
 
+# Tag arrays filtered with && (overlap); GIN lets those filters use an index
+GIN_INDEXED_ARRAY_COLUMNS = (
+    "costs",
+    "durations",
+    "participants",
+    "locations",
+    "seasons",
+    "age_groups",
+    "themes",
+    "activity_types",
+)
+
 
 class Activity(BaseModel):
-    """Activity model with enums, arrays, and relationships."""
+    """Activity model with enums, arrays, and relationships.
+
+    Rows without a user_id form the shared, read-only activity catalog. A
+    family only gets its own copy of a catalog activity (an overlay, linked
+    through catalog_activity_id) once it customizes, completes, schedules or
+    hides it; until then it sees the catalog row itself.
+    """
 
     __tablename__ = "activities"
+    __table_args__ = (
+        *(
+            Index(f"ix_activities_{column}_gin", column, postgresql_using="gin")
+            for column in GIN_INDEXED_ARRAY_COLUMNS
+        ),
+        # One overlay per family and catalog activity; also serves the
+        # "is this catalog row overlaid?" anti-join of the merged view
+        Index(
+            "uq_activities_user_catalog_activity",
+            "user_id",
+            "catalog_activity_id",
+            unique=True,
+        ),
+        Index(
+            "uq_activities_catalog_title",
+            "title",
+            unique=True,
+            postgresql_where=text("user_id IS NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -72,9 +110,18 @@ class Activity(BaseModel):
     )
     adhd_tips: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String), nullable=True)
 
-    # Foreign key to User (family) - every activity belongs to a family
-    user_id: Mapped[int] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    # Foreign key to User (family) - NULL means a shared catalog activity
+    user_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True
+    )
+
+    # Catalog activity this family row overlays, if any
+    catalog_activity_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("activities.id", ondelete="SET NULL"), nullable=True
+    )
+    # Overlay that removes the catalog activity from the family's view
+    hidden: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=false(), nullable=False
     )
 
     # Foreign key to Kid - NULL means family-level activity, value means kid-specific
@@ -119,6 +166,11 @@ class Activity(BaseModel):
     )
 
     # Properties for easier checking
+    @property
+    def is_catalog_activity(self) -> bool:
+        """True if this is a shared catalog activity rather than a family's own."""
+        return self.user_id is None
+
     @property
     def is_family_activity(self) -> bool:
         """True if this activity is assigned to the family (not a specific kid)."""
@@ -138,3 +190,21 @@ class Activity(BaseModel):
 
     def __repr__(self) -> str:
         return f"<Activity(id={self.id}, title='{self.title}')>"
+
+
+# Columns a family overlay copies from the catalog activity it overlays
+CATALOG_CONTENT_COLUMNS = tuple(
+    column.key
+    for column in Activity.__table__.columns
+    if column.key
+    not in {
+        "id",
+        "user_id",
+        "catalog_activity_id",
+        "hidden",
+        "done",
+        "assigned_to_kid_id",
+        "created_at",
+        "updated_at",
+    }
+)
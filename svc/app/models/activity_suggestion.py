@@ -60,4 +60,10 @@ class ActivitySuggestion(BaseModel):
         Index(
             "idx_activity_suggestions_activity_date", "activity_id", "suggested_date"
         ),
+        Index(
+            "idx_activity_suggestions_user_week",
+            "user_id",
+            "target_week_start",
+            "activity_id",
+        ),
     )
@@ -6,6 +6,7 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
@@ -29,13 +30,20 @@ class WeekActivity(BaseModel):
         UniqueConstraint(
             "user_id", "activity_id", "year", "week", name="uq_user_activity_week"
         ),
+        # Serves every per-user week lookup (and plain user_id filters), with the
+        # summary columns included so week summaries can be index-only scans
+        Index(
+            "ix_week_activities_user_year_week",
+            "user_id",
+            "year",
+            "week",
+            postgresql_include=["activity_id", "completed", "rating"],
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
-    user_id: Mapped[int] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE"), index=True
-    )
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     activity_id: Mapped[int] = mapped_column(
         ForeignKey("activities.id", ondelete="CASCADE"), index=True
     )
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 from dataclasses import dataclass
@@ -34,10 +35,8 @@ class ActivityExtractor:
         Initialize the extractor with optional Anthropic API key for LLM extraction.
         If no API key provided, will only use basic scraping.
         """
-        self.client = llm_client.client
-        self.model = settings.llm_model
+        self.llm_client = llm_client
         self.temperature = settings.llm_temperature
-        self.max_retries = settings.llm_max_retries
 
     def fetch_webpage(self, url: str) -> str:
         """Fetch the HTML content of a webpage."""
@@ -68,9 +67,9 @@ class ActivityExtractor:
 
         return text
 
-    def extract_with_llm(self, text: str, url: str) -> List[Activity]:
+    async def extract_with_llm(self, text: str, url: str) -> List[Activity]:
         """Use Claude to extract structured activity data from text."""
-        if not self.client:
+        if not settings.is_llm_available:
             raise ValueError(
                 "Anthropic API key not provided. Cannot use LLM extraction."
             )
@@ -138,19 +137,15 @@ Webpage URL: {url}
 Content:
 {text[:15000]}"""
 
-        message = self.client.messages.create(
-            model=self.model,
+        activities_data = await self.llm_client.complete(
+            "extractor",
+            lambda content: json.loads(content.strip()).get("activities", []),
             max_tokens=2000,
+            temperature=self.temperature,
             messages=[{"role": "user", "content": prompt}],
             response_format={"type": "json_schema", "json_schema": json_schema},
         )
 
-        response_text = message.content[0].text.strip()
-
-        # Parse JSON response (guaranteed valid with structured output)
-        response_data = json.loads(response_text)
-        activities_data = response_data.get("activities", [])
-
         # Convert to Activity objects
         activities = []
         for data in activities_data:
@@ -217,10 +212,10 @@ Content:
         print(f"Fetching content from: {url}")
         html = self.fetch_webpage(url)
 
-        if use_llm and self.client:
+        if use_llm and settings.is_llm_available:
             print("Extracting activities using LLM...")
             text = self.clean_text(html)
-            activities = self.extract_with_llm(text, url)
+            activities = asyncio.run(self.extract_with_llm(text, url))
         else:
             print("Using basic scraping (no LLM)...")
             activities = self.basic_scrape(html, url)
@@ -85,21 +85,32 @@ class ActivityService:
         if not existing_activity:
             raise NotFoundError("Activity not found")
 
+        # Customizing a catalog activity edits the family's own overlay of it
+        if existing_activity.is_catalog_activity:
+            existing_activity = self.activity_repo.materialize_for_user(
+                [activity_id], parent_id
+            )[activity_id]
+
         update_dict = activity_data.model_dump(exclude_unset=True)
-        updated_activity = self.activity_repo.update(activity_id, update_dict)
+        updated_activity = self.activity_repo.update(existing_activity.id, update_dict)
 
         return ActivityResponse.model_validate(updated_activity)
 
     def toggle_activity(self, activity_id: int, parent_id: int) -> ActivityResponse:
         """Toggle activity completion status."""
-        # Ensure activity belongs to parent
-        existing_activity = self.activity_repo.get_activity_by_parent(
-            activity_id, parent_id
-        )
-        if not existing_activity:
-            raise NotFoundError("Activity not found")
+        # Scoped to the parent, so a missing row also covers someone else's activity
+        updated_activity = self.activity_repo.toggle_done_status(activity_id, parent_id)
+        if not updated_activity:
+            # Completing a catalog activity toggles the family's overlay of it
+            overlay = self.activity_repo.materialize_for_user(
+                [activity_id], parent_id
+            ).get(activity_id)
+            if not overlay:
+                raise NotFoundError("Activity not found")
+            updated_activity = self.activity_repo.toggle_done_status(
+                overlay.id, parent_id
+            )
 
-        updated_activity = self.activity_repo.toggle_done_status(activity_id)
         return ActivityResponse.model_validate(updated_activity)
 
     def delete_activity(self, activity_id: int, parent_id: int) -> bool:
@@ -111,6 +122,15 @@ class ActivityService:
         if not existing_activity:
             raise NotFoundError("Activity not found")
 
+        # The catalog itself is shared, so catalog activities are only hidden
+        catalog_activity_id = (
+            existing_activity.id
+            if existing_activity.is_catalog_activity
+            else existing_activity.catalog_activity_id
+        )
+        if catalog_activity_id is not None:
+            return self.activity_repo.hide_for_user(catalog_activity_id, parent_id)
+
         return self.activity_repo.delete(activity_id)
 
     def get_reward_summary(self, parent_id: int) -> List[RewardSummary]:
@@ -118,16 +138,12 @@ class ActivityService:
         if not self.kid_repo:
             raise ValidationError("Kid repository not available")
 
-        kids = self.kid_repo.get_by_parent_id(parent_id)
-        summary = []
-
-        for kid in kids:
-            completed_count = self.activity_repo.get_completed_count_by_kid(kid.id)
-            summary.append(
-                RewardSummary(kid_id=kid.id, kid_name=kid.name, stars=completed_count)
+        return [
+            RewardSummary(kid_id=kid_id, kid_name=kid_name, stars=stars)
+            for kid_id, kid_name, stars in self.kid_repo.get_completed_counts_by_parent(
+                parent_id
             )
-
-        return summary
+        ]
 
     def create_tagged_activities(
         self, activities_data: List[TaggedActivity], user_id: int
@@ -7,11 +7,11 @@ from google.auth.transport import requests as google_requests
 from google.oauth2 import id_token
 from google_auth_oauthlib.flow import Flow
 from jose import JWTError, jwt
-from passlib.hash import bcrypt
 
 from svc.app.config import get_settings
 from svc.app.dal.user_repository import UserRepository
 from svc.app.datatypes.auth import (
+    AuthenticatedUser,
     GoogleAuthRequest,
     GoogleUserInfo,
     LoginRequest,
@@ -20,10 +20,29 @@ from svc.app.datatypes.auth import (
 )
 from svc.app.models.user import User
 from svc.app.services.user_seeding_service import UserSeedingService
-from svc.app.utils.exceptions import AuthenticationError, ValidationError
+from svc.app.utils import events
+from svc.app.utils.cache import VersionedCache
+from svc.app.utils.exceptions import (
+    AuthenticationError,
+    ServiceUnavailableError,
+    ValidationError,
+)
+from svc.app.utils.security import password_hasher
 
 logger = logging.getLogger(__name__)
 
+# Principals keyed by (user_id, token iat); every token of a user shares the
+# user's version, so one USER_CHANGED event drops them all
+principal_cache: VersionedCache[AuthenticatedUser] = VersionedCache(
+    ttl_seconds=get_settings().principal_cache_ttl_seconds,
+    max_entries=get_settings().principal_cache_max_entries,
+    version_key=lambda key: key[0],
+    name="principal",
+)
+events.subscribe(
+    events.USER_CHANGED, lambda user_id: principal_cache.invalidate(user_id)
+)
+
 
 security = HTTPBearer(auto_error=False)
 
@@ -38,13 +57,16 @@ class AuthService:
         self.user_seeding_service = user_seeding_service
         self.settings = get_settings()
 
-    def authenticate_user(self, email: str, password: str) -> Optional[User]:
+    async def authenticate_user(self, email: str, password: str) -> Optional[User]:
         """Authenticate user with email and password."""
         user = self.user_repo.get_by_email(email)
-        if not user or not user.is_active:
+        if not user or not user.is_active or not user.password_hash:
             return None
-        if not self._verify_password(password, user.password_hash):
+        if not await password_hasher.verify(password, user.password_hash):
             return None
+
+        if password_hasher.needs_rehash(user.password_hash):
+            await self._rehash_password(user, password)
         return user
 
     def create_access_token(self, user: User) -> TokenResponse:
@@ -67,15 +89,15 @@ class AuthService:
             expires_in=self.settings.access_token_expire_minutes * 60,
         )
 
-    def login(self, login_data: LoginRequest) -> TokenResponse:
+    async def login(self, login_data: LoginRequest) -> TokenResponse:
         """Login user and return access token."""
-        user = self.authenticate_user(login_data.email, login_data.password)
+        user = await self.authenticate_user(login_data.email, login_data.password)
         if not user:
             raise AuthenticationError("Invalid email or password")
 
         return self.create_access_token(user)
 
-    def register(self, register_data: RegisterRequest) -> TokenResponse:
+    async def register(self, register_data: RegisterRequest) -> TokenResponse:
         """Register new user and return access token."""
         # Check if user already exists
         existing_user = self.user_repo.get_by_email(register_data.email)
@@ -83,7 +105,7 @@ class AuthService:
             raise ValidationError("Email already registered")
 
         # Create new user
-        password_hash = self._hash_password(register_data.password)
+        password_hash = await password_hasher.hash(register_data.password)
         user = self.user_repo.create_user(
             email=register_data.email, password_hash=password_hash
         )
@@ -94,7 +116,7 @@ class AuthService:
 
     def get_current_user_from_token(
         self, credentials: HTTPAuthorizationCredentials
-    ) -> User:
+    ) -> AuthenticatedUser:
         """Decode JWT and return user."""
         if not credentials:
             raise AuthenticationError("Authentication required")
@@ -113,19 +135,31 @@ class AuthService:
         except JWTError:
             raise AuthenticationError("Invalid token")
 
-        user = self.user_repo.get(user_id)
+        # Tokens are cached separately, so a new login always re-checks the user
+        key = (user_id, payload.get("iat"))
+        principal = principal_cache.get(key)
+        if principal is not None:
+            return principal
+
+        version = principal_cache.version(key)
+        # A lagging replica could still show a deactivated user as active
+        user = self.user_repo.get_from_primary(user_id)
         if not user or not user.is_active:
             raise AuthenticationError("User not found or inactive")
 
-        return user
-
-    def _hash_password(self, password: str) -> str:
-        """Hash password using bcrypt."""
-        return bcrypt.hash(password)
+        principal = AuthenticatedUser.model_validate(user)
+        principal_cache.set(key, principal, version)
+        return principal
 
-    def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        """Verify password against hash."""
-        return bcrypt.verify(plain_password, hashed_password)
+    async def _rehash_password(self, user: User, password: str) -> None:
+        """Upgrade a stored hash to the configured bcrypt cost."""
+        try:
+            password_hash = await password_hasher.hash(password)
+        except ServiceUnavailableError:
+            # Not worth failing a login over; the next one will retry
+            return
+        self.user_repo.update_password(user.id, password_hash)
+        logger.info(f"Rehashed password for user {user.id}")
 
     def get_google_auth_url(self) -> str:
         """Generate Google OAuth authorization URL."""
@@ -231,7 +265,11 @@ class AuthService:
             raise AuthenticationError(f"Google authentication failed: {str(e)}")
 
     def _seed_new_user_data(self, user: User) -> None:
-        """Seed initial data for a new user using the dedicated seeding service."""
+        """Seed initial data for a new user using the dedicated seeding service.
+
+        Seeding runs inline: it copies nothing per user since activities moved
+        to the shared catalog, so it adds no queries to registration.
+        """
         try:
             seeding_summary = self.user_seeding_service.seed_new_user(user)
 
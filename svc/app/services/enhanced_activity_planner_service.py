@@ -19,13 +19,16 @@ from svc.app.datatypes.user_behavior_analytic import (
 from svc.app.datatypes.weather import WeatherInputs
 from svc.app.helpers.activity_helpers import build_min_based_batches
 from svc.app.llm.client import llm_client
+from svc.app.llm.retry import retry_budget
 from svc.app.models.activity import Activity
 from svc.app.models.activity_suggestion import ActivitySuggestion
 from svc.app.models.week_activity import WeekActivity
 from svc.app.services.activity_suggestion_service import HistoricalActivityAnalyzer
 from svc.app.services.family_profile_service import FamilyProfileService
 from svc.app.services.weather_service import WeatherService
+from svc.app.utils.exceptions import LLMProcessingError
 from svc.app.utils.parsing import parse_content
+from svc.app.utils.tracing import traced, tracer
 
 logger = logging.getLogger(__name__)
 
@@ -47,9 +50,7 @@ class EnhancedActivityPlannerService:
         self.historical_analyzer = historical_analyzer
         self.weather_service = weather_service
         self.llm_client = llm_client
-        self.model = settings.llm_model
         self.temperature = settings.llm_temperature
-        self.max_retries = settings.llm_max_retries
 
     async def plan_weekly_activities(
         self,
@@ -60,34 +61,47 @@ class EnhancedActivityPlannerService:
         """Plan weekly activities for a family."""
         try:
             # 1. Gather all required data
-            family_profile = self.family_profile_service.get_family_profile(user_id)
-            weekly_context = await self._build_weekly_context(
-                family_profile, target_week, additional_notes
-            )
-            available_activities = await self._get_filtered_activities(
-                family_profile, weekly_context, user_id
-            )
-            past_context = self.historical_analyzer.get_relevant_past_activities(
-                user_id
-            )
+            with tracer.start_as_current_span("planner.family_profile"):
+                family_profile = self.family_profile_service.get_family_profile(user_id)
+            with tracer.start_as_current_span("planner.weekly_context"):
+                weekly_context = await self._build_weekly_context(
+                    family_profile, target_week, additional_notes
+                )
+            with tracer.start_as_current_span("planner.filter_activities"):
+                available_activities = await self._get_filtered_activities(
+                    family_profile, weekly_context, user_id
+                )
+            with tracer.start_as_current_span("planner.past_context"):
+                past_context = self.historical_analyzer.get_relevant_past_activities(
+                    user_id
+                )
 
             # 2. Generate LLM recommendations
-            if weekly_context.max_activities > 0:
-                planned_activities = await self._generate_llm_recommendations(
-                    family_profile, weekly_context, available_activities, past_context
-                )
-            else:
-                planned_activities = []
+            with tracer.start_as_current_span("planner.recommendations") as span:
+                span.set_attribute("planner.candidates", len(available_activities))
+                if weekly_context.max_activities > 0:
+                    with retry_budget(settings.llm_retry_budget):
+                        planned_activities = await self._generate_llm_recommendations(
+                            user_id,
+                            family_profile,
+                            weekly_context,
+                            available_activities,
+                            past_context,
+                        )
+                else:
+                    planned_activities = []
 
             # 3. Validate and enhance recommendations
-            validated_activities = self._validate_and_enhance_recommendations(
-                planned_activities, family_profile
-            )
+            with tracer.start_as_current_span("planner.validate"):
+                validated_activities = self._validate_and_enhance_recommendations(
+                    planned_activities, family_profile
+                )
 
             # 4. Record suggestions for future learning
-            await self._record_suggestions(
-                user_id, validated_activities, weekly_context
-            )
+            with tracer.start_as_current_span("planner.record_suggestions"):
+                await self._record_suggestions(
+                    user_id, validated_activities, weekly_context
+                )
 
             return validated_activities
 
@@ -135,8 +149,10 @@ class EnhancedActivityPlannerService:
     ) -> List[dict]:
         """Get activities filtered by family profile and context, excluding already chosen ones."""
 
-        # 1️⃣ Fetch all activities
-        activities: List[Activity] = self.activity_repo.get_filtered_activities()
+        # 1️⃣ Fetch the family's activities, including the shared catalog
+        activities: List[Activity] = self.activity_repo.get_filtered_activities(
+            user_id=user_id
+        )
 
         # 2️⃣ Fetch activities already chosen for the week
         year, week, _ = weekly_context.target_week_start.isocalendar()
@@ -169,6 +185,7 @@ class EnhancedActivityPlannerService:
 
     async def _generate_llm_recommendations(
         self,
+        user_id: int,
         family_profile: "FamilyProfile",
         weekly_context: "WeeklyContext",
         available_activities: List[dict],
@@ -181,7 +198,9 @@ class EnhancedActivityPlannerService:
 
         # 🔹 Step 2: Process batches in parallel
         batch_tasks = [
-            self._process_batch(family_profile, weekly_context, batch, past_context)
+            self._process_batch(
+                user_id, family_profile, weekly_context, batch, past_context
+            )
             for batch in batches
         ]
         batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
@@ -198,80 +217,83 @@ class EnhancedActivityPlannerService:
             logger.error("No finalists produced from batches")
             return []
 
-        # 🔹 Step 3: Run one final LLM call with the finalists
-        final_recommendations = await self._process_batch(
-            family_profile,
-            weekly_context,
-            finalists,
-            past_context,
-        )
-
-        return final_recommendations or []
+        # 🔹 Step 3: Run one final LLM call with the finalists; it gates the
+        # response, so it is hedged against a slow reply, and it has its own
+        # route so a stronger model can make the final selection
+        try:
+            return await self._process_batch(
+                user_id,
+                family_profile,
+                weekly_context,
+                finalists,
+                past_context,
+                final_round=True,
+            )
+        except LLMProcessingError as e:
+            # Every finalist was already picked as a good fit by a batch
+            logger.error(f"Final planner round failed, using batch finalists: {e}")
+            return finalists[: weekly_context.max_activities]
 
+    @traced("planner.llm_batch")
     async def _process_batch(
         self,
+        user_id: int,
         family_profile: FamilyProfile,
         weekly_context: WeeklyContext,
         available_activities: List[dict],
         past_context: PastActivityContext,
+        final_round: bool = False,
     ) -> List[dict]:
-        """Generate recommendations using LLM."""
+        """Generate recommendations using LLM.
+
+        Raises:
+            LLMProcessingError: If no usable recommendations came back
+        """
         system_prompt = self._build_system_prompt(weekly_context.max_activities)
         user_prompt = self._build_user_prompt(
             family_profile, weekly_context, available_activities, past_context
         )
 
-        for attempt in range(self.max_retries):
-            try:
-                response = self.llm_client.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    temperature=self.temperature,
-                    max_tokens=2000,
-                    response_format={
-                        "type": "json_schema",
-                        "json_schema": {
-                            "name": "activity_array",
-                            "schema": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "id": {"type": "integer"},
-                                        "title": {"type": "string"},
-                                        "why_it_fits": {"type": "string"},
-                                    },
-                                    "required": ["id", "title", "why_it_fits"],
-                                },
-                                "minItems": 4,
-                                "maxItems": 7,
+        return await self.llm_client.complete(
+            "planner_final" if final_round else "planner_batch",
+            self._parse_recommendations,
+            user_id=user_id,
+            hedge=final_round,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            temperature=self.temperature,
+            max_tokens=2000,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "activity_array",
+                    "schema": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "id": {"type": "integer"},
+                                "title": {"type": "string"},
+                                "why_it_fits": {"type": "string"},
                             },
+                            "required": ["id", "title", "why_it_fits"],
                         },
+                        "minItems": 4,
+                        "maxItems": 7,
                     },
-                )
-
-                content = response.choices[0].message.content
-                if not content:
-                    logger.error("Empty response from LLM")
-                    return []
-
-                activities: list = parse_content(content)
-
-                if not isinstance(activities, list):
-                    logger.error("Response is not a JSON array")
-                    return []
-
-                return activities
+                },
+            },
+        )
 
-            except Exception as e:
-                logger.warning(f"LLM attempt {attempt + 1} failed: {e}")
-                if attempt == self.max_retries - 1:
-                    logger.error(
-                        f"Failed to get LLM recommendations after {self.max_retries} attempts"
-                    )
+    def _parse_recommendations(self, content: str) -> List[dict]:
+        """Parse the LLM's recommendations, rejecting anything but a JSON array."""
+        activities = parse_content(content)
+        # parse_content returns [] for text it cannot parse
+        if not isinstance(activities, list) or not activities:
+            raise ValueError("Response is not a non-empty JSON array")
+        return activities
 
     def _build_system_prompt(self, max_activities: Optional[int] = None) -> str:
         """Build the system prompt for the LLM."""
@@ -62,9 +62,18 @@ class FamilyPreferenceService:
         self, user_id: int, partial_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Partially update family preferences (only provided fields)."""
-        current_prefs = self.get_family_preferences(user_id)
-        updated_data = {**current_prefs, **partial_data}
-        return self.update_family_preferences(user_id, updated_data)
+        if not self.user_repo.exists(user_id):
+            raise ValueError(f"User with ID {user_id} not found")
+
+        prepared_data = self._prepare_preference_data(partial_data)
+
+        try:
+            preferences = self.family_preference_repo.create_or_update(
+                user_id, prepared_data
+            )
+            return self._preferences_to_dict(preferences)
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error: {str(e)}")
 
     def reset_family_preferences(self, user_id: int) -> None:
         """Reset family preferences to defaults by deleting custom preferences."""
@@ -1,16 +1,30 @@
 import logging
 from typing import Any, Dict
 
+from svc.app.config import settings
 from svc.app.dal.user_repository import UserRepository
-from svc.app.datatypes.enums import Cost, NewExperienceOpenness
 from svc.app.datatypes.family_preference import FamilyProfile
 from svc.app.models.kid import Kid
 from svc.app.models.user import User
 from svc.app.services.family_preference_service import FamilyPreferenceService
 from svc.app.services.kid_service import KidService
+from svc.app.utils import events
+from svc.app.utils.cache import VersionedCache
 
 logger = logging.getLogger(__name__)
 
+# Assembled profiles per user_id, dropped whenever the user, their family
+# preferences or their kids are written
+family_profile_cache: VersionedCache[FamilyProfile] = VersionedCache(
+    ttl_seconds=settings.family_profile_cache_ttl_seconds,
+    max_entries=settings.family_profile_cache_max_entries,
+    name="family_profile",
+)
+events.subscribe(
+    events.FAMILY_PROFILE_CHANGED,
+    lambda user_id: family_profile_cache.invalidate(user_id),
+)
+
 
 class FamilyProfileService:
     def __init__(
@@ -25,50 +39,18 @@ class FamilyProfileService:
 
     def get_family_profile(self, user_id: int) -> FamilyProfile:
         """Get complete family profile with smart defaults."""
-        user = self.user_repo.get(user_id)
+        cached = family_profile_cache.get(user_id)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+        version = family_profile_cache.version(user_id)
+        user = self.user_repo.get_with_family(user_id)
         if not user:
             raise ValueError(f"User {user_id} not found")
 
-        # Use the new preference service
-        preferences_data = self.family_preference_service.get_family_preferences(
-            user_id
-        )
-        kids = self.kid_service.kid_repo.get_by_parent_id(user_id)
-
-        return FamilyProfile(
-            # Core demographics from User model
-            family_size=user.family_size or 1,
-            adults_count=getattr(user, "adults_count", 1),
-            kids=[self._kid_to_dict(kid) for kid in kids],
-            # Location
-            address=user.location_for_llm
-            or user.address
-            or f"{user.city}, {user.state}",
-            zipcode=user.zipcode,
-            lat=user.latitude,
-            lng=user.longitude,
-            max_travel_distance=user.max_travel_distance or 30,
-            has_car=user.has_car,
-            # Financial
-            weekly_activity_budget=user.weekly_activity_budget,
-            preferred_cost_ranges=preferences_data.get(
-                "preferred_cost_ranges", [Cost.FREE, Cost.LOW]
-            ),
-            # Time & Preferences
-            available_days=preferences_data.get("available_days", []),
-            preferred_time_slots=preferences_data.get("preferred_time_slots", []),
-            max_activities_per_week=user.max_activities_per_week,
-            preferred_themes=preferences_data.get("preferred_themes", []),
-            preferred_activity_types=preferences_data.get(
-                "preferred_activity_types", []
-            ),
-            group_activity_comfort=preferences_data.get(
-                "group_activity_comfort",
-            ),
-            new_experience_openness=preferences_data.get(
-                "new_experience_openness", NewExperienceOpenness.MODERATE
-            ),
-        )
+        profile = self._build_profile(user)
+        family_profile_cache.set(user_id, profile, version)
+        return profile.model_copy(deep=True)
 
     def update_family_demographics(self, user_id: int, demographics: dict) -> User:
         """Update core family demographics on User model."""
@@ -94,6 +76,39 @@ class FamilyProfileService:
         """Reset family preferences to defaults using the new service."""
         return self.family_preference_service.reset_family_preferences(user_id)
 
+    def _build_profile(self, user: User) -> FamilyProfile:
+        preferences = user.family_preferences
+
+        def preference(field: str) -> Any:
+            return getattr(preferences, field) if preferences else None
+
+        return FamilyProfile(
+            # Core demographics from User model
+            family_size=user.family_size or 1,
+            adults_count=getattr(user, "adults_count", 1),
+            kids=[self._kid_to_dict(kid) for kid in user.kids],
+            # Location
+            address=user.location_for_llm
+            or user.address
+            or f"{user.city}, {user.state}",
+            zipcode=user.zipcode,
+            lat=user.latitude,
+            lng=user.longitude,
+            max_travel_distance=user.max_travel_distance or 30,
+            has_car=user.has_car,
+            # Financial
+            weekly_activity_budget=user.weekly_activity_budget,
+            preferred_cost_ranges=preference("preferred_cost_ranges") or [],
+            # Time & Preferences
+            available_days=preference("available_days") or [],
+            preferred_time_slots=preference("preferred_time_slots") or [],
+            max_activities_per_week=user.max_activities_per_week,
+            preferred_themes=preference("preferred_themes") or [],
+            preferred_activity_types=preference("preferred_activity_types") or [],
+            group_activity_comfort=preference("group_activity_comfort"),
+            new_experience_openness=preference("new_experience_openness"),
+        )
+
     def _kid_to_dict(self, kid: Kid) -> dict:
         """Convert Kid model to dictionary format."""
         return {
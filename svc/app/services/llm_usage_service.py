@@ -0,0 +1,29 @@
+from datetime import datetime, timedelta, timezone
+
+from svc.app.dal.llm_usage_repository import LLMUsageRepository
+from svc.app.datatypes.llm_usage import LLMUsageDay, LLMUsageResponse
+
+
+class LLMUsageService:
+    """Service for reporting a user's LLM usage."""
+
+    def __init__(self, llm_usage_repository: LLMUsageRepository):
+        self.llm_usage_repo = llm_usage_repository
+
+    def get_usage(self, user_id: int, days: int = 30) -> LLMUsageResponse:
+        """Usage per day and call type over the last days, including today."""
+        today = datetime.now(timezone.utc).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        since = today - timedelta(days=days - 1)
+        usage = [
+            LLMUsageDay(**row)
+            for row in self.llm_usage_repo.get_daily_usage(user_id, since)
+        ]
+        return LLMUsageResponse(
+            remaining_tokens=self.llm_usage_repo.get_remaining_tokens(user_id),
+            total_tokens=sum(
+                day.prompt_tokens + day.completion_tokens for day in usage
+            ),
+            days=usage,
+        )
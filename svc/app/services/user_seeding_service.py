@@ -1,9 +1,8 @@
 import logging
-from typing import List, Optional
+from typing import List
 
 from svc.app.dal.activity_repository import ActivityRepository
 from svc.app.data.generic_activities import GENERIC_FAMILY_ACTIVITIES
-from svc.app.models.activity import Activity
 from svc.app.models.user import User
 
 logger = logging.getLogger(__name__)
@@ -19,14 +18,13 @@ class UserSeedingService:
         """
         Seed all initial data for a new user.
         Returns a summary of what was seeded.
+
+        Generic activities live in the shared catalog, which every family
+        already sees, so nothing is copied per user.
         """
         seeding_summary = {"user_id": user.id, "activities_created": 0, "errors": []}
 
         try:
-            # Seed activities
-            activities_count = self._seed_activities(user)
-            seeding_summary["activities_created"] = activities_count
-
             # Add other seeding methods here as your app grows
             # self._seed_default_preferences(user)
             # self._seed_welcome_messages(user)
@@ -36,48 +34,32 @@ class UserSeedingService:
             )
 
         except Exception as e:
-            logger.exception(f"Failed to seed data for user {user.id}: {str(e)}")
+            error_msg = f"Failed to seed data for user {user.id}: {str(e)}"
+            logger.exception(error_msg)
             seeding_summary["errors"].append(error_msg)
 
         return seeding_summary
 
-    def _seed_activities(self, user: User) -> int:
+    def sync_activity_catalog(self) -> int:
         """
-        Seed default activities for a new user.
-        Returns the number of activities created.
+        Insert or refresh the shared catalog from the generic templates.
+        Returns the number of catalog activities written.
         """
         try:
-            activities_data = self._prepare_activities_data(user)
-
-            if not activities_data:
-                logger.warning(f"No activities to seed for user {user.id}")
-                return 0
-
-            # Use bulk create for better performance
-            created_activities = self.activity_repo.bulk_create_activities(
-                activities_data
-            )
-
-            logger.info(
-                f"Created {len(created_activities)} activities for user {user.id}"
-            )
-            return len(created_activities)
+            count = self.activity_repo.sync_catalog(self._prepare_catalog_data())
+            logger.info(f"Synced {count} activities into the shared catalog")
+            return count
 
         except Exception as e:
-            logger.exception(f"Failed to seed activities for user {user.id}: {str(e)}")
+            logger.exception(f"Failed to sync the activity catalog: {str(e)}")
             raise
 
-    def _prepare_activities_data(self, user: User) -> List[dict]:
-        """Prepare activities data from generic templates."""
-        activities_data = []
-
-        for generic_activity in GENERIC_FAMILY_ACTIVITIES:
-            activity_data = {
+    def _prepare_catalog_data(self) -> List[dict]:
+        """Prepare catalog rows from generic templates."""
+        return [
+            {
                 "title": generic_activity.title,
                 "description": generic_activity.description,
-                "user_id": user.id,
-                "assigned_to_kid_id": None,  # Will be assigned when kids are added
-                "done": False,
                 "llm_generated": False,
                 "costs": generic_activity.costs,
                 "durations": generic_activity.durations,
@@ -92,9 +74,8 @@ class UserSeedingService:
                 "primary_theme": generic_activity.primary_theme,
                 "activity_scale": generic_activity.activity_scale,
             }
-            activities_data.append(activity_data)
-
-        return activities_data
+            for generic_activity in GENERIC_FAMILY_ACTIVITIES
+        ]
 
     def _seed_default_preferences(self, user: User) -> None:
         """Seed default user preferences (example for future use)."""
@@ -119,18 +100,15 @@ class UserSeedingService:
 
     def reseed_activities(self, user: User, overwrite: bool = False) -> int:
         """
-        Reseed activities for an existing user.
-        Useful for updating users with new generic activities.
+        Reset an existing user's view of the generic activities.
+        Drops the user's catalog overlays so the current catalog versions show
+        again; completed overlays are kept unless overwrite is set.
+        Returns the number of overlays removed.
         """
         try:
-            if overwrite:
-                # Delete existing activities (be careful with this!)
-                existing_activities = self.activity_repo.get_by_parent_id(user.id)
-                for activity in existing_activities:
-                    if not activity.done:  # Don't delete completed activities
-                        self.activity_repo.delete(activity.id)
-
-            return self._seed_activities(user)
+            return self.activity_repo.reset_overlays(
+                user.id, keep_completed=not overwrite
+            )
 
         except Exception as e:
             logger.exception(
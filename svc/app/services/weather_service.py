@@ -3,8 +3,11 @@ from datetime import date
 from typing import List
 
 import requests
+from opentelemetry.trace import SpanKind
 
 from svc.app.datatypes.weather import WeatherDay, WeatherInputs
+from svc.app.utils.metrics import WEATHER_ERRORS, WEATHER_REQUEST_DURATION, track_call
+from svc.app.utils.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
@@ -52,10 +55,14 @@ class WeatherService:
 
     def geocode_location(self, location: str) -> dict:
         """Convert a place name into latitude/longitude using Open-Meteo Geocoding API."""
-        resp = requests.get(
-            self.GEO_URL, params={"name": location, "count": 1}, timeout=10
-        )
-        resp.raise_for_status()
+        with (
+            tracer.start_as_current_span("weather geocode", kind=SpanKind.CLIENT),
+            track_call(WEATHER_REQUEST_DURATION, WEATHER_ERRORS, "geocode"),
+        ):
+            resp = requests.get(
+                self.GEO_URL, params={"name": location, "count": 1}, timeout=10
+            )
+            resp.raise_for_status()
         data = resp.json()
         if "results" in data and data["results"]:
             result = data["results"][0]
@@ -83,8 +90,12 @@ class WeatherService:
             "forecast_days": self.forecast_days,
             "timezone": "auto",
         }
-        resp = requests.get(self.FORECAST_URL, params=params, timeout=10)
-        resp.raise_for_status()
+        with (
+            tracer.start_as_current_span("weather forecast", kind=SpanKind.CLIENT),
+            track_call(WEATHER_REQUEST_DURATION, WEATHER_ERRORS, "forecast"),
+        ):
+            resp = requests.get(self.FORECAST_URL, params=params, timeout=10)
+            resp.raise_for_status()
         data = resp.json()
         daily = data.get("daily", {})
 
@@ -1,5 +1,5 @@
 import logging
-from datetime import date
+from datetime import date, timedelta
 from typing import List, Optional
 
 from fastapi import HTTPException, status
@@ -10,14 +10,19 @@ from svc.app.dal.user_repository import UserRepository
 from svc.app.dal.week_activity_repository import WeekActivityRepository
 from svc.app.datatypes.week_activity import (
     BulkWeekActivityCreate,
+    BulkWeekActivityResult,
     WeekActivityCreate,
     WeekActivityResponse,
     WeekActivityUpdate,
+    WeekStats,
     WeekSummary,
 )
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TREND_WEEKS = 12
+MAX_TREND_WEEKS = 156
+
 
 class WeekActivityService:
     def __init__(
@@ -36,21 +41,17 @@ class WeekActivityService:
         self, user_id: int, week_activity_data: WeekActivityCreate
     ) -> WeekActivityResponse:
         """Create a new week activity assignment with validation."""
-        # Validate that activity exists
-        activity = self.activity_repo.get(week_activity_data.activity_id)
+        # Validate that activity exists; catalog activities get a family overlay
+        activity = self.activity_repo.materialize_for_user(
+            [week_activity_data.activity_id], user_id
+        ).get(week_activity_data.activity_id)
         if not activity:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Activity with id {week_activity_data.activity_id} not found",
             )
 
-        # Merge Activity defaults into assignment if missing
-        wa_data = week_activity_data.model_dump()
-        for field in ("equipment", "instructions", "adhd_tips"):
-            if not wa_data.get(field):
-                wa_data[field] = getattr(activity, field) or []
-
-        week_activity_data = WeekActivityCreate(**wa_data)
+        week_activity_data = self._merge_activity_defaults(week_activity_data, activity)
         try:
             week_activity = self.week_activity_repo.create_week_activity(
                 user_id, week_activity_data
@@ -82,19 +83,18 @@ class WeekActivityService:
             )
         return self._convert_to_response(week_activity)
 
-    def toggle_week_activity(self, week_activity_id: int) -> WeekActivityResponse:
+    def toggle_week_activity(
+        self, week_activity_id: int, user_id: Optional[int] = None
+    ) -> WeekActivityResponse:
         """Toggle the completion status of a week activity."""
-        # First get the current activity
-        week_activity = self.week_activity_repo.get(week_activity_id)
-
+        week_activity = self.week_activity_repo.toggle_completed(
+            week_activity_id, user_id=user_id
+        )
         if not week_activity:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Week activity not found"
             )
-
-        # Toggle completion status
-        update_data = WeekActivityUpdate(completed=not week_activity.completed)
-        return self.update_week_activity(week_activity_id, update_data)
+        return self._convert_to_response(week_activity)
 
     def get_current_week_activities(
         self, user_id: Optional[int] = None
@@ -123,6 +123,7 @@ class WeekActivityService:
         year: Optional[int] = None,
         week: Optional[int] = None,
         user_id: Optional[int] = None,
+        include_activities: bool = True,
     ) -> WeekSummary:
         """Get a summary of activities for a specific week (defaults to current week)."""
         if year is None or week is None:
@@ -132,7 +133,35 @@ class WeekActivityService:
             week = week or current_week
 
         return self.week_activity_repo.get_week_summary(
-            year=year, week=week, user_id=user_id
+            year=year,
+            week=week,
+            user_id=user_id,
+            include_activities=include_activities,
+        )
+
+    def get_week_trends(
+        self,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[WeekStats]:
+        """Get per-week stats for a date range (defaults to the last 12 weeks)."""
+        end_date = end_date or date.today()
+        start_date = start_date or end_date - timedelta(weeks=DEFAULT_TREND_WEEKS - 1)
+
+        if start_date > end_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="start_date must be on or before end_date",
+            )
+        if (end_date - start_date).days // 7 >= MAX_TREND_WEEKS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Date range cannot span more than {MAX_TREND_WEEKS} weeks",
+            )
+
+        return self.week_activity_repo.get_weekly_stats(
+            user_id=user_id, start_date=start_date, end_date=end_date
         )
 
     def delete_week_activity(self, week_activity_id: int) -> bool:
@@ -192,9 +221,15 @@ class WeekActivityService:
         weeks = self.week_activity_repo.get_weeks_with_activities(user_id=user_id)
 
         result = []
-        for year, week in weeks:
+        for year, week, total_activities, completed_activities in weeks:
             result.append(
-                {"year": year, "week": week, "display": f"Week {week}, {year}"}
+                {
+                    "year": year,
+                    "week": week,
+                    "display": f"Week {week}, {year}",
+                    "total_activities": total_activities,
+                    "completed_activities": completed_activities,
+                }
             )
 
         return result
@@ -211,29 +246,14 @@ class WeekActivityService:
                 detail=f"User with id {user_id} not found",
             )
 
-        enriched_assignments: list[WeekActivityCreate] = []
-
-        # Validate and enrich assignments
-        for assignment in bulk_data.assignments:
-            activity = self.activity_repo.get(assignment.activity_id)
-            if not activity:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Activity with id {assignment.activity_id} not found",
-                )
-
-            # Merge Activity defaults into assignment if missing
-            assignment_data = assignment.model_dump()
-            for field in ("equipment", "instructions", "adhd_tips"):
-                if not assignment_data.get(field):
-                    assignment_data[field] = getattr(activity, field) or []
-
-            enriched_assignments.append(WeekActivityCreate(**assignment_data))
+        enriched_assignments, activities_by_id = self._enrich_assignments(
+            user_id, bulk_data.assignments
+        )
 
         # Create all week activities
         try:
             week_activities = self.week_activity_repo.bulk_create_week_activities(
-                user_id, enriched_assignments
+                user_id, enriched_assignments, activities_by_id
             )
             return [self._convert_to_response(wa) for wa in week_activities]
 
@@ -248,6 +268,88 @@ class WeekActivityService:
                 detail="Failed to create week activities",
             )
 
+    def upsert_week_activities(
+        self,
+        user_id: int,
+        bulk_data: BulkWeekActivityCreate,
+        skip_missing: bool = False,
+    ) -> BulkWeekActivityResult:
+        """Create assignments, updating the LLM notes of ones that already exist.
+
+        With ``skip_missing`` unknown activity ids are dropped instead of
+        failing the whole batch (used for LLM-generated plans).
+        """
+        enriched_assignments, activities_by_id = self._enrich_assignments(
+            user_id, bulk_data.assignments, skip_missing=skip_missing
+        )
+
+        rows = self.week_activity_repo.upsert_week_activities(
+            user_id, enriched_assignments, activities_by_id
+        )
+        result = BulkWeekActivityResult(
+            created=[
+                self._convert_to_response(wa) for wa, inserted in rows if inserted
+            ],
+            updated=[
+                self._convert_to_response(wa) for wa, inserted in rows if not inserted
+            ],
+        )
+        logger.info(
+            f"Upserted week activities for user {user_id}: "
+            f"{len(result.created)} created, {len(result.updated)} already existed"
+        )
+        return result
+
+    def _enrich_assignments(
+        self,
+        user_id: int,
+        assignments: List[WeekActivityCreate],
+        skip_missing: bool = False,
+    ) -> tuple[List[WeekActivityCreate], dict]:
+        """Resolve the referenced activities to family rows and merge their defaults.
+
+        Catalog activities are copied into family overlays, and assignments
+        are re-pointed at those, so schedules only reference family rows.
+        """
+        activity_ids = [assignment.activity_id for assignment in assignments]
+        owned_by_requested_id = self.activity_repo.materialize_for_user(
+            activity_ids, user_id
+        )
+        missing_ids = sorted(set(activity_ids) - owned_by_requested_id.keys())
+        if missing_ids:
+            if not skip_missing:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Activities with ids {missing_ids} not found",
+                )
+            logger.warning(
+                f"Skipping unknown activities {missing_ids} for user {user_id}"
+            )
+
+        enriched_assignments = [
+            self._merge_activity_defaults(
+                assignment, owned_by_requested_id[assignment.activity_id]
+            )
+            for assignment in assignments
+            if assignment.activity_id in owned_by_requested_id
+        ]
+        activities_by_id = {
+            activity.id: activity for activity in owned_by_requested_id.values()
+        }
+        return enriched_assignments, activities_by_id
+
+    @staticmethod
+    def _merge_activity_defaults(
+        assignment: WeekActivityCreate, activity
+    ) -> WeekActivityCreate:
+        """Point the assignment at the activity and fill missing checklist fields."""
+        assignment_data = assignment.model_dump()
+        assignment_data["activity_id"] = activity.id
+        for field in ("equipment", "instructions", "adhd_tips"):
+            if not assignment_data.get(field):
+                assignment_data[field] = getattr(activity, field) or []
+        return WeekActivityCreate(**assignment_data)
+
     def _convert_to_response(self, week_activity) -> WeekActivityResponse:
         """Convert a WeekActivity model to response format."""
         return WeekActivityResponse(
@@ -0,0 +1,101 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from svc.app.utils.metrics import CACHE_LOOKUPS, child
+
+V = TypeVar("V")
+
+
+class VersionedCache(Generic[V]):
+    """Thread-safe in-process LRU cache with per-key version stamps and a TTL.
+
+    Readers take ``version(key)`` before loading a value and pass it to
+    ``set``. ``invalidate`` bumps the key's version, so a value loaded while a
+    write was in flight is never stored over the newer state. The cache is
+    per process; other workers only see a change once their entry expires.
+
+    ``version_key`` maps a cache key to the key its version is tracked under,
+    so several entries (e.g. one per token of a user) can be invalidated with
+    a single ``invalidate`` call on the shared version key.
+
+    When ``name`` is given, hits and misses are counted under it in the
+    cache_lookups_total metric.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int = 10_000,
+        version_key: Callable[[Hashable], Hashable] = lambda key: key,
+        name: Optional[str] = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.version_key = version_key
+        self._entries: "OrderedDict[Hashable, Tuple[int, float, V]]" = OrderedDict()
+        self._versions: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+        self._hits = child(CACHE_LOOKUPS, name, "hit") if name else None
+        self._misses = child(CACHE_LOOKUPS, name, "miss") if name else None
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def version(self, key: Hashable) -> int:
+        with self._lock:
+            return self._current_version(key)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value, or None when missing, stale or expired."""
+        value = self._lookup(key)
+        if self._hits is not None and self.enabled:
+            (self._misses if value is None else self._hits).inc()
+        return value
+
+    def _lookup(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            version, expires_at, value = entry
+            if version != self._current_version(key) or time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: V, version: int) -> None:
+        """Store a value loaded at ``version``; ignored if the key changed since."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            if version != self._current_version(key):
+                return
+
+            self._entries[key] = (version, time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, version_key: Hashable) -> None:
+        """Drop every entry tracked under version_key."""
+        with self._lock:
+            self._versions[version_key] = self._versions.get(version_key, 0) + 1
+            # Other entries under this version key are dropped lazily by get()
+            self._entries.pop(version_key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in self._entries:
+                version_key = self.version_key(key)
+                self._versions[version_key] = self._versions.get(version_key, 0) + 1
+            self._entries.clear()
+
+    def _current_version(self, key: Hashable) -> int:
+        return self._versions.get(self.version_key(key), 0)
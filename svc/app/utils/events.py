@@ -0,0 +1,33 @@
+"""In-process domain events, used to keep caches in step with writes."""
+
+import logging
+from collections import defaultdict
+from typing import Any, Callable, DefaultDict, List
+
+logger = logging.getLogger(__name__)
+
+# Published with user_id after a committed write to the user, their
+# family preferences or their kids
+FAMILY_PROFILE_CHANGED = "family_profile_changed"
+# Published with user_id after a committed write to the user row
+USER_CHANGED = "user_changed"
+
+_subscribers: DefaultDict[str, List[Callable[..., None]]] = defaultdict(list)
+
+
+def subscribe(event: str, handler: Callable[..., None]) -> None:
+    """Call handler with the event payload whenever event is published."""
+    _subscribers[event].append(handler)
+
+
+def publish(event: str, **payload: Any) -> None:
+    """Notify every subscriber of an event.
+
+    Handler failures are logged rather than raised: the write that published
+    the event has already been committed.
+    """
+    for handler in _subscribers[event]:
+        try:
+            handler(**payload)
+        except Exception as e:
+            logger.error(f"Handler for {event} failed: {e}")
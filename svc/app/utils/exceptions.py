@@ -57,6 +57,13 @@ class ConflictError(HomeschoolException):
         super().__init__(message, status.HTTP_409_CONFLICT)
 
 
+class ServiceUnavailableError(HomeschoolException):
+    """Temporary overload exception."""
+
+    def __init__(self, message: str = "Service temporarily unavailable"):
+        super().__init__(message, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
 class LLMProcessingError(Exception):
     """Raised when LLM processing fails"""
 
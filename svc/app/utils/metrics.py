@@ -0,0 +1,363 @@
+"""Prometheus metrics for requests, the database and external services.
+
+With several worker processes, set PROMETHEUS_MULTIPROC_DIR to an empty,
+writable directory before the workers start: each process then writes its
+samples there and /metrics aggregates all of them.
+
+Statements are also counted per request and grouped by shape (the SQL with
+its parameters stripped), so a request that runs the same query once per row
+- an N+1 - is logged with the offending statement.
+"""
+
+import logging
+import os
+import re
+import time
+from collections import Counter as StatementCounter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests", ["method", "route", "status"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ["method", "route"]
+)
+HTTP_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests being handled",
+    multiprocess_mode="livesum",
+)
+
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Duration of a single database statement",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "Database statements issued while handling a request",
+    ["route"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "db_time_per_request_seconds",
+    "Time spent in database statements while handling a request",
+    ["route"],
+)
+DB_REPEATED_STATEMENTS = Counter(
+    "db_repeated_statements_total",
+    "Requests that ran one statement shape more often than allowed",
+    ["route"],
+)
+
+LLM_REQUEST_DURATION = Histogram(
+    "llm_request_duration_seconds",
+    "LLM completion latency",
+    ["service", "model"],
+    buckets=(0.25, 0.5, 1, 2, 4, 8, 16, 32, 64),
+)
+LLM_ERRORS = Counter(
+    "llm_errors_total", "Failed LLM completions", ["service", "model", "error"]
+)
+LLM_TOKENS = Counter(
+    "llm_tokens_total", "Tokens reported by the LLM API", ["service", "kind"]
+)
+LLM_RETRIES = Counter(
+    "llm_retries_total", "LLM calls retried after a failure", ["service", "reason"]
+)
+LLM_OUTCOMES = Counter(
+    "llm_outcomes_total",
+    "LLM attempts by model and result: ok, or why the attempt was given up on",
+    ["service", "model", "outcome"],
+)
+LLM_HEDGES = Counter(
+    "llm_hedges_total",
+    "Duplicate LLM calls sent after the p95 delay, by which copy answered",
+    ["service", "winner"],
+)
+LLM_QUEUE_WAIT = Histogram(
+    "llm_queue_wait_seconds",
+    "Time an LLM request waited for a concurrency or rate limit slot",
+    ["model", "service"],
+    buckets=(0.005, 0.025, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60),
+)
+LLM_QUEUED = Gauge(
+    "llm_requests_queued",
+    "LLM requests waiting for a slot",
+    ["model"],
+    multiprocess_mode="livesum",
+)
+LLM_IN_FLIGHT = Gauge(
+    "llm_requests_in_flight",
+    "LLM requests holding a slot",
+    ["model"],
+    multiprocess_mode="livesum",
+)
+
+WEATHER_REQUEST_DURATION = Histogram(
+    "weather_api_request_duration_seconds", "Weather API latency", ["endpoint"]
+)
+WEATHER_ERRORS = Counter(
+    "weather_api_errors_total", "Failed weather API calls", ["endpoint", "error"]
+)
+
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total", "In-process cache lookups", ["cache", "result"]
+)
+
+UNMATCHED_ROUTE = "unmatched"
+
+# Children are resolved once per label set: labels() takes the metric's lock
+_children: Dict[Tuple[Any, Tuple[str, ...]], Any] = {}
+
+
+def child(metric: Any, *labels: str) -> Any:
+    """Return the metric's child for these label values."""
+    key = (metric, labels)
+    labelled = _children.get(key)
+    if labelled is None:
+        labelled = _children.setdefault(key, metric.labels(*labels))
+    return labelled
+
+
+@contextmanager
+def track_call(duration: Histogram, errors: Counter, *labels: str) -> Iterator[None]:
+    """Time a call to an external service and count its failures by type."""
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        child(errors, *labels, type(e).__name__).inc()
+        raise
+    finally:
+        child(duration, *labels).observe(time.perf_counter() - started)
+
+
+# ---------------------------
+# Database statements
+# ---------------------------
+_PARAMETER = re.compile(r"%\(\w+\)s|%s|\$\d+|\?")
+_PARAMETER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def statement_shape(statement: str) -> str:
+    """The statement with parameters replaced, so repeats compare equal."""
+    # Expanded IN lists differ in length per call; collapse them too
+    shape = _PARAMETER.sub("?", statement)
+    shape = _PARAMETER_LIST.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+    # Raw statement text to executions; shapes are only worked out when read
+    statements: StatementCounter = field(default_factory=StatementCounter)
+
+    def shapes(self) -> StatementCounter:
+        """Executions per statement shape."""
+        shapes: StatementCounter = StatementCounter()
+        for statement, count in self.statements.items():
+            shapes[statement_shape(statement)] += count
+        return shapes
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Shapes run at least threshold times, most frequent first."""
+        return [
+            (shape, count)
+            for shape, count in self.shapes().most_common()
+            if count >= threshold
+        ]
+
+
+# Set by MetricsMiddleware for the duration of a request; threadpool
+# endpoints share it because the context is copied into the worker thread
+_request_queries: ContextVar[Optional[QueryStats]] = ContextVar(
+    "request_queries", default=None
+)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Statements run so far by the request being handled, if any."""
+    return _request_queries.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context.metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "metrics_started", None)
+    if started is None:
+        return
+
+    elapsed = time.perf_counter() - started
+    DB_QUERY_DURATION.observe(elapsed)
+
+    stats = _request_queries.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+        stats.statements[statement] += 1
+
+
+def install_query_listeners() -> None:
+    """Time every statement run by any engine, primary or replica."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    """Count the statements run inside the block, e.g. by a service in a test."""
+    install_query_listeners()
+    stats = QueryStats()
+    token = _request_queries.set(stats)
+    try:
+        yield stats
+    finally:
+        _request_queries.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryStats]:
+    """Fail if the block runs more than limit statements."""
+    with count_queries() as stats:
+        yield stats
+    if stats.count > limit:
+        details = "\n".join(
+            f"  {count} x {shape}" for shape, count in stats.shapes().most_common()
+        )
+        raise AssertionError(
+            f"Expected at most {limit} queries, ran {stats.count}:\n{details}"
+        )
+
+
+# ---------------------------
+# HTTP
+# ---------------------------
+def route_template(scope) -> str:
+    """Full path template of the route that handled the request."""
+    # Routes under an included router only know their path relative to its
+    # prefix; FastAPI records the combined one alongside
+    included = scope.get("fastapi", {}).get("effective_route_context")
+    if included is not None:
+        return included.path
+    return getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+
+
+class MetricsMiddleware:
+    """Record count, latency and database use of every HTTP request.
+
+    Requests are labelled by route template rather than raw path, so ids in
+    URLs do not create a new series each. A warning is logged when a request
+    runs one statement shape repeated_query_threshold times or more, or runs
+    more than query_count_threshold statements in total (0 disables either).
+    With expose_query_count, responses carry the number of statements run
+    before they were sent in an X-DB-Query-Count header, for endpoint tests.
+    """
+
+    def __init__(
+        self,
+        app,
+        repeated_query_threshold: int = 0,
+        query_count_threshold: int = 0,
+        expose_query_count: bool = False,
+    ):
+        self.app = app
+        self.repeated_query_threshold = repeated_query_threshold
+        self.query_count_threshold = query_count_threshold
+        self.expose_query_count = expose_query_count
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        stats = QueryStats()
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.expose_query_count:
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"x-db-query-count", str(stats.count).encode()),
+                    ]
+            await send(message)
+
+        token = _request_queries.set(stats)
+        HTTP_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_FLIGHT.dec()
+            _request_queries.reset(token)
+
+            route = route_template(scope)
+            method = scope["method"]
+            child(HTTP_REQUESTS, method, route, str(status_code)).inc()
+            child(HTTP_REQUEST_DURATION, method, route).observe(elapsed)
+            child(DB_QUERIES_PER_REQUEST, route).observe(stats.count)
+            child(DB_TIME_PER_REQUEST, route).observe(stats.seconds)
+            self._check_query_use(method, route, stats)
+
+    def _check_query_use(self, method: str, route: str, stats: QueryStats) -> None:
+        if self.query_count_threshold and stats.count > self.query_count_threshold:
+            logger.warning(
+                f"{method} {route} ran {stats.count} queries "
+                f"(threshold {self.query_count_threshold})"
+            )
+
+        if not self.repeated_query_threshold:
+            return
+        repeated = stats.repeated(self.repeated_query_threshold)
+        if repeated:
+            child(DB_REPEATED_STATEMENTS, route).inc()
+            for shape, count in repeated:
+                logger.warning(
+                    f"Possible N+1: {method} {route} ran {count} x {shape[:500]}"
+                )
+
+
+def render_metrics() -> bytes:
+    """Metrics in the Prometheus text format, across workers when multiprocess."""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest()
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the multiprocess aggregate."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
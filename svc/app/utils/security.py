@@ -1,11 +1,19 @@
+import asyncio
+import contextvars
 import secrets
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
 from jose import JWTError, jwt
 from passlib.hash import bcrypt
 
 from ..config import get_settings
+from .exceptions import ServiceUnavailableError
+from .tracing import tracer
 
 
 def generate_secret_key(length: int = 32) -> str:
@@ -47,10 +55,149 @@ def verify_jwt_token(token: str) -> Optional[dict]:
 
 
 def hash_password(password: str) -> str:
-    """Hash password using bcrypt."""
-    return bcrypt.hash(password)
+    """Hash password using bcrypt at the configured work factor."""
+    return bcrypt.using(rounds=get_settings().bcrypt_rounds).hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify password against hash."""
     return bcrypt.verify(plain_password, hashed_password)
+
+
+class _LatencyStats:
+    """Running latency figures for one kind of password operation."""
+
+    def __init__(self, window: int = 512):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.total_wait_seconds = 0.0
+        self.max_seconds = 0.0
+        self.recent = deque(maxlen=window)
+
+    def record(self, seconds: float, wait_seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.total_wait_seconds += wait_seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.recent.append(seconds)
+
+    def summary(self) -> Dict[str, Any]:
+        recent = sorted(self.recent)
+        return {
+            "count": self.count,
+            "avg_ms": (
+                round(1000 * self.total_seconds / self.count, 2) if self.count else None
+            ),
+            "p95_ms": (
+                round(1000 * recent[int(0.95 * (len(recent) - 1))], 2)
+                if recent
+                else None
+            ),
+            "max_ms": round(1000 * self.max_seconds, 2),
+            "avg_wait_ms": (
+                round(1000 * self.total_wait_seconds / self.count, 2)
+                if self.count
+                else None
+            ),
+        }
+
+
+class PasswordHasher:
+    """Runs bcrypt on a dedicated, bounded thread pool.
+
+    bcrypt deliberately burns CPU for a few hundred milliseconds; running it on
+    the event loop or the shared request threads lets a login burst stall
+    every other endpoint. At most ``workers`` hashes run at once and at most
+    ``max_queue`` more may wait; beyond that callers get a 503 straight away
+    instead of piling up.
+    """
+
+    def __init__(self, rounds: int, workers: int, max_queue: int):
+        self.rounds = rounds
+        self.workers = workers
+        self.max_queue = max_queue
+        self._context = bcrypt.using(rounds=rounds)
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._running = 0
+        self._rejected = 0
+        self._latency = {"hash": _LatencyStats(), "verify": _LatencyStats()}
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", self._context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run("verify", bcrypt.verify, password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Check whether a stored hash uses a different cost than configured."""
+        return self._context.needs_update(hashed_password)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rounds": self.rounds,
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "queue_depth": self._waiting,
+                "in_flight": self._running,
+                "rejected": self._rejected,
+                **{name: stats.summary() for name, stats in self._latency.items()},
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, operation: str, func: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._waiting + self._running >= self.workers + self.max_queue:
+                self._rejected += 1
+                raise ServiceUnavailableError(
+                    "Too many sign-in requests right now, please retry shortly"
+                )
+            self._waiting += 1
+
+        try:
+            # Run in a copy of the caller's context so the hash is traced
+            # under the request that asked for it
+            future = self._executor.submit(
+                contextvars.copy_context().run,
+                self._timed,
+                operation,
+                time.perf_counter(),
+                func,
+                *args,
+            )
+        except RuntimeError:
+            # The executor has been shut down, so the job never started
+            with self._lock:
+                self._waiting -= 1
+            raise
+        return await asyncio.wrap_future(future)
+
+    def _timed(
+        self, operation: str, submitted: float, func: Callable[..., Any], *args: Any
+    ) -> Any:
+        started = time.perf_counter()
+        with self._lock:
+            self._waiting -= 1
+            self._running += 1
+        try:
+            with tracer.start_as_current_span(f"password {operation}") as span:
+                span.set_attribute("password.wait_ms", (started - submitted) * 1000)
+                return func(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._running -= 1
+                self._latency[operation].record(elapsed, started - submitted)
+
+
+password_hasher = PasswordHasher(
+    rounds=get_settings().bcrypt_rounds,
+    workers=get_settings().password_hash_workers,
+    max_queue=get_settings().password_hash_max_queue,
+)
@@ -0,0 +1,240 @@
+"""OpenTelemetry tracing for requests, repositories, SQL and outbound calls.
+
+Spans are created through the OpenTelemetry API everywhere; they are only
+recorded once ``configure_tracing`` has installed an SDK provider, which it
+does when ``tracing_exporter`` is set. Span context lives in contextvars, so
+it follows requests into threadpool endpoints, background tasks and the
+tasks ``asyncio.gather`` creates.
+"""
+
+import importlib.util
+import inspect
+import logging
+import os
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+from opentelemetry import propagate, trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SpanExporter,
+)
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from svc.app.utils.metrics import route_template
+
+if TYPE_CHECKING:
+    # Only for annotations: repositories import this module and must not
+    # require application settings to be loadable
+    from svc.app.config import Settings
+
+logger = logging.getLogger(__name__)
+
+tracer = trace.get_tracer("svc.app")
+
+C = TypeVar("C", bound=type)
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Long statements (bulk inserts) are cut to keep span exports small
+MAX_STATEMENT_LENGTH = 2000
+
+# Newer FastAPI releases open a server span per request (plus spans for
+# dependencies, the endpoint and background tasks) once a provider is set
+FASTAPI_TRACES_REQUESTS = importlib.util.find_spec("fastapi.telemetry") is not None
+
+_provider: Optional[TracerProvider] = None
+
+
+def _build_exporter(settings: "Settings") -> Optional[SpanExporter]:
+    if settings.tracing_exporter == "console":
+        return ConsoleSpanExporter()
+    if settings.tracing_exporter == "file":
+        # One JSON span per line, appended, so concurrent workers can share it
+        return ConsoleSpanExporter(
+            out=open(settings.tracing_file_path, "a"),
+            formatter=lambda span: span.to_json(indent=None) + os.linesep,
+        )
+    if settings.tracing_exporter == "otlp":
+        # Heavy import, only needed when exporting to a collector; the
+        # endpoint comes from OTEL_EXPORTER_OTLP_ENDPOINT
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        return OTLPSpanExporter()
+    return None
+
+
+def configure_tracing(settings: "Settings") -> None:
+    """Install a span exporter and SQL statement spans, if tracing is enabled."""
+    global _provider
+    if _provider is not None:
+        return
+
+    exporter = _build_exporter(settings)
+    if exporter is None:
+        return
+
+    _provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.tracing_service_name})
+    )
+    _provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(_provider)
+    install_statement_spans()
+    logger.info(f"Tracing enabled, exporting to {settings.tracing_exporter}")
+
+
+def shutdown_tracing() -> None:
+    """Flush spans that are still buffered."""
+    if _provider is not None:
+        _provider.shutdown()
+
+
+# ---------------------------
+# Functions and repository methods
+# ---------------------------
+def traced(name: str) -> Callable[[F], F]:
+    """Run a function, or a coroutine function, in a span called name."""
+
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _provider is None:
+                    return await func(*args, **kwargs)
+                with tracer.start_as_current_span(name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _provider is None:
+                return func(*args, **kwargs)
+            with tracer.start_as_current_span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _traced_method(method: Callable[..., Any]) -> Callable[..., Any]:
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # Even a non-recording span costs microseconds; repositories are hot
+        if _provider is None:
+            return method(self, *args, **kwargs)
+        with tracer.start_as_current_span(f"{type(self).__name__}.{name}"):
+            return method(self, *args, **kwargs)
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def trace_methods(cls: C) -> C:
+    """Wrap every public method defined on cls in a span named after it."""
+    for name, member in list(vars(cls).items()):
+        if (
+            name.startswith("_")
+            or not inspect.isfunction(member)
+            or getattr(member, "__traced__", False)
+        ):
+            continue
+        setattr(cls, name, _traced_method(member))
+    return cls
+
+
+# ---------------------------
+# SQL statements
+# ---------------------------
+def _start_statement_span(conn, cursor, statement, parameters, context, executemany):
+    if context is None:
+        return
+
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement else "SQL"
+    context.trace_span = tracer.start_span(
+        operation,
+        kind=SpanKind.CLIENT,
+        attributes={
+            "db.system": "postgresql",
+            "db.statement": statement[:MAX_STATEMENT_LENGTH],
+            "db.executemany": executemany,
+        },
+    )
+
+
+def _end_statement_span(conn, cursor, statement, parameters, context, executemany):
+    span = getattr(context, "trace_span", None)
+    if span is not None:
+        span.end()
+
+
+def _fail_statement_span(exception_context) -> None:
+    span = getattr(exception_context.execution_context, "trace_span", None)
+    if span is not None:
+        span.record_exception(exception_context.original_exception)
+        span.set_status(Status(StatusCode.ERROR))
+        span.end()
+
+
+def install_statement_spans() -> None:
+    """Open a span around every statement run by any engine."""
+    if not event.contains(Engine, "before_cursor_execute", _start_statement_span):
+        event.listen(Engine, "before_cursor_execute", _start_statement_span)
+        event.listen(Engine, "after_cursor_execute", _end_statement_span)
+        event.listen(Engine, "handle_error", _fail_statement_span)
+
+
+# ---------------------------
+# HTTP
+# ---------------------------
+class TracingMiddleware:
+    """Run each HTTP request in a server span, continuing an incoming trace.
+
+    Only needed on FastAPI versions without built-in request spans.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        carrier = {
+            key.decode("latin-1"): value.decode("latin-1")
+            for key, value in scope["headers"]
+        }
+        method = scope["method"]
+        with tracer.start_as_current_span(
+            method, context=propagate.extract(carrier), kind=SpanKind.SERVER
+        ) as span:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                # The route is only known once the router has matched it
+                route = route_template(scope)
+                span.update_name(f"{method} {route}")
+                span.set_attribute("http.request.method", method)
+                span.set_attribute("http.route", route)
+                span.set_attribute("http.response.status_code", status_code)
+                if status_code >= 500:
+                    span.set_status(Status(StatusCode.ERROR))
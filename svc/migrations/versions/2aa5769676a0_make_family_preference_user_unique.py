@@ -0,0 +1,66 @@
+"""make family preference user unique
+
+Revision ID: 2aa5769676a0
+Revises: 3814cf835ed1
+Create Date: 2026-10-19 11:02:17.118095
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2aa5769676a0"
+down_revision: Union[str, None] = "3814cf835ed1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the most recently saved row per user before enforcing uniqueness
+    op.execute(
+        """
+        DELETE FROM family_preferences fp
+        USING family_preferences newer
+        WHERE newer.user_id = fp.user_id
+          AND (newer.updated_at, newer.id) > (fp.updated_at, fp.id)
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_family_preferences_user_id_unique",
+            "family_preferences",
+            ["user_id"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_family_preferences_user_id",
+            table_name="family_preferences",
+            postgresql_concurrently=True,
+        )
+    op.execute(
+        "ALTER INDEX ix_family_preferences_user_id_unique "
+        "RENAME TO ix_family_preferences_user_id"
+    )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_family_preferences_user_id_plain",
+            "family_preferences",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_family_preferences_user_id",
+            table_name="family_preferences",
+            postgresql_concurrently=True,
+        )
+    op.execute(
+        "ALTER INDEX ix_family_preferences_user_id_plain "
+        "RENAME TO ix_family_preferences_user_id"
+    )
@@ -0,0 +1,63 @@
+"""add composite week indexes
+
+Revision ID: 3814cf835ed1
+Revises: 7cb6793be46b
+Create Date: 2026-10-19 10:04:52.730118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3814cf835ed1"
+down_revision: Union[str, None] = "7cb6793be46b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_week_activities_user_year_week",
+            "week_activities",
+            ["user_id", "year", "week"],
+            unique=False,
+            postgresql_include=["activity_id", "completed", "rating"],
+            postgresql_concurrently=True,
+        )
+        # The composite index leads with user_id, so the single-column one is redundant
+        op.drop_index(
+            "ix_week_activities_user_id",
+            table_name="week_activities",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_activity_suggestions_user_week",
+            "activity_suggestions",
+            ["user_id", "target_week_start", "activity_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_activity_suggestions_user_week",
+            table_name="activity_suggestions",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_week_activities_user_id",
+            "week_activities",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_week_activities_user_year_week",
+            table_name="week_activities",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,196 @@
+"""share generic activities as a catalog
+
+Revision ID: 723afc98afd7
+Revises: 2aa5769676a0
+Create Date: 2026-10-19 04:31:20.233260
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "723afc98afd7"
+down_revision: Union[str, None] = "2aa5769676a0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Titles of the generic activities that used to be copied to every new user
+GENERIC_TITLES = [
+    "Park outing",
+    "Family board game night",
+    "Nature walk",
+    "Home art & crafts",
+    "Family cooking",
+    "Story time",
+    "Puzzle challenge",
+    "Backyard sports",
+    "Visit a local library",
+    "Nature scavenger hunt",
+    "Dance party",
+    "Garden planting",
+    "Volunteer together",
+    "Stargazing night",
+]
+
+CONTENT_COLUMNS = [
+    "title",
+    "description",
+    "price",
+    "price_verified",
+    "location",
+    "location_verified",
+    "latitude",
+    "longitude",
+    "primary_type",
+    "primary_theme",
+    "website",
+    "llm_generated",
+    "equipment",
+    "instructions",
+    "adhd_tips",
+    "costs",
+    "durations",
+    "participants",
+    "locations",
+    "seasons",
+    "age_groups",
+    "frequency",
+    "themes",
+    "activity_types",
+    "activity_scale",
+]
+COLUMN_LIST = ", ".join(CONTENT_COLUMNS)
+CATALOG_COLUMN_LIST = ", ".join(f"c.{column}" for column in CONTENT_COLUMNS)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "activities",
+        sa.Column(
+            "catalog_activity_id",
+            sa.Integer(),
+            sa.ForeignKey("activities.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "activities",
+        sa.Column("hidden", sa.Boolean(), server_default=sa.false(), nullable=False),
+    )
+    op.alter_column("activities", "user_id", nullable=True)
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_activities_user_catalog_activity",
+            "activities",
+            ["user_id", "catalog_activity_id"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "uq_activities_catalog_title",
+            "activities",
+            ["title"],
+            unique=True,
+            postgresql_where=sa.text("user_id IS NULL"),
+            postgresql_concurrently=True,
+        )
+
+    # Promote the oldest per-user copy of each generic activity to the
+    # catalog; the application refreshes catalog content on startup
+    op.execute(
+        sa.text(
+            f"""
+            INSERT INTO activities ({COLUMN_LIST}, done)
+            SELECT DISTINCT ON (title) {COLUMN_LIST}, false
+            FROM activities
+            WHERE user_id IS NOT NULL
+              AND llm_generated IS NOT TRUE
+              AND title = ANY(:titles)
+            ORDER BY title, id
+            """
+        ).bindparams(titles=GENERIC_TITLES)
+    )
+
+    # Each user's first copy of a generic activity becomes their overlay of it
+    op.execute(
+        """
+        UPDATE activities a
+        SET catalog_activity_id = c.id
+        FROM activities c
+        WHERE c.user_id IS NULL
+          AND c.title = a.title
+          AND a.id = (
+              SELECT min(d.id)
+              FROM activities d
+              WHERE d.user_id = a.user_id
+                AND d.title = a.title
+                AND d.llm_generated IS NOT TRUE
+          )
+        """
+    )
+
+    # Overlays nobody touched are plain copies; the catalog row replaces them
+    op.execute(
+        """
+        DELETE FROM activities a
+        WHERE a.catalog_activity_id IS NOT NULL
+          AND a.done IS FALSE
+          AND a.assigned_to_kid_id IS NULL
+          AND a.updated_at = a.created_at
+          AND NOT EXISTS (
+              SELECT 1 FROM week_activities w WHERE w.activity_id = a.id
+          )
+          AND NOT EXISTS (
+              SELECT 1 FROM activity_suggestions s WHERE s.activity_id = a.id
+          )
+        """
+    )
+
+
+def downgrade() -> None:
+    # Give every user back a copy of each catalog activity they had not
+    # overlaid, then point their references at those copies
+    op.execute(
+        f"""
+        INSERT INTO activities (user_id, catalog_activity_id, done, {COLUMN_LIST})
+        SELECT u.id, c.id, false, {CATALOG_COLUMN_LIST}
+        FROM users u
+        CROSS JOIN activities c
+        WHERE c.user_id IS NULL
+          AND NOT EXISTS (
+              SELECT 1 FROM activities o
+              WHERE o.user_id = u.id AND o.catalog_activity_id = c.id
+          )
+        """
+    )
+    for table in ("week_activities", "activity_suggestions"):
+        op.execute(
+            f"""
+            UPDATE {table} t
+            SET activity_id = a.id
+            FROM activities a
+            WHERE a.catalog_activity_id = t.activity_id
+              AND a.user_id = t.user_id
+            """
+        )
+    op.execute("DELETE FROM activities WHERE hidden OR user_id IS NULL")
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_activities_catalog_title",
+            table_name="activities",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "uq_activities_user_catalog_activity",
+            table_name="activities",
+            postgresql_concurrently=True,
+        )
+
+    op.alter_column("activities", "user_id", nullable=False)
+    op.drop_column("activities", "hidden")
+    op.drop_column("activities", "catalog_activity_id")
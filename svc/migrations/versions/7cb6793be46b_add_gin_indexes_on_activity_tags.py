@@ -0,0 +1,52 @@
+"""add gin indexes on activity tags
+
+Revision ID: 7cb6793be46b
+Revises: 3c19bdfcfc97
+Create Date: 2026-10-19 09:12:31.418207
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7cb6793be46b"
+down_revision: Union[str, None] = "3c19bdfcfc97"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ARRAY_COLUMNS = (
+    "costs",
+    "durations",
+    "participants",
+    "locations",
+    "seasons",
+    "age_groups",
+    "themes",
+    "activity_types",
+)
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for column in ARRAY_COLUMNS:
+            op.create_index(
+                f"ix_activities_{column}_gin",
+                "activities",
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in ARRAY_COLUMNS:
+            op.drop_index(
+                f"ix_activities_{column}_gin",
+                table_name="activities",
+                postgresql_concurrently=True,
+            )